@@ -1,25 +1,135 @@
 # Question 1 Code
 
+import heapq
+import tempfile
+from array import array
+
+from aoc import optional, reader
+
+# Inputs at least this many characters are parsed into NumPy arrays when NumPy is installed
+NUMPY_MIN = 1 << 20
+
+# Numbers per column sorted in memory before spilling a run to disk in external mode
+RUN_LENGTH = 1 << 20
+
+# Numbers read back from (or written to) a spilled run at a time
+BLOCK = 1 << 13
+
+# Spilled runs per column kept open; reaching it merges them into one longer run
+FAN_IN = 64
 
-# # Read the input file
-with open("e:/Advent of Code/Day-01/input.txt") as f:
-    lines = f.read().strip().split("\n")
 
 # Parse the input into two separate lists
-left = []
-right = []
+def parse(text):
+    np = optional.numpy()
+    if np is not None and len(text) >= NUMPY_MIN:
+        # Every number in one pass, then split the two columns apart
+        pairs = np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 2)
+        return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+    left = []
+    right = []
 
-for line in lines:
-    l, r = map(int, line.split())  # Split each line into two numbers
-    left.append(l)                # Add to left list
-    right.append(r)               # Add to right list
+    for l, r in reader.int_lines(text):  # The two numbers on each line
+        left.append(l)                # Add to left list
+        right.append(r)               # Add to right list
+
+    return left, right
 
-# Sort both lists
-left.sort()
-right.sort()
 
 # Calculate the total distance
-total_distance = sum(abs(l - r) for l, r in zip(left, right))
+def solve(parsed):
+    left, right = parsed
+    if hasattr(left, "dtype"):  # NumPy columns from parse
+        left.sort()
+        right.sort()
+        return int(abs(left - right).sum())
+
+    # Sort both lists
+    left = sorted(left)
+    right = sorted(right)
+
+    return sum(abs(l - r) for l, r in zip(left, right))
+
+
+# Sort one run and write it to an anonymous temporary file as 64-bit ints
+def spill(values):
+    values.sort()
+    f = tempfile.TemporaryFile()
+    array("q", values).tofile(f)
+    f.seek(0)
+    return f
+
+
+# Read a spilled run back a block at a time
+def read_run(f):
+    while True:
+        block = array("q")
+        try:
+            block.fromfile(f, BLOCK)
+        except EOFError:  # The last, short block is still read in
+            yield from block
+            return
+        yield from block
+
+
+# Spill a sorted run for one column, merging the column's runs into a single
+# file once FAN_IN of them are open
+def add_run(runs, values):
+    runs.append(spill(values))
+    if len(runs) < FAN_IN:
+        return
+
+    merged = tempfile.TemporaryFile()
+    block = array("q")
+    for value in heapq.merge(*map(read_run, runs)):
+        block.append(value)
+        if len(block) == BLOCK:
+            block.tofile(merged)
+            del block[:]
+    block.tofile(merged)
+    merged.seek(0)
+    for f in runs:
+        f.close()
+    runs[:] = [merged]
+
+
+# Total distance for inputs larger than memory: sort runs of RUN_LENGTH lines,
+# spill them to temporary files, then merge each column's runs and walk the
+# two merged columns in lockstep
+def solve_external(source, run_length=RUN_LENGTH):
+    left_runs, right_runs = [], []
+    left, right = [], []
+    try:
+        for l, r in reader.int_lines(source):
+            left.append(l)
+            right.append(r)
+            if len(left) == run_length:
+                add_run(left_runs, left)
+                add_run(right_runs, right)
+                left, right = [], []
+
+        # The last run never needs to leave memory
+        merged_left = heapq.merge(sorted(left), *map(read_run, left_runs))
+        merged_right = heapq.merge(sorted(right), *map(read_run, right_runs))
+        return sum(abs(l - r) for l, r in zip(merged_left, merged_right))
+    finally:
+        for f in left_runs + right_runs:
+            f.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--external"]:
+        # Sort a file too big for memory on disk: solution1.py --external PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            total_distance = solve_external(buf)
+    else:
+        # Read the input file
+        total_distance = solve(parse(read_input(__file__)))
 
-# Print the result
-print("Total distance:", total_distance)
+    # Print the result
+    print("Total distance:", total_distance)
@@ -1,24 +1,67 @@
 # Question 2 Code
 
-# Read the input file
-with open("e:/Advent of Code/Day-01/input.txt") as f:
-    lines = f.read().strip().split("\n")
+from collections import Counter
+
+from aoc import optional, reader
+
+# Lists at least this long take the NumPy path when NumPy is installed
+NUMPY_MIN = 1 << 16
 
 # Parse the input into two separate lists
-left = []
-right = []
+def parse(text):
+    left = []
+    right = []
+
+    for l, r in reader.int_lines(text):  # The two numbers on each line
+        left.append(l)                # Add to left list
+        right.append(r)               # Add to right list
+
+    return left, right
 
-for line in lines:
-    l, r = map(int, line.split())  # Split each line into two numbers
-    left.append(l)                # Add to left list
-    right.append(r)               # Add to right list
 
 # Calculate the similarity score
-similarity_score = 0
+def solve(parsed):
+    left, right = parsed
+    if len(left) >= NUMPY_MIN and optional.numpy() is not None:
+        return similarity_numpy(left, right)
+
+    counts = Counter(right)  # How often each number appears in the right list
+    return sum(num * counts[num] for num in left)
+
+
+# Same score with NumPy: look each left number up in the sorted distinct right numbers
+def similarity_numpy(left, right):
+    np = optional.numpy()
+    left = np.asarray(left, dtype=np.int64)
+    values, counts = np.unique(np.asarray(right, dtype=np.int64), return_counts=True)
+    if not len(values):
+        return 0
+
+    at = np.minimum(np.searchsorted(values, left), len(values) - 1)
+    found = values[at] == left
+    return int((left[found] * counts[at[found]]).sum())
+
+
+# Same score in two passes over the raw input (text or a mapped file): the first
+# counts the right column, the second streams the left one against the counts,
+# so memory grows with the distinct right numbers rather than the line count
+def solve_streaming(source):
+    counts = Counter(r for _, r in reader.int_lines(source))
+    return sum(l * counts[l] for l, _ in reader.int_lines(source))
+
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
 
-for num in left:
-    count_in_right = right.count(num)  # Count occurrences in the right list
-    similarity_score += num * count_in_right  # Increment similarity score
+    if sys.argv[1:2] == ["--stream"]:
+        # Stream a file too big to hold as lists: solution2.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            similarity_score = solve_streaming(buf)
+    else:
+        # Read the input file
+        similarity_score = solve(parse(read_input(__file__)))
 
-# Print the result
-print("Similarity Score:", similarity_score)
+    # Print the result
+    print("Similarity Score:", similarity_score)
@@ -1,5 +1,13 @@
 # Question 1 Code
 
+from aoc import optional, reader
+
+# Inputs at least this many characters are checked in NumPy batches when NumPy is installed
+NUMPY_MIN = 1 << 16
+
+# Characters of input packed into one NumPy batch
+CHUNK = 1 << 20
+
 
 # Function to check if a report is safe
 def is_safe_report(report):
@@ -15,15 +23,72 @@ def is_safe_report(report):
     # A report is safe if it is either increasing or decreasing and the differences are valid
     return (is_increasing or is_decreasing) and are_differences_valid
 
-# Read the input file
-with open("e:/Advent of Code/Day-02/input1.txt", "r") as file:
-    lines = file.read().strip().split("\n")
+# Pack the reports into NumPy batches of about CHUNK characters each. A batch is
+# a zero-padded 2-D array with one row per non-blank line, plus each row's length
+# (the count of numbers starting on that line), so nothing is parsed in Python
+def packed(text):
+    np = optional.numpy()
+    start = 0
+    while start < len(text):
+        stop = text.find("\n", start + CHUNK)
+        stop = len(text) if stop == -1 else stop + 1
+        chunk = text[start:stop]
+        start = stop
+
+        raw = np.frombuffer(chunk.encode(), dtype=np.uint8)
+        digit = (raw >= ord("0")) & (raw <= ord("9"))
+        first_digit = digit & ~np.concatenate(([False], digit[:-1]))
+        line = np.cumsum(raw == ord("\n"))  # Line number of every character
+        counts = np.bincount(line[first_digit])
+        lengths = counts[counts > 0]
+
+        width = max(int(lengths.max(initial=0)), 2)  # At least one step column
+        levels = np.zeros((len(lengths), width), dtype=np.int64)
+        levels[np.arange(width) < lengths[:, None]] = np.fromstring(chunk, dtype=np.int64, sep=" ")
+        yield levels, lengths
 
-# Convert each line to a list of integers
-reports = [list(map(int, line.split())) for line in lines]
+# Which steps suit an increasing (sign 1) or decreasing (sign -1) report; padding passes
+def steps_ok(levels, lengths, sign):
+    np = optional.numpy()
+    steps = np.diff(levels, axis=1) * sign
+    real = np.arange(steps.shape[1]) < (lengths - 1)[:, None]
+    return ((steps >= 1) & (steps <= 3)) | ~real
+
+# Count the safe reports in one batch
+def count_safe_numpy(levels, lengths):
+    safe = steps_ok(levels, lengths, 1).all(axis=1) | steps_ok(levels, lengths, -1).all(axis=1)
+    return int(safe.sum())
+
+# Convert each line to a list of integers. Long inputs come out as NumPy
+# batches from packed() instead
+def parse(text):
+    if len(text) >= NUMPY_MIN and optional.numpy() is not None:
+        return list(packed(text))
+    return list(reader.int_lines(text))
 
 # Check each report and count the safe ones
-safe_count = sum(is_safe_report(report) for report in reports)
+def solve(reports):
+    safe_count = 0
+    for report in reports:
+        if isinstance(report, tuple):  # A whole NumPy batch
+            safe_count += count_safe_numpy(*report)
+        elif is_safe_report(report):
+            safe_count += 1
+    return safe_count
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # solve takes any iterable of reports, so feed it one line at a time
+        # from a memory-mapped file of any size: solution1.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            safe_count = solve(reader.int_lines(buf))
+    else:
+        # Read the input file
+        safe_count = solve(parse(read_input(__file__)))
 
-# Print the result
-print(f"Number of safe reports: {safe_count}")
+    # Print the result
+    print(f"Number of safe reports: {safe_count}")
@@ -1,40 +1,124 @@
-# Function to check if a report is safe
-def is_safe_report(report):
-    differences = [report[i + 1] - report[i] for i in range(len(report) - 1)]
-    
-    # Check if differences are all positive (increasing) or all negative (decreasing)
-    is_increasing = all(d > 0 for d in differences)
-    is_decreasing = all(d < 0 for d in differences)
-    
-    # Check if all differences are between 1 and 3 (inclusive)
-    are_differences_valid = all(1 <= abs(d) <= 3 for d in differences)
-    
-    # A report is safe if it is either increasing or decreasing and the differences are valid
-    return (is_increasing or is_decreasing) and are_differences_valid
-
-# Function to check if removing one level makes the report safe
-def can_be_safe_with_removal(report):
+from aoc import optional, reader
+
+# Inputs at least this many characters are checked in NumPy batches when NumPy is installed
+NUMPY_MIN = 1 << 16
+
+# Characters of input packed into one NumPy batch
+CHUNK = 1 << 20
+
+# Index of a level whose removal leaves the report safe, or None if no single
+# removal does. A report that is already safe stays safe without its first
+# level, so it gives 0.
+#
+# For each direction, find the first and last unsafe step (a step is the pair
+# report[i], report[i + 1]). Removing level i drops steps i - 1 and i and
+# bridges report[i - 1] to report[i + 1], so it can only help if every unsafe
+# step is one of those two; that leaves i = first or first + 1 to try.
+def removal_index(report):
     n = len(report)
-    for i in range(n):
-        # Create a new report by removing the i-th level
-        modified_report = report[:i] + report[i+1:]
-        # Check if the modified report is safe
-        if is_safe_report(modified_report):
-            return True
-    return False
+    for sign in (1, -1):  # Increasing, then decreasing
+        first = last = None
+        for i in range(n - 1):
+            if not 1 <= (report[i + 1] - report[i]) * sign <= 3:
+                if first is None:
+                    first = i
+                last = i
+        if first is None:
+            return 0
+
+        for i in (first, first + 1):
+            if last > i:
+                continue
+            if i == 0 or i == n - 1 or 1 <= (report[i + 1] - report[i - 1]) * sign <= 3:
+                return i
+    return None
+
+# Function to check if the report is safe, removing at most one level
+def can_be_safe_with_removal(report):
+    return removal_index(report) is not None
+
+# Pack the reports into NumPy batches of about CHUNK characters each. A batch is
+# a zero-padded 2-D array with one row per non-blank line, plus each row's length
+# (the count of numbers starting on that line), so nothing is parsed in Python
+def packed(text):
+    np = optional.numpy()
+    start = 0
+    while start < len(text):
+        stop = text.find("\n", start + CHUNK)
+        stop = len(text) if stop == -1 else stop + 1
+        chunk = text[start:stop]
+        start = stop
 
-# Read the input file
-with open("e:/Advent of Code/Day-02/input2.txt", "r") as file:
-    lines = file.read().strip().split("\n")
+        raw = np.frombuffer(chunk.encode(), dtype=np.uint8)
+        digit = (raw >= ord("0")) & (raw <= ord("9"))
+        first_digit = digit & ~np.concatenate(([False], digit[:-1]))
+        line = np.cumsum(raw == ord("\n"))  # Line number of every character
+        counts = np.bincount(line[first_digit])
+        lengths = counts[counts > 0]
 
-# Convert each line to a list of integers
-reports = [list(map(int, line.split())) for line in lines]
+        width = max(int(lengths.max(initial=0)), 2)  # At least one step column
+        levels = np.zeros((len(lengths), width), dtype=np.int64)
+        levels[np.arange(width) < lengths[:, None]] = np.fromstring(chunk, dtype=np.int64, sep=" ")
+        yield levels, lengths
+
+# Which steps suit an increasing (sign 1) or decreasing (sign -1) report; padding passes
+def steps_ok(levels, lengths, sign):
+    np = optional.numpy()
+    steps = np.diff(levels, axis=1) * sign
+    real = np.arange(steps.shape[1]) < (lengths - 1)[:, None]
+    return ((steps >= 1) & (steps <= 3)) | ~real
+
+# removal_index for a whole batch and one direction: True where the report is
+# safe as is or after dropping the level at the first unsafe step or the next one
+def dampened(levels, lengths, sign):
+    np = optional.numpy()
+    rows = np.arange(len(levels))
+    bad = ~steps_ok(levels, lengths, sign)
+    first = bad.argmax(axis=1)
+    last = bad.shape[1] - 1 - bad[:, ::-1].argmax(axis=1)
+    fixed = ~bad.any(axis=1)
+    for drop in (first, first + 1):
+        before = levels[rows, np.maximum(drop - 1, 0)]
+        after = levels[rows, np.minimum(drop + 1, levels.shape[1] - 1)]
+        bridge = (after - before) * sign
+        ends = (drop == 0) | (drop == lengths - 1)
+        fixed |= (last <= drop) & (ends | ((bridge >= 1) & (bridge <= 3)))
+    return fixed
+
+# Count the reports in one batch that are safe with at most one level removed
+def count_dampened_numpy(levels, lengths):
+    return int((dampened(levels, lengths, 1) | dampened(levels, lengths, -1)).sum())
+
+# Convert each line to a list of integers. Long inputs come out as NumPy
+# batches from packed() instead
+def parse(text):
+    if len(text) >= NUMPY_MIN and optional.numpy() is not None:
+        return list(packed(text))
+    return list(reader.int_lines(text))
 
 # Check each report and count the safe ones, including those made safe by the Problem Dampener
-safe_count = 0
-for report in reports:
-    if is_safe_report(report) or can_be_safe_with_removal(report):
-        safe_count += 1
+def solve(reports):
+    safe_count = 0
+    for report in reports:
+        if isinstance(report, tuple):  # A whole NumPy batch
+            safe_count += count_dampened_numpy(*report)
+        elif can_be_safe_with_removal(report):
+            safe_count += 1
+    return safe_count
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # solve takes any iterable of reports, so feed it one line at a time
+        # from a memory-mapped file of any size: solution2.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            safe_count = solve(reader.int_lines(buf))
+    else:
+        # Read the input file
+        safe_count = solve(parse(read_input(__file__)))
 
-# Print the result
-print(f"Number of safe reports with Problem Dampener: {safe_count}")
+    # Print the result
+    print(f"Number of safe reports with Problem Dampener: {safe_count}")
@@ -1,28 +1,34 @@
 import re
 
-def sum_valid_multiplications(file_path):
-    # Read the input file
-    with open(file_path, "r") as f:
-        data = f.read()
-    
-    # Regex to match valid mul instructions (e.g., mul(123,456))
-    valid_mul_pattern = r"mul\(\d{1,3},\d{1,3}\)"
-    
-    # Find all matches in the input
-    matches = re.findall(valid_mul_pattern, data)
-    
-    total_sum = 0
-    for match in matches:
-        # Extract numbers from the valid mul instruction
-        numbers = list(map(int, re.findall(r"\d+", match)))
-        # Multiply and add to total sum
-        total_sum += numbers[0] * numbers[1]
-    
-    return total_sum
-
-# File path to the input file
-file_path = "e:/Advent of Code/Day-03/input1.txt"
-
-# Call the function and print the result
-result = sum_valid_multiplications(file_path)
-print("Total sum of valid multiplications:", result)
+from aoc import reader
+
+# Valid mul instructions (e.g., mul(123,456)), capturing both numbers
+MUL = r"mul\((\d{1,3}),(\d{1,3})\)"
+MUL_PATTERN = re.compile(MUL)
+MUL_BYTES = re.compile(MUL.encode())
+
+def sum_valid_multiplications(data):
+    # One pass over the text, or over a memory-mapped file without decoding it
+    pattern = MUL_PATTERN if isinstance(data, str) else MUL_BYTES
+    return sum(int(m[1]) * int(m[2]) for m in pattern.finditer(data))
+
+def parse(text):
+    return text
+
+def solve(data):
+    return sum_valid_multiplications(data)
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # Scan a memory-mapped dump of any size: solution1.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            result = sum_valid_multiplications(buf)
+    else:
+        # Read the input file
+        result = solve(parse(read_input(__file__)))
+
+    print("Total sum of valid multiplications:", result)
@@ -1,40 +1,137 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
 
-def sum_enabled_multiplications(file_path):
-    # Read the input file
-    with open(file_path, "r") as f:
-        data = f.read()
-    
-    # Regex to match valid mul instructions and control instructions
-    valid_mul_pattern = r"mul\(\d{1,3},\d{1,3}\)"
-    do_pattern = r"do\(\)"
-    dont_pattern = r"don't\(\)"
-    
-    # Split the input into tokens based on instructions
-    tokens = re.split(r"(do\(\)|don't\(\)|mul\(\d{1,3},\d{1,3}\))", data)
-    
-    # Initialize variables
-    mul_enabled = True  # Multiplications are enabled at the start
-    total_sum = 0
-
-    for token in tokens:
-        token = token.strip()
-        if token == "do()":
+from aoc import reader
+
+# Every instruction in one pattern; the outer named group says which one matched
+INSTRUCTION = r"(?P<mul>mul\((?P<x>\d{1,3}),(?P<y>\d{1,3})\))|(?P<do>do\(\))|(?P<dont>don't\(\))"
+PATTERN = re.compile(INSTRUCTION)
+PATTERN_BYTES = re.compile(INSTRUCTION.encode())
+
+# Characters scanned per window
+CHUNK = 1 << 20
+
+# A match starting inside a window ends at most this far past it: mul(123,456) is the longest
+OVERLAP = len("mul(123,456)") - 1
+
+# Ranges handed out per worker when scanning in parallel, so a slow one is not left holding a big share
+PIECES_PER_JOB = 4
+
+# Summary of a range that holds no instructions: adds nothing, changes nothing
+EMPTY = (0, 0, None)
+
+def instructions(data, start=0, stop=None):
+    # Yield the instructions starting in data[start:stop] in order. Each window of
+    # CHUNK characters is searched OVERLAP characters further, so an instruction
+    # straddling the boundary is still found whole, and is skipped by the next window
+    pattern = PATTERN if isinstance(data, str) else PATTERN_BYTES
+    stop = len(data) if stop is None else stop
+    pos = start
+    while pos < stop:
+        end = min(pos + CHUNK, stop)
+        for match in pattern.finditer(data, pos, min(end + OVERLAP, len(data))):
+            if match.start() >= end:
+                break
+            yield match
+            pos = match.end()
+        pos = max(pos, end)
+
+def summarize(data, start=0, stop=None):
+    # Scan the instructions starting in data[start:stop] without knowing whether
+    # mul is enabled on entry. Returns (sum if it starts enabled, sum if it starts
+    # disabled, last do()/don't() state or None if the range has neither)
+    enabled_sum = disabled_sum = 0
+    last = None
+
+    for match in instructions(data, start, stop):
+        kind = match.lastgroup
+        if kind == "do":
             # Enable mul instructions
-            mul_enabled = True
-        elif token == "don't()":
+            last = True
+        elif kind == "dont":
             # Disable mul instructions
-            mul_enabled = False
-        elif re.match(valid_mul_pattern, token) and mul_enabled:
-            # Process valid mul instructions if enabled
-            numbers = list(map(int, re.findall(r"\d+", token)))
-            total_sum += numbers[0] * numbers[1]
-    
-    return total_sum
-
-# File path to the input file
-file_path = "e:/Advent of Code/Day-03/input2.txt"
-
-# Call the function and print the result
-result = sum_enabled_multiplications(file_path)
-print("Total sum of enabled multiplications:", result)
+            last = False
+        elif last is None:
+            # Before any toggle the entry state decides
+            enabled_sum += int(match["x"]) * int(match["y"])
+        elif last:
+            # After a do() both entry states count it
+            product = int(match["x"]) * int(match["y"])
+            enabled_sum += product
+            disabled_sum += product
+
+    return enabled_sum, disabled_sum, last
+
+def compose(first, second):
+    # Summary of two adjacent ranges from the summaries of each
+    first_enabled, first_disabled, first_last = first
+    second_enabled, second_disabled, second_last = second
+
+    def after_first(entry):
+        state = entry if first_last is None else first_last
+        return second_enabled if state else second_disabled
+
+    last = first_last if second_last is None else second_last
+    return first_enabled + after_first(True), first_disabled + after_first(False), last
+
+def split(size, pieces):
+    # Cut 0..size into `pieces` nearly equal (start, stop) ranges
+    bounds = [size * i // pieces for i in range(pieces + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+def summarize_piece(piece, stop):
+    return summarize(piece, 0, stop)
+
+def summarize_file(path, start, stop):
+    with reader.mapped(path) as buf:
+        return summarize(buf, start, stop)
+
+def sum_enabled_multiplications(data, jobs=1):
+    # Multiplications are enabled at the start. With several jobs the data is cut
+    # into ranges that worker processes summarize independently (each piece carries
+    # OVERLAP extra characters for instructions straddling its end); the summaries
+    # are then folded left to right
+    if jobs <= 1:
+        return summarize(data)[0]
+
+    ranges = split(len(data), jobs * PIECES_PER_JOB)
+    pieces = (data[start:stop + OVERLAP] for start, stop in ranges)
+    with ProcessPoolExecutor(jobs) as pool:
+        summaries = pool.map(summarize_piece, pieces, [stop - start for start, stop in ranges])
+        return reduce(compose, summaries, EMPTY)[0]
+
+def sum_enabled_in_file(path, jobs=1):
+    # Same as sum_enabled_multiplications for a file; every worker maps it itself
+    if jobs <= 1:
+        with reader.mapped(path) as buf:
+            return summarize(buf)[0]
+
+    starts, stops = zip(*split(os.path.getsize(path), jobs * PIECES_PER_JOB))
+    with ProcessPoolExecutor(jobs) as pool:
+        summaries = pool.map(summarize_file, repeat(path), starts, stops)
+        return reduce(compose, summaries, EMPTY)[0]
+
+def parse(text):
+    return text
+
+def solve(data):
+    return sum_enabled_multiplications(data)
+
+if __name__ == "__main__":
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # Scan a memory-mapped dump of any size, optionally on several cores:
+        # solution2.py --stream PATH [JOBS]
+        jobs = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+        result = sum_enabled_in_file(sys.argv[2], jobs)
+    else:
+        # Read the input file
+        result = solve(parse(read_input(__file__)))
+
+    print("Total sum of enabled multiplications:", result)
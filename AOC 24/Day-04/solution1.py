@@ -1,52 +1,108 @@
-def count_xmas_in_grid(grid):
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    target = "XMAS"
-    target_len = len(target)
+from aoc import optional
+from aoc.automaton import Automaton
+from aoc.grid import BORDER, Grid
+
+TARGET = b"XMAS"
+
+# Grids with at least this many cells (borders included) are searched with NumPy when it is installed
+NUMPY_MIN = 1 << 20
+
+def count_word(grid, word=TARGET):
+    """Count ``word`` read in each of the eight directions from every cell.
+
+    The grid must be padded by at least ``len(word) - 1``, and at least 1
+    (see :func:`parse`), so every step stays inside the buffer and off-grid
+    steps read a border byte.
+    """
+    word = word.encode() if isinstance(word, str) else bytes(word)
+    if not word:
+        raise ValueError("cannot search for an empty word")
+    if grid.pad < pad_for(word):
+        raise ValueError(f"grid is padded by {grid.pad}; searching {word!r} needs {pad_for(word)}")
+    if len(grid.cells) >= NUMPY_MIN and optional.numpy() is not None:
+        return count_word_numpy(grid, word)
+
+    cells = grid.cells
+    n = len(word)
+    backwards = word[::-1]
+    total_count = 0
+
+    # Compare the whole run of cells from each first letter as one slice; going
+    # up or left, slice from the far end so the slice step stays positive
+    for i in grid.find_all(chr(word[0])):
+        for d in grid.dirs8:
+            if d > 0:
+                total_count += cells[i:i + n * d:d] == word
+            else:
+                total_count += cells[i + (n - 1) * d:i + 1:-d] == backwards
+
+    return total_count
+
+def count_word_numpy(grid, word):
+    """:func:`count_word` as shifted slices of the flat grid, one direction at a time.
+
+    For direction ``d`` the cells holding the k-th letter are the grid shifted
+    by ``k * d``; a word starts wherever all of those comparisons hold.
+    """
+    np = optional.numpy()
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    start, stop = grid.indices().start, grid.indices().stop
     total_count = 0
 
-    # Helper function to count occurrences in a line
-    def count_in_line(line):
-        return sum(line[i:i + target_len] == target for i in range(len(line) - target_len + 1))
-
-    # Count horizontally and reverse horizontally
-    for row in grid:
-        total_count += count_in_line(row)
-        total_count += count_in_line(row[::-1])
-
-    # Count vertically and reverse vertically
-    for col in range(cols):
-        column = ''.join(grid[row][col] for row in range(rows))
-        total_count += count_in_line(column)
-        total_count += count_in_line(column[::-1])
-
-    # Count diagonals (top-left to bottom-right and their reverses)
-    for start in range(-rows + 1, cols):
-        diagonal = ''.join(grid[row][col] for row in range(rows) for col in range(cols) if col - row == start)
-        total_count += count_in_line(diagonal)
-        total_count += count_in_line(diagonal[::-1])
-
-    # Count anti-diagonals (top-right to bottom-left and their reverses)
-    for start in range(rows + cols - 1):
-        anti_diagonal = ''.join(grid[row][col] for row in range(rows) for col in range(cols) if row + col == start)
-        total_count += count_in_line(anti_diagonal)
-        total_count += count_in_line(anti_diagonal[::-1])
+    for d in grid.dirs8:
+        found = cells[start:stop] == word[0]
+        for k in range(1, len(word)):
+            found &= cells[start + k * d:stop + k * d] == word[k]
+        total_count += int(np.count_nonzero(found))
 
     return total_count
 
-# File path to the input file
-file_path = "e:/Advent of Code/Day-04/input1.txt"
+def count_words(grid, words):
+    """Count each of ``words`` in all eight directions, in one pass per line direction.
+
+    Returns ``{word: count}``, counting the same way as :func:`count_word`.
+    The automaton holds every word and its reverse, so each row, column,
+    diagonal and anti-diagonal is streamed through it once and read both ways.
+    """
+    words = list(dict.fromkeys(words))
+    encoded = [w.encode() if isinstance(w, str) else bytes(w) for w in words]
+    if any(BORDER in w for w in encoded):
+        raise ValueError("words must not contain the grid border byte")
+    automaton = Automaton(encoded + [w[::-1] for w in encoded])
+
+    # cells[k::d] for every k covers each line in direction d exactly once; the
+    # border bytes between lines are in no word, so they reset the automaton
+    cells = grid.cells
+    s = grid.stride
+    lines = (cells[k::d] for d in (1, s - 1, s, s + 1) for k in range(d))
+    counts = automaton.count(lines)
+    return {w: counts[k] + counts[k + len(words)] for k, w in enumerate(words)}
+
+def pad_for(word):
+    return max(len(word) - 1, 1)
+
+def count_xmas_in_grid(grid):
+    """Count XMAS in all eight directions."""
+    return count_word(grid, TARGET)
+
+def parse(text, word=TARGET):
+    return Grid.parse(text, pad=pad_for(word))
+
+def solve(grid):
+    return count_xmas_in_grid(grid)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-# Read the grid from the file
-with open(file_path, "r") as file:
-    grid = [line.strip() for line in file.readlines()]
+    # Read the grid from the input file
+    grid = parse(read_input(__file__))
 
-# Debug: Print the grid to confirm it is read correctly
-print("Grid Read from File:")
-print("\n".join(grid))
+    # Debug: Print the grid to confirm it is read correctly
+    print("Grid Read from File:")
+    print(grid)
 
-# Count all occurrences of XMAS
-xmas_count = count_xmas_in_grid(grid)
+    # Count all occurrences of XMAS
+    xmas_count = solve(grid)
 
-# Output the result
-print(f"Total occurrences of 'XMAS': {xmas_count}")
+    # Output the result
+    print(f"Total occurrences of 'XMAS': {xmas_count}")
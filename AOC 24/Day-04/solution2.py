@@ -1,43 +1,106 @@
-def count_x_mas(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-    total_count = 0
+from aoc import optional
+from aoc.grid import Grid
+
+# Grids with at least this many cells (borders included) are matched with NumPy when it is installed
+NUMPY_MIN = 1 << 20
+
+# Stencil cell that matches anything
+WILDCARD = "?"
+
+# The four X-MAS crosses: an A with MAS or SAM along both diagonals
+X_MAS = [
+    ("M?M", "?A?", "S?S"),
+    ("M?S", "?A?", "M?S"),
+    ("S?M", "?A?", "S?M"),
+    ("S?S", "?A?", "M?M"),
+]
+
+def stencil_cells(stencil, wildcard=WILDCARD):
+    """``(row, col, byte)`` for every cell of ``stencil`` that is not ``wildcard``.
+
+    A stencil is a list of strings, one per row; short rows end in wildcards.
+    """
+    return [(dr, dc, ord(ch)) for dr, line in enumerate(stencil)
+            for dc, ch in enumerate(line) if ch != wildcard]
+
+def stencil_mask(grid, stencil, wildcard=WILDCARD):
+    """NumPy boolean array, True at each top-left ``(row, col)`` where ``stencil`` matches.
 
-    # Check if a given position forms an X-MAS
-    def is_x_mas(r, c):
-        # Ensure the position is within bounds
-        if r - 1 < 0 or r + 1 >= rows or c - 1 < 0 or c + 1 >= cols:
-            return False
+    The grid is viewed as a ``uint8`` array without copying, and each fixed
+    stencil cell ANDs in one comparison of a shifted slice of it.
+    """
+    np = optional.numpy()
+    h, w = len(stencil), max(map(len, stencil), default=0)
+    rows, cols = max(grid.height - h + 1, 0), max(grid.width - w + 1, 0)
+    start = grid.offset
+    board = np.frombuffer(grid.cells, dtype=np.uint8)[start:start + grid.height * grid.stride]
+    board = board.reshape(grid.height, grid.stride)[:, :grid.width]
 
-        # Extract characters forming the X
-        tl_br = [grid[r - 1][c - 1], grid[r][c], grid[r + 1][c + 1]]  # Top-left to bottom-right
-        tr_bl = [grid[r - 1][c + 1], grid[r][c], grid[r + 1][c - 1]]  # Top-right to bottom-left
+    mask = np.ones((rows, cols), dtype=bool)
+    for dr, dc, byte in stencil_cells(stencil, wildcard):
+        mask &= board[dr:dr + rows, dc:dc + cols] == byte
+    return mask
 
-        # Check all valid "MAS" configurations
-        valid_mas = {"MAS", "SAM"}
-        return (''.join(tl_br) in valid_mas and ''.join(tr_bl) in valid_mas)
+def find_stencil(grid, stencil, wildcard=WILDCARD):
+    """Top-left ``(row, col)`` of every match of ``stencil``, in reading order."""
+    if optional.numpy() is not None:
+        rows, cols = stencil_mask(grid, stencil, wildcard).nonzero()
+        return list(zip(rows.tolist(), cols.tolist()))
 
-    # Iterate through each cell as a potential center
-    for r in range(rows):
-        for c in range(cols):
-            if is_x_mas(r, c):
-                total_count += 1
+    h, w = len(stencil), max(map(len, stencil), default=0)
+    cells = grid.cells
+    offsets = [(dr * grid.stride + dc, byte) for dr, dc, byte in stencil_cells(stencil, wildcard)]
+    found = []
+    for r in range(grid.height - h + 1):
+        base = grid.index(r, 0)
+        for c in range(grid.width - w + 1):
+            if all(cells[base + c + o] == byte for o, byte in offsets):
+                found.append((r, c))
+    return found
+
+def count_stencil(grid, stencil, wildcard=WILDCARD):
+    """Number of places ``stencil`` matches (see :func:`find_stencil`)."""
+    if optional.numpy() is not None:
+        return int(stencil_mask(grid, stencil, wildcard).sum())
+    return len(find_stencil(grid, stencil, wildcard))
+
+def count_x_mas(grid):
+    if len(grid.cells) >= NUMPY_MIN and optional.numpy() is not None:
+        return sum(count_stencil(grid, stencil) for stencil in X_MAS)
+
+    cells = grid.cells
+    up, down = grid.up, grid.down
+    m, s = ord("M"), ord("S")
+    total_count = 0
+
+    # Every X-MAS is centred on an A; both diagonals through it must read MAS or SAM
+    for i in grid.find_all("A"):
+        tl, br = cells[i + up - 1], cells[i + down + 1]
+        tr, bl = cells[i + up + 1], cells[i + down - 1]
+        if ((tl == m and br == s) or (tl == s and br == m)) and \
+                ((tr == m and bl == s) or (tr == s and bl == m)):
+            total_count += 1
 
     return total_count
 
-# File path to the input file
-file_path = "e:/Advent of Code/Day-04/input2.txt"
+def parse(text):
+    return Grid.parse(text)
+
+def solve(grid):
+    return count_x_mas(grid)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-# Read the grid from the file
-with open(file_path, "r") as file:
-    grid = [line.strip() for line in file.readlines()]
+    # Read the grid from the input file
+    grid = parse(read_input(__file__))
 
-# Debug: Print the grid to confirm it is read correctly
-print("Grid Read from File:")
-print("\n".join(grid))
+    # Debug: Print the grid to confirm it is read correctly
+    print("Grid Read from File:")
+    print(grid)
 
-# Count all occurrences of X-MAS
-x_mas_count = count_x_mas(grid)
+    # Count all occurrences of X-MAS
+    x_mas_count = solve(grid)
 
-# Output the result
-print(f"Total occurrences of 'X-MAS': {x_mas_count}")
+    # Output the result
+    print(f"Total occurrences of 'X-MAS': {x_mas_count}")
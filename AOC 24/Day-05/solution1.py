@@ -1,38 +1,83 @@
 from collections import defaultdict, deque
+from functools import cmp_to_key
 
-# Function to parse the input file
-def parse_input(file_path):
-    with open(file_path, 'r') as file:
-        sections = file.read().strip().split("\n\n")
-        
-        # First section contains the rules
-        rules = [tuple(map(int, line.split('|'))) for line in sections[0].splitlines()]
-        
-        # Second section contains the updates
-        updates = [list(map(int, line.split(','))) for line in sections[1].splitlines()]
-        
-        return rules, updates
+from aoc import reader
+
+NOTHING = frozenset()
+
+# Function to parse the puzzle input
+def parse(text):
+    sections = reader.records(text)
+
+    # First section contains the rules, indexed once for every update
+    rules = index_rules(tuple(map(int, line.split('|'))) for line in next(sections))
+
+    # Second section contains the updates
+    updates = [list(map(int, line.split(','))) for line in next(sections)]
+
+    return rules, updates
+
+# Function to index the rules: the set of (before, after) pairs, and for each
+# page the set of pages that must come after it
+def index_rules(rules):
+    pairs = set(rules)
+    after = defaultdict(set)
+    for before, later in pairs:
+        after[before].add(later)
+    return pairs, after
 
 # Function to check if an update is in the correct order
 def is_correct_order(update, rules):
-    for rule in rules:
-        if rule[0] in update and rule[1] in update:
-            # Ensure that rule[0] appears before rule[1] in the update
-            if update.index(rule[0]) > update.index(rule[1]):
+    """True when every rule relating two pages of the update holds.
+
+    Every page that a rule puts after a page of the update is looked up in a
+    {page: position} map of the update, so an update of L pages costs
+    O(L * d), d being the most followers any one page has in the rules (24
+    in the puzzle input, whose updates run to 23 pages).
+    """
+    _, after = rules
+    position = {page: i for i, page in enumerate(update)}
+    for i, page in enumerate(update):
+        for later in after.get(page, NOTHING):
+            if position.get(later, i) < i:
                 return False
     return True
 
-# Function to fix the order of a single update
-def fix_order(update, rules):
-    # Build a graph of dependencies
+# Function to turn the rules into a sort key: a page goes first if a rule says so,
+# and pages no rule relates compare equal
+def order_key(rules):
+    pairs, _ = rules
+
+    def compare(a, b):
+        if (a, b) in pairs:
+            return -1
+        if (b, a) in pairs:
+            return 1
+        return 0
+
+    return cmp_to_key(compare)
+
+# Function to fix the order of a single update. Sorting with the rules as the
+# comparator is right whenever they order these pages totally (as the puzzle's
+# do); otherwise the sort may break a rule, so fall back to a topological sort
+def fix_order(update, rules, key=None):
+    fixed_update = sorted(update, key=key or order_key(rules))
+    if is_correct_order(fixed_update, rules):
+        return fixed_update
+    return topological_order(update, rules)
+
+# Function to order a single update with Kahn's algorithm
+def topological_order(update, rules):
+    _, after = rules
+    pages = set(update)
+
+    # Build a graph of dependencies between the pages of this update
     graph = defaultdict(list)
-    in_degree = defaultdict(int)
-    for rule in rules:
-        if rule[0] in update and rule[1] in update:
-            graph[rule[0]].append(rule[1])
-            in_degree[rule[1]] += 1
-            if rule[0] not in in_degree:
-                in_degree[rule[0]] = 0
+    in_degree = {page: 0 for page in update}
+    for page in update:
+        for neighbor in after.get(page, NOTHING) & pages:
+            graph[page].append(neighbor)
+            in_degree[neighbor] += 1
 
     # Perform a topological sort
     queue = deque([node for node in update if in_degree[node] == 0])
@@ -44,28 +89,36 @@ def fix_order(update, rules):
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
-    
+
     # Return the sorted update based on the topological order
     return sorted_update
 
 # Function to process incorrectly ordered updates and compute the sum of their middle pages
-def sum_of_fixed_middle_pages(file_path):
-    rules, updates = parse_input(file_path)
-    
+def sum_of_fixed_middle_pages(rules, updates):
+    key = order_key(rules)
+    fixed = {}  # Fixed order per set of pages, so a repeated set is only sorted once
+
     middle_pages_sum = 0
     for update in updates:
         if not is_correct_order(update, rules):
             # Fix the order of the update
-            fixed_update = fix_order(update, rules)
+            pages = frozenset(update)
+            fixed_update = fixed.get(pages)
+            if fixed_update is None:
+                fixed_update = fixed[pages] = fix_order(update, rules, key)
             # Find the middle page number
             middle_page = fixed_update[len(fixed_update) // 2]
             middle_pages_sum += middle_page
 
     return middle_pages_sum
 
-# File path to the input file
-file_path = "e:/Advent of Code/Day-05/input2.txt"
+def solve(parsed):
+    rules, updates = parsed
+    return sum_of_fixed_middle_pages(rules, updates)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-# Calculate the result
-result = sum_of_fixed_middle_pages(file_path)
-print(f"The sum of the middle page numbers after fixing is: {result}")
+    # Calculate the result
+    result = solve(parse(read_input(__file__)))
+    print(f"The sum of the middle page numbers after fixing is: {result}")
@@ -1,53 +1,58 @@
-def read_map(file_path):
-    with open(file_path, 'r') as file:
-        return [list(line.strip()) for line in file]
+from aoc.grid import BORDER, Grid
+
+def parse(text):
+    return Grid.parse(text)
 
 def guard_patrol(grid):
-    directions = {'^': (-1, 0), '>': (0, 1), 'v': (1, 0), '<': (0, -1)}
-    direction_order = ['^', '>', 'v', '<']
+    """Bytearray over the grid's cells: 1 where the guard walks, 0 elsewhere.
 
-    # Find the guard's starting position and facing direction
-    for r, row in enumerate(grid):
-        for c, cell in enumerate(row):
-            if cell in directions:
-                guard_pos = (r, c)
-                guard_dir = cell
-                break
+    Each straight run to the next wall is one search of the row or column
+    ahead plus one slice assignment, so the patrol costs one step per turn.
+    """
+    direction_order = '^>v<'  # same order as grid.dirs: up, right, down, left
+    cells = grid.cells
 
-    visited = set()
-    rows, cols = len(grid), len(grid[0])
+    # Find the guard's starting position and facing direction
+    for guard_dir, ch in enumerate(direction_order):
+        guard_pos = grid.find(ch)
+        if guard_pos != -1:
+            break
 
-    while 0 <= guard_pos[0] < rows and 0 <= guard_pos[1] < cols:
-        visited.add(guard_pos)
+    visited = bytearray(len(cells))
 
-        dr, dc = directions[guard_dir]
-        next_pos = (guard_pos[0] + dr, guard_pos[1] + dc)
+    while True:
+        step = grid.dirs[guard_dir]
+        stop = grid.stop(guard_pos, guard_dir, '#')
 
-        if 0 <= next_pos[0] < rows and 0 <= next_pos[1] < cols and grid[next_pos[0]][next_pos[1]] == '#':
-            # Turn right 90 degrees
-            guard_dir = direction_order[(direction_order.index(guard_dir) + 1) % 4]
-        else:
-            # Move forward
-            guard_pos = next_pos
+        # Walk straight to the stop: up to a wall, or off the grid onto the border
+        leaving = cells[stop] == BORDER
+        run = range(guard_pos, stop if leaving else stop + step, step)
+        visited[run.start:run.stop:step] = b'\x01' * len(run)
+        if leaving:
+            return visited
 
-    return visited
+        # Turn right 90 degrees
+        guard_pos, guard_dir = stop, (guard_dir + 1) % 4
 
 def mark_visited(grid, visited):
-    for r, c in visited:
-        if grid[r][c] == '.':
-            grid[r][c] = 'X'
+    for i, seen in enumerate(visited):
+        if seen and grid[i] == ord('.'):
+            grid[i] = 'X'
 
-def main(file_path):
-    grid = read_map(file_path)
+def solve(grid):
+    return guard_patrol(grid).count(1)
+
+def main(text):
+    grid = parse(text)
     visited = guard_patrol(grid)
     mark_visited(grid, visited)
 
     # Print the grid with the marked path
-    for row in grid:
-        print(''.join(row))
+    print(grid)
 
-    print("Distinct positions visited:", len(visited))
+    print("Distinct positions visited:", visited.count(1))
 
 if __name__ == "__main__":
-    file_path = "e:/Advent of Code/Day-06/input1.txt"
-    main(file_path)
+    from aoc.entry import read_input
+
+    main(read_input(__file__))
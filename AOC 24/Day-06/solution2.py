@@ -1,62 +1,78 @@
 import sys
-from collections import defaultdict, Counter, deque
+from array import array
 
-# Set the recursion limit (this is rarely needed but might be helpful for large datasets)
-sys.setrecursionlimit(10**6)
+from aoc import instrument
+from aoc.grid import BORDER, Grid
 
-# Path to the input file
-infile =  "e:/Advent of Code/Day-06/input2.txt"  # Path to input.txt file
+# Parse the input into a flat grid G
+def parse(text):
+    return Grid.parse(text)
 
-# Initialize variables for part 1 and part 2 answers
-p1 = 0
-p2 = 0
-
-# Read the entire input file and split it into lines
-with open(infile, 'r') as file:
-    D = file.read().strip()
+# Simulate the guard's movement for part 1 and part 2
+def simulate(G):
+    cells = G.cells
+    dirs = G.dirs  # 0=up, 1=right, 2=down, 3=left
 
-# Split the input into grid G
-G = D.split('\n')
-R = len(G)
-C = len(G[0])
+    # stops[d][i]: where a guard at i facing d stops, before a wall or on the border
+    stops = G.stops('#')
 
-# Find the starting position of the guard ('^')
-for r in range(R):
-    for c in range(C):
-        if G[r][c] == '^':
-            sr, sc = r, c
+    # Find the starting position of the guard ('^')
+    start = G.find('^')
 
-# Simulate the guard's movement for part 1 and part 2
-for o_r in range(R):
-    for o_c in range(C):
-        r, c = sr, sc
-        d = 0  # 0=up, 1=right, 2=down, 3=left
-        SEEN = set()
-        SEEN_RC = set()
+    # Part 1: the cells on the unobstructed patrol, in the order first visited
+    path = {}
+    i, d = start, 0
+    while True:
+        step, stop = dirs[d], stops[d][i]
+        leaving = cells[stop] == BORDER
+        path.update(dict.fromkeys(range(i, stop if leaving else stop + step, step)))
+        if leaving:
+            break
+        i, d = stop, (d + 1) % 4
+    p1 = len(path)
 
+    # Part 2: an obstacle off the patrol never changes it, so only cells on it
+    # can cause a loop. The guard jumps from turn to turn; the extra obstacle
+    # cuts a run short when it lies on it, which one divmod tells. States are
+    # i*4+d at each turn; seen[state] holds the obstacle that last reached it,
+    # so the table never needs clearing.
+    p2 = 0
+    seen = array('i', [-1]) * (len(cells) * 4)
+    for k, obstacle in enumerate(path):
+        i, d = start, 0
+        turns = 0
         while True:
-            if (r, c, d) in SEEN:
-                p2 += 1
+            step, stop = dirs[d], stops[d][i]
+            ahead, rest = divmod(obstacle - i, step)
+            if rest == 0 and 0 < ahead <= (stop - i) // step:
+                stop = obstacle - step
+            elif cells[stop] == BORDER:
                 break
-            SEEN.add((r, c, d))
-            SEEN_RC.add((r, c))
-            dr, dc = [(-1, 0), (0, 1), (1, 0), (0, -1)][d]
-            rr = r + dr
-            cc = c + dc
-
-            # Check if the new position is out of bounds
-            if not (0 <= rr < R and 0 <= cc < C):
-                if G[o_r][o_c] == '#':
-                    p1 = len(SEEN_RC)  # Number of distinct positions visited
+            state = stop * 4 + d
+            if seen[state] == k:
+                p2 += 1
                 break
+            seen[state] = k
+            turns += 1
+            i, d = stop, (d + 1) % 4
+        instrument.observe("turns per obstacle", turns)
+
+    return p1, p2
+
+def solve(G):
+    return simulate(G)[1]
+
+if __name__ == "__main__":
+    # Set the recursion limit (this is rarely needed but might be helpful for large datasets)
+    sys.setrecursionlimit(10**6)
+
+    from aoc.entry import read_input
+
+    # Read the entire input file
+    D = read_input(__file__).strip()
 
-            # If the guard encounters an obstacle, it turns right (90 degrees)
-            if G[rr][cc] == '#' or (rr == o_r and cc == o_c):
-                d = (d + 1) % 4
-            else:
-                r = rr
-                c = cc
+    p1, p2 = simulate(parse(D))
 
-# Output the results for part 1 and part 2
-print(f"Part 1 result: {p1}")  # Part 1 result
-print(f"Part 2 result: {p2}")  # Part 2 result
\ No newline at end of file
+    # Output the results for part 1 and part 2
+    print(f"Part 1 result: {p1}")  # Part 1 result
+    print(f"Part 2 result: {p2}")  # Part 2 result
@@ -1,5 +1,7 @@
 from itertools import product
 
+from aoc import reader
+
 def evaluate_equation(numbers, operators):
     """
     Evaluate the equation formed by inserting the operators (+, *, ||) into the numbers list.
@@ -15,20 +17,19 @@ def evaluate_equation(numbers, operators):
             expression += str(numbers[i + 1])  # Concatenate the numbers as strings
     return int(expression)  # Convert the final result back to an integer
 
-def parse_input(file_path):
+def equations(source):
+    """
+    Yield the test value and number list of each equation, one line at a time,
+    from the input text or a memory-mapped file.
+    """
+    for numbers in reader.int_lines(source):
+        yield numbers[0], numbers[1:]
+
+def parse(text):
     """
-    Parse the input file to extract test values and number lists.
+    Parse the puzzle input to extract test values and number lists.
     """
-    equations = []
-    with open(file_path, 'r') as file:
-        for line in file:
-            if not line.strip():
-                continue
-            test_value, numbers = line.split(':')
-            test_value = int(test_value.strip())
-            numbers = list(map(int, numbers.strip().split()))
-            equations.append((test_value, numbers))
-    return equations
+    return list(equations(text))
 
 def find_solvable_equations(equations):
     """
@@ -52,11 +53,22 @@ def find_solvable_equations(equations):
 
     return total_calibration
 
-def main(file_path):
-    equations = parse_input(file_path)
-    result = find_solvable_equations(equations)
+def solve(equations):
+    return find_solvable_equations(equations)
+
+def main(text):
+    result = solve(parse(text))
     print(f"Total Calibration Result: {result}")
 
 if __name__ == "__main__":
-    file_path = "e:/Advent of Code/Day-07/input2.txt"
-    main(file_path)
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # Check a memory-mapped file of any size one equation at a time:
+        # solution2.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            print(f"Total Calibration Result: {solve(equations(buf))}")
+    else:
+        main(read_input(__file__))
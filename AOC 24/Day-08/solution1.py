@@ -1,9 +1,6 @@
-def find_unique_antinodes_from_file(file_path):
+def find_unique_antinodes(grid):
     from collections import defaultdict
-    # Step 1: Read the input file and parse the grid
-    with open(file_path, 'r') as file:
-        grid = [line.strip() for line in file.readlines()]
-    # Parse grid to collect antenna positions by frequency
+    # Step 1: Parse grid to collect antenna positions by frequency
     antenna_positions = defaultdict(list)
     rows = len(grid)
     cols = len(grid[0])
@@ -36,8 +33,13 @@ def find_unique_antinodes_from_file(file_path):
                     unique_antinodes.add((r_antin2, c_antin2))
     # Step 3: Return the count of unique antinodes
     return len(unique_antinodes)
-# Path to the input file
-file_path = "e:/Advent of Code/Day-08/input.txt"
-# Call the function and print the result
-unique_count = find_unique_antinodes_from_file(file_path)
-print(f"Number of unique antinode locations: {unique_count}")
\ No newline at end of file
+def parse(text):
+    return [line.strip() for line in text.splitlines()]
+def solve(grid):
+    return find_unique_antinodes(grid)
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Read the input file and call the function
+    unique_count = solve(parse(read_input(__file__)))
+    print(f"Number of unique antinode locations: {unique_count}")
@@ -1,38 +1,17 @@
+def parse(text):
+    dat = text.strip().split("\n")
 
-from pathlib import Path
-
-# fn = "ex1.txt"
-fn = "e:/Advent of Code/Day-09/input.txt"
-#fn = Path(Path(__file__).parent, fn)
-dat = open(fn).read().strip().split("\n")
-
-s = dat[0]
-files = []
-layout = []
-file_id = 0
-for i, ch in enumerate(s):
-    length = int(ch)
-    if i % 2 == 0:
-        layout.extend([str(file_id)] * length)
-        file_id += 1
-    else:
-        layout.extend(["."] * length)
-
-files_info = {}
-curr_id = None
-count = 0
-for i, ch in enumerate(layout):
-    if ch != ".":
-        fid = int(ch)
-        if fid != curr_id:
-            curr_id = fid
-            count = 1
-            files_info[fid] = [i, 1]
+    s = dat[0]
+    layout = []
+    file_id = 0
+    for i, ch in enumerate(s):
+        length = int(ch)
+        if i % 2 == 0:
+            layout.extend([str(file_id)] * length)
+            file_id += 1
         else:
-            count += 1
-            files_info[fid][1] = count
-
-max_file_id = max(files_info.keys())
+            layout.extend(["."] * length)
+    return layout
 
 
 def find_free_span(layout, file_start, file_length):
@@ -58,19 +37,41 @@ def find_free_span(layout, file_start, file_length):
     return None
 
 
-for fid in sorted(files_info.keys(), reverse=True):
-    start_pos, length = files_info[fid]
-    span_start = find_free_span(layout, start_pos, length)
-    if span_start is not None:
-        for i in range(start_pos, start_pos + length):
-            layout[i] = "."
-        for i in range(span_start, span_start + length):
-            layout[i] = str(fid)
-        files_info[fid][0] = span_start
+def solve(layout):
+    layout = list(layout)
+    files_info = {}
+    curr_id = None
+    count = 0
+    for i, ch in enumerate(layout):
+        if ch != ".":
+            fid = int(ch)
+            if fid != curr_id:
+                curr_id = fid
+                count = 1
+                files_info[fid] = [i, 1]
+            else:
+                count += 1
+                files_info[fid][1] = count
+
+    for fid in sorted(files_info.keys(), reverse=True):
+        start_pos, length = files_info[fid]
+        span_start = find_free_span(layout, start_pos, length)
+        if span_start is not None:
+            for i in range(start_pos, start_pos + length):
+                layout[i] = "."
+            for i in range(span_start, span_start + length):
+                layout[i] = str(fid)
+            files_info[fid][0] = span_start
+
+    checksum = 0
+    for i, ch in enumerate(layout):
+        if ch != ".":
+            checksum += i * int(ch)
+    return checksum
+
 
-checksum = 0
-for i, ch in enumerate(layout):
-    if ch != ".":
-        checksum += i * int(ch)
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-print(checksum)
\ No newline at end of file
+    # Pass "ex1.txt" (or any other path) on the command line to run on it instead
+    print(solve(parse(read_input(__file__))))
@@ -1,60 +1,45 @@
-def read_input(file_path):
-    """Reads the input file and returns the topographic map as a list of lists."""
-    with open(file_path, 'r') as f:
-        return [list(map(int, line.strip())) for line in f.readlines()]
+from aoc.grid import Grid
+
+def parse(text):
+    """Parses the puzzle input and returns the topographic map as a flat grid of digit bytes."""
+    return Grid.parse(text)
 
 def find_trailheads(topographic_map):
     """Find all trailhead positions in the map (positions with height 0)."""
-    trailheads = []
-    for i in range(len(topographic_map)):
-        for j in range(len(topographic_map[0])):
-            if topographic_map[i][j] == 0:
-                trailheads.append((i, j))
-    return trailheads
-
-def dfs_count_trails(map_, x, y, height, visited):
-    """Recursive DFS to count distinct hiking trails."""
-    # Check bounds
-    if x < 0 or x >= len(map_) or y < 0 or y >= len(map_[0]):
-        return 0
-    
-    # Check if the current position is invalid
-    if map_[x][y] != height or visited[x][y]:
-        return 0
-
-    # Mark current position as visited for this trail
-    visited[x][y] = True
+    return topographic_map.find_all('0')
+
+def dfs_count_trails(map_, i):
+    """Recursive DFS to count distinct hiking trails.
+
+    Heights strictly increase along a trail, so it can never revisit a cell
+    and no visited set is needed.
+    """
+    cells = map_.cells
+    height = cells[i]
 
     # If the current height is 9, we've reached a valid endpoint
-    if height == 9:
-        visited[x][y] = False  # Unmark for other trails
+    if height == ord('9'):
         return 1
 
-    # Continue exploring neighbors
+    # Continue exploring neighbors one step higher; the border byte never matches
     total_trails = 0
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        total_trails += dfs_count_trails(map_, x + dx, y + dy, height + 1, visited)
-
-    # Unmark the current position for other trails
-    visited[x][y] = False
+    for d in map_.dirs:
+        if cells[i + d] == height + 1:
+            total_trails += dfs_count_trails(map_, i + d)
     return total_trails
 
 def calculate_total_ratings(map_):
     """Calculate the total rating of all trailheads."""
-    trailheads = find_trailheads(map_)
-    total_rating = 0
-
-    for trailhead in trailheads:
-        visited = [[False for _ in range(len(map_[0]))] for _ in range(len(map_))]
-        rating = dfs_count_trails(map_, trailhead[0], trailhead[1], 0, visited)
-        total_rating += rating
+    return sum(dfs_count_trails(map_, trailhead) for trailhead in find_trailheads(map_))
 
-    return total_rating
+def solve(topographic_map):
+    return calculate_total_ratings(topographic_map)
 
 def main():
-    fn = "e:/Advent of Code/Day-10/input.txt"
-    topographic_map = read_input(fn)
-    total_rating = calculate_total_ratings(topographic_map)
+    from aoc.entry import read_input
+
+    topographic_map = parse(read_input(__file__))
+    total_rating = solve(topographic_map)
     print(f"Total rating of all trailheads: {total_rating}")
 
 if __name__ == "__main__":
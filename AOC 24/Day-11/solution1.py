@@ -17,21 +17,17 @@ def process_stones(stones):
     return new_stones
 
 
-def simulate_blinks(file_path, blinks):
+def simulate_blinks(stones, blinks):
     """
     Simulates the blinking process for the given number of blinks.
 
     Parameters:
-        file_path (str): Path to the input file containing initial stone numbers.
+        stones (list): Initial stone numbers.
         blinks (int): Number of times to blink.
 
     Returns:
         int: Total number of stones after all blinks.
     """
-    # Read the initial stones from the file
-    with open(file_path, 'r') as file:
-        stones = list(map(int, file.read().strip().split()))
-
     # Apply the rules for the given number of blinks
     for _ in range(blinks):
         stones = process_stones(stones)
@@ -39,11 +35,23 @@ def simulate_blinks(file_path, blinks):
     return len(stones)
 
 
-# File path to the input
-file_path = "e:/Advent of Code/Day-11/input.txt"
-# Number of blinks
-blinks = 25
+def parse(text):
+    return list(map(int, text.strip().split()))
+
+
+def solve(stones):
+    return simulate_blinks(stones, 25)
+
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Number of blinks
+    blinks = 25
+
+    # Read the initial stones from the input file
+    stones = parse(read_input(__file__))
 
-# Calculate the total number of stones
-total_stones = simulate_blinks(file_path, blinks)
-print(f"Total stones after {blinks} blinks: {total_stones}")
+    # Calculate the total number of stones
+    total_stones = simulate_blinks(stones, blinks)
+    print(f"Total stones after {blinks} blinks: {total_stones}")
@@ -26,23 +26,27 @@ def simulate_blinks_count(stones, num_blinks):
     return sum(stone_counts.values())
 
 
-def main():
-    # Read initial stones from input.txt
-    file_path = "e:/Advent of Code/Day-11/input.txt"
+def parse(text):
+    # Extract initial stones (assume they are space-separated integers)
+    return list(map(int, text.strip().split()))
 
-    with open(file_path, 'r') as file:
-        content = file.read().strip()
 
-    # Extract initial stones (assume they are space-separated integers)
-    initial_stones = list(map(int, content.split()))
+def solve(initial_stones):
+    return simulate_blinks_count(initial_stones, 75)
+
+
+def main():
+    from aoc.entry import read_input
+
+    # Read initial stones from the input file
+    content = read_input(__file__)
 
     # Simulate blinks
-    num_blinks = 75
-    total_stones = simulate_blinks_count(initial_stones, num_blinks)
+    total_stones = solve(parse(content))
 
     # Output the number of stones
     print("Number of stones after 75 blinks:", total_stones)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,43 +1,42 @@
 from collections import defaultdict, deque
 
-def parse_map(file_path):
-    with open(file_path, 'r') as f:
-        return [list(line.strip()) for line in f]
+from aoc.grid import Grid
+
+def parse(text):
+    return Grid.parse(text)
 
 def calculate_area_and_perimeter(garden_map):
-    rows = len(garden_map)
-    cols = len(garden_map[0])
-    visited = [[False for _ in range(cols)] for _ in range(rows)]
-    
-    def bfs(start_row, start_col, plant_type):
-        queue = deque([(start_row, start_col)])
-        visited[start_row][start_col] = True
+    cells = garden_map.cells
+    dirs = garden_map.dirs
+    visited = bytearray(len(cells))
+
+    def bfs(start, plant_type):
+        queue = deque([start])
+        visited[start] = 1
         area = 0
         perimeter = 0
-        
+
         while queue:
-            row, col = queue.popleft()
+            i = queue.popleft()
             area += 1
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = row + dr, col + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if garden_map[nr][nc] == plant_type and not visited[nr][nc]:
-                        visited[nr][nc] = True
-                        queue.append((nr, nc))
-                    elif garden_map[nr][nc] != plant_type:
-                        perimeter += 1
-                else:
+            for d in dirs:
+                j = i + d
+                # Border bytes never match a plant, so edges count as fence
+                if cells[j] != plant_type:
                     perimeter += 1
-        
+                elif not visited[j]:
+                    visited[j] = 1
+                    queue.append(j)
+
         return area, perimeter
 
     regions = defaultdict(list)
-    for r in range(rows):
-        for c in range(cols):
-            if not visited[r][c]:
-                plant_type = garden_map[r][c]
-                area, perimeter = bfs(r, c, plant_type)
-                regions[plant_type].append((area, perimeter))
+    for r in range(garden_map.height):
+        for i in range(garden_map.index(r, 0), garden_map.index(r, garden_map.width)):
+            if not visited[i]:
+                plant_type = cells[i]
+                area, perimeter = bfs(i, plant_type)
+                regions[chr(plant_type)].append((area, perimeter))
 
     return regions
 
@@ -48,13 +47,16 @@ def calculate_total_cost(regions):
             total_cost += area * perimeter
     return total_cost
 
-def main(file_path):
-    garden_map = parse_map(file_path)
+def solve(garden_map):
     regions = calculate_area_and_perimeter(garden_map)
-    total_cost = calculate_total_cost(regions)
+    return calculate_total_cost(regions)
+
+def main(text):
+    total_cost = solve(parse(text))
     print(f"Total price of fencing: {total_cost}")
 
 # Example usage
 if __name__ == "__main__":
-    input_file =  "e:/Advent of Code/Day-12/input.txt"
-    main(input_file)
\ No newline at end of file
+    from aoc.entry import read_input
+
+    main(read_input(__file__))
\ No newline at end of file
@@ -1,71 +1,53 @@
-import collections
-import sys
-
-fname =  "e:/Advent of Code/Day-12/input.txt" if len(sys.argv) < 2 else sys.argv[1]
-
-out = 0
-
-grid = []
-total = 0
-
-for line in open(fname):
-  line = line.strip()
-  grid += [line]
-  total += len(line)
-
-used = set()
-
-def p(a, b):
-  return (a[0] + b[0], a[1] + b[1])
-
-def invert(a):
-  return (a[1], a[0])
-
-def neg(a):
-  return (-1 * a[0], -1 * a[1])
-
-while len(used) < total:
-  for i in range(len(grid)):
-    for j in range(len(grid[i])):
-      if (i,j) not in used:
-        current_region = set()
-        borders = []
-        num_borders = 0
-        queue = [(i,j)]
-        while queue:
-          n = queue.pop()
-          current_region.add(n)
-          ii = n[0]
-          jj = n[1]
-          for d in [(0,1), (1,0), (-1,0), (0,-1)]:
-            iii = ii + d[0]
-            jjj = jj + d[1]
-            if iii < 0 or iii >= len(grid) or jjj < 0 or jjj >= len(grid[iii]) or grid[iii][jjj] != grid[i][j]:
-              borders += [((iii, jjj), d)]
-            elif (iii, jjj) not in queue and (iii, jjj) not in current_region:
-              queue += [(iii, jjj)]
-        while borders:
-          pt, d = borders.pop()
-          print(pt, d)
-          flipped = invert(d)
-          pt2 = pt
-          while True:
-            pt2 = p(pt2, flipped)
-            if (pt2,d) in borders:
-              borders.remove((pt2, d))
-            else:
-              break
-          pt2 = pt
-          while True:
-            pt2 = p(pt2, neg(flipped))
-            if (pt2,d) in borders:
-              borders.remove((pt2, d))
-            else:
-              break
-          num_borders += 1
-
-        out += len(current_region) * num_borders
-        for n in current_region:
-          used.add(n)
-
-print(out)
\ No newline at end of file
+from aoc.grid import Grid
+
+def parse(text):
+  return Grid.parse(text)
+
+def corners(grid, n, t):
+  # A region has as many sides as corners. Look at each clockwise pair of
+  # directions: both neighbours outside is a convex corner, both inside with
+  # the diagonal outside is a concave one.
+  cells = grid.cells
+  dirs = grid.dirs
+  count = 0
+  for k in range(4):
+    d1, d2 = dirs[k], dirs[(k + 1) % 4]
+    a, b = cells[n + d1] == t, cells[n + d2] == t
+    if not a and not b:
+      count += 1
+    elif a and b and cells[n + d1 + d2] != t:
+      count += 1
+  return count
+
+def solve(grid):
+  out = 0
+  cells = grid.cells
+  used = bytearray(len(cells))
+
+  for r in range(grid.height):
+    for i in range(grid.index(r, 0), grid.index(r, grid.width)):
+      if used[i]:
+        continue
+      t = cells[i]
+      area = 0
+      num_borders = 0
+      used[i] = 1
+      queue = [i]
+      while queue:
+        n = queue.pop()
+        area += 1
+        num_borders += corners(grid, n, t)
+        for d in grid.dirs:
+          m = n + d
+          if cells[m] == t and not used[m]:
+            used[m] = 1
+            queue.append(m)
+
+      out += area * num_borders
+
+  return out
+
+if __name__ == "__main__":
+  from aoc.entry import read_input
+
+  print(solve(parse(read_input(__file__))))
@@ -1,17 +1,13 @@
 from itertools import product
 import math
 
-def parse_input(file_path):
-    """Parse the input file and extract button configurations and prize locations."""
+from aoc import reader
+
+def parse(text):
+    """Parse the puzzle input and extract button configurations and prize locations."""
     machines = []
-    with open(file_path, 'r') as file:
-        lines = file.read().strip().split('\n\n')
-        for machine in lines:
-            lines = machine.split('\n')
-            button_a = tuple(map(int, [v.split('+')[1] for v in lines[0].split(':')[1].strip().split(',')]))
-            button_b = tuple(map(int, [v.split('+')[1] for v in lines[1].split(':')[1].strip().split(',')]))
-            prize = tuple(map(int, [v.split('=')[1] for v in lines[2].split(':')[1].strip().split(',')]))
-            machines.append((button_a, button_b, prize))
+    for a_x, a_y, b_x, b_y, x, y in reader.int_records(text):
+        machines.append(((a_x, a_y), (b_x, b_y), (x, y)))
     return machines
 
 def find_min_tokens(button_a, button_b, prize, max_presses=100):
@@ -32,9 +28,8 @@ def find_min_tokens(button_a, button_b, prize, max_presses=100):
 
     return min_tokens if min_tokens != math.inf else None
 
-def solve(file_path):
-    """Solve the problem and return the minimum tokens to win the maximum prizes."""
-    machines = parse_input(file_path)
+def count_prizes(machines):
+    """Return the number of prizes won and the minimum tokens spent winning them."""
     total_tokens = 0
     prizes_won = 0
 
@@ -46,8 +41,13 @@ def solve(file_path):
 
     return prizes_won, total_tokens
 
+def solve(machines):
+    """Solve the problem and return the minimum tokens to win the maximum prizes."""
+    return count_prizes(machines)[1]
+
 if __name__ == "__main__":
-    input_file = "e:/Advent of Code/Day-13/input.txt"
-    prizes_won, total_tokens = solve(input_file)
+    from aoc.entry import read_input
+
+    prizes_won, total_tokens = count_prizes(parse(read_input(__file__)))
     print(f"Maximum prizes won: {prizes_won}")
     print(f"Minimum tokens spent: {total_tokens}")
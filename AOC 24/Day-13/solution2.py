@@ -1,27 +1,31 @@
-data = []
-with open("e:/Advent of Code/Day-13/input.txt", 'r') as f:
-    data = f.read().strip('\n').split('\n')
+from aoc import reader
 
 offset = 10000000000000
-groups = '\n'.join(data).split('\n\n')
-total = 0
-for group in groups:
-    a_str, b_str, p_str = group.split('\n')
 
-    ax, ay = [int(x[2:]) for x in a_str[10:].split(', ')]
-    bx, by = [int(x[2:]) for x in b_str[10:].split(', ')]
-    px, py = [int(x[2:]) for x in p_str[7:].split(', ')]
+def parse(text):
+    # Button A, button B and prize coordinates of each machine
+    return list(reader.int_records(text))
 
-    px += offset
-    py += offset
+def solve(groups):
+    total = 0
+    for ax, ay, bx, by, px, py in groups:
 
-    m = (px * by - py * bx) // (ax * by - ay * bx)
-    if m * (ax * by - ay * bx) != (px * by - py * bx):
-        continue
-    n = (py - ay * m) // by
-    if n * by != (py - ay * m):
-        continue
+        px += offset
+        py += offset
 
-    total += 3 * m + n
+        m = (px * by - py * bx) // (ax * by - ay * bx)
+        if m * (ax * by - ay * bx) != (px * by - py * bx):
+            continue
+        n = (py - ay * m) // by
+        if n * by != (py - ay * m):
+            continue
+        if m < 0 or n < 0:
+            continue  # Buttons cannot be pressed a negative number of times
 
-print(total)
\ No newline at end of file
+        total += 3 * m + n
+    return total
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
@@ -6,15 +6,13 @@ GRID_WIDTH = 101
 GRID_HEIGHT = 103
 
 # Define the function to parse input
-def parse_input(input_file):
+def parse(text):
     robots = []
-    with open(input_file, 'r') as file:
-        lines = file.readlines()
-        for line in lines:
-            match = re.match(r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)", line.strip())
-            if match:
-                px, py, vx, vy = map(int, match.groups())
-                robots.append(((px, py), (vx, vy)))
+    for line in text.splitlines():
+        match = re.match(r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)", line.strip())
+        if match:
+            px, py, vx, vy = map(int, match.groups())
+            robots.append(((px, py), (vx, vy)))
     return robots
 
 # Simulate robots
@@ -54,16 +52,19 @@ def calculate_safety_factor(positions):
 
     return safety_factor
 
-if __name__ == "__main__":
-    input_file = "e:/Advent of Code/Day-14/input.txt"
-
-    # Parse input
-    robots = parse_input(input_file)
-
+def solve(robots):
     # Simulate for 100 seconds
     positions = simulate_robots(robots, 100)
 
     # Calculate safety factor
-    safety_factor = calculate_safety_factor(positions)
+    return calculate_safety_factor(positions)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Parse input
+    robots = parse(read_input(__file__))
+
+    safety_factor = solve(robots)
 
     print(f"Safety Factor: {safety_factor}")
@@ -1,34 +1,42 @@
-with open( "e:/Advent of Code/Day-14/input.txt", 'r') as file:
-    lines = file.readlines()
-
 x_max = 101
 y_max = 103
-lines = [line.strip() for line in lines]
-
-positions = []
-velocities = []
-for i in range(len(lines)):
-    line = lines[i]
-    p = line.split(' ')[0].split('=')[1]
-    v = line.split(' ')[1].split('=')[1]
-    px = int(p.split(',')[0])
-    py = int(p.split(',')[1])
-    vx = int(v.split(',')[0])
-    vy = int(v.split(',')[1])
-    positions.append((px, py))
-    velocities.append((vx, vy))
-
-T = 0
-while True:
-    distint_positions = set(positions)
-    if len(distint_positions) == len(positions):
-        break
-
-    for i in range(len(positions)):
-        px, py = positions[i]
-        vx, vy = velocities[i]
-        positions[i] = ((px + vx) % x_max, (py + vy) % y_max)
-
-    T += 1
-
-print(T)
\ No newline at end of file
+
+def parse(text):
+    lines = [line.strip() for line in text.splitlines()]
+
+    positions = []
+    velocities = []
+    for i in range(len(lines)):
+        line = lines[i]
+        p = line.split(' ')[0].split('=')[1]
+        v = line.split(' ')[1].split('=')[1]
+        px = int(p.split(',')[0])
+        py = int(p.split(',')[1])
+        vx = int(v.split(',')[0])
+        vy = int(v.split(',')[1])
+        positions.append((px, py))
+        velocities.append((vx, vy))
+    return positions, velocities
+
+def solve(parsed):
+    positions, velocities = parsed
+    positions = list(positions)
+
+    T = 0
+    while True:
+        distint_positions = set(positions)
+        if len(distint_positions) == len(positions):
+            break
+
+        for i in range(len(positions)):
+            px, py = positions[i]
+            vx, vy = velocities[i]
+            positions[i] = ((px + vx) % x_max, (py + vy) % y_max)
+
+        T += 1
+    return T
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
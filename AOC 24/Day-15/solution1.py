@@ -1,61 +1,41 @@
 
-import datetime
-import re
+from aoc.grid import Grid
 
-# Read the input from 'input.txt' file
-def read_input(file_path):
-    with open(file_path, 'r') as f:
-        data = f.read()
-    return data
+def parse(text):
+    grid, moves = text.split("\n\n")
+    return Grid.parse(grid), moves.replace("\n", "")
 
 # Part a: Solving the puzzle
 def a(data):
-    grid, moves = data.split("\n\n")
-    wall = set()
-    boxes = set()
-    pos = None
-    for i, line in enumerate(grid.splitlines()):
-        width = len(line)
-        for j, c in enumerate(line):
-            if c == "#":
-                wall.add(j + i*1j)
-            elif c == "O":
-                boxes.add(j + i*1j)
-            elif c == "@":
-                pos = j + i*1j
-    height = i + 1
+    grid, moves = data
+    grid = grid.copy()
+    cells = grid.cells
+    wall, box, floor = ord("#"), ord("O"), ord(".")
+    pos = grid.find("@")
     move2dir = {
-        ">": 1,
-        "^": -1j,
-        "<": -1,
-        "v": 1j,
+        ">": grid.right,
+        "^": grid.up,
+        "<": grid.left,
+        "v": grid.down,
     }
-    for move in moves.replace("\n", ""):
+    for move in moves:
         dir = move2dir[move]
-        if pos + dir in wall:
+        # Skip over the run of boxes in front of the robot
+        end = pos + dir
+        while cells[end] == box:
+            end += dir
+        if cells[end] == wall:
             continue
-        if pos + dir not in boxes:
-            pos += dir
-            continue
-        boxes_to_move = 0
-        pos_to_check = pos + dir
-        while True:
-            if pos_to_check in boxes:
-                boxes_to_move += 1
-                pos_to_check += dir
-            elif pos_to_check in wall:
-                boxes_to_move = 0
-                break
-            else:
-                break
-        if boxes_to_move > 0:
-            pos += dir
-            box_to_move = pos
-            boxes.remove(pos)
-            boxes.add(pos + boxes_to_move * dir)
+        # Pushing a run of boxes is the same as moving its first box to the far end
+        if end != pos + dir:
+            cells[end] = box
+        cells[pos] = floor
+        pos += dir
+        cells[pos] = ord("@")
     s = 0
-    for box in boxes:
-        s += box.real + 100 * box.imag
+    for i in grid.find_all("O"):
+        r, c = grid.pos(i)
+        s += c + 100 * r
     return s
 
 # Part b: (example placeholder for part b, you can add the logic as needed)
@@ -63,13 +43,18 @@ def b(data):
     print("Part B is not implemented yet.")
     return 0
 
+def solve(data):
+    return a(data)
+
 # Main execution function
 def main():
+    from aoc.entry import read_input
+
     # Read the input from the file
-    input_data = read_input("e:/Advent of Code/Day-15/input.txt")
+    input_data = read_input(__file__)
 
     # Solve part a
-    answer_a = a(input_data)
+    answer_a = solve(parse(input_data))
     print("Part A:", answer_a)
 
    
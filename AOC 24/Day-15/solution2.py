@@ -1,12 +1,4 @@
-from collections import defaultdict
-
-# Read input from 'input.txt'
-with open("e:/Advent of Code/Day-15/input.txt", 'r') as f:
-    inp = f.read()
-
-# Split the input into grid and directions
-parts = inp.split("\n\n")
-lines = parts[0].split("\n")
+from aoc.grid import Grid
 
 # Function to expand grid tiles
 def expand(c):
@@ -17,88 +9,86 @@ def expand(c):
     else:
         return c + c
 
-# Expanding the grid
-lines = ["".join(expand(c) for c in l) for l in lines]
-print("\n".join(lines))
-
-# Dimensions of the expanded grid
-m = len(lines)
-n = len(lines[0])
+# Split the input into grid and directions
+def parse(text):
+    parts = text.split("\n\n")
+    lines = parts[0].split("\n")
 
-# Create a grid (using defaultdict to simplify handling of missing cells)
-grid = defaultdict(lambda: defaultdict(lambda: "!"))
-for i, line in enumerate(lines):
-    for j, c in enumerate(line):
-        grid[i][j] = c
+    # Expanding the grid
+    lines = ["".join(expand(c) for c in l) for l in lines]
+    return Grid(lines), parts[1]
 
-# Directions corresponding to <, >, ^, v
-dirs = [(0, 1), (0, -1), (-1, 0), (1, 0)]
-chardirs = {"<": 1, ">": 0, "^": 2, "v": 3}
+WALL, FLOOR, ROBOT, LEFT, RIGHT = (ord(c) for c in "#.@[]")
 
 # Function to check if a move is valid
-def check_move(d, i, j, already_checked):
-    if (i, j) in already_checked:
-        return already_checked[(i, j)]
-    already_checked[(i, j)] = True
-    if grid[i][j] == "#":
-        already_checked[(i, j)] = False
-    elif grid[i][j] == ".":
-        already_checked[(i, j)] = True
-    elif grid[i][j] == "@":
-        already_checked[(i, j)] = check_move(d, i + d[0], j + d[1], already_checked)
-    elif grid[i][j] == "[":
-        already_checked[(i, j)] = check_move(d, i + d[0], j + d[1], already_checked) and check_move(d, i, j + 1, already_checked)
-    elif grid[i][j] == "]":
-        already_checked[(i, j)] = check_move(d, i + d[0], j + d[1], already_checked) and check_move(d, i, j - 1, already_checked)
-    return already_checked[(i, j)]
+def check_move(grid, d, i, already_checked):
+    if i in already_checked:
+        return already_checked[i]
+    already_checked[i] = True
+    c = grid.cells[i]
+    if c == WALL:
+        already_checked[i] = False
+    elif c == FLOOR:
+        already_checked[i] = True
+    elif c == ROBOT:
+        already_checked[i] = check_move(grid, d, i + d, already_checked)
+    elif c == LEFT:
+        already_checked[i] = check_move(grid, d, i + d, already_checked) and check_move(grid, d, i + 1, already_checked)
+    elif c == RIGHT:
+        already_checked[i] = check_move(grid, d, i + d, already_checked) and check_move(grid, d, i - 1, already_checked)
+    return already_checked[i]
 
 # Function to commit the move
-def commit_move(d, i, j, already_committed):
-    if (i, j) in already_committed:
+def commit_move(grid, d, i, already_committed):
+    if i in already_committed:
         return
-    already_committed.add((i, j))
-    if grid[i][j] == "#":
+    already_committed.add(i)
+    cells = grid.cells
+    c = cells[i]
+    if c == WALL or c == FLOOR:
         return
-    elif grid[i][j] == ".":
-        return
-    elif grid[i][j] == "[":
-        commit_move(d, i + d[0], j + d[1], already_committed)
-        commit_move(d, i, j + 1, already_committed)
-        grid[i + d[0]][j + d[1]] = grid[i][j]
-        grid[i][j] = "."
-    elif grid[i][j] == "]":
-        commit_move(d, i + d[0], j + d[1], already_committed)
-        commit_move(d, i, j - 1, already_committed)
-        grid[i + d[0]][j + d[1]] = grid[i][j]
-        grid[i][j] = "."
-    elif grid[i][j] == "@":
-        commit_move(d, i + d[0], j + d[1], already_committed)
-        grid[i + d[0]][j + d[1]] = grid[i][j]
-        grid[i][j] = "."
+    elif c == LEFT:
+        commit_move(grid, d, i + d, already_committed)
+        commit_move(grid, d, i + 1, already_committed)
+    elif c == RIGHT:
+        commit_move(grid, d, i + d, already_committed)
+        commit_move(grid, d, i - 1, already_committed)
+    elif c == ROBOT:
+        commit_move(grid, d, i + d, already_committed)
+    cells[i + d] = c
+    cells[i] = FLOOR
+
+def solve(parsed):
+    grid, moves = parsed
+    grid = grid.copy()
+
+    # Directions to move (from input)
+    dirs = {">": grid.right, "<": grid.left, "^": grid.up, "v": grid.down}
+
+    # Find initial robot position
+    robot_pos = grid.find("@")
+
+    for dirchar in moves:
+        if dirchar == "\n":
+            continue
+        d = dirs[dirchar]
+        if check_move(grid, d, robot_pos, {}):
+            commit_move(grid, d, robot_pos, set())  # Commit the move
+            robot_pos += d  # Update robot position
 
-# Find initial robot position
-robot_pos = (0, 0)
-for i in range(m):
-    for j in range(n):
-        if grid[i][j] == "@":
-            robot_pos = (i, j)
+    # Calculate GPS sum for boxes
+    result = 0
+    for i in grid.find_all("["):
+        r, c = grid.pos(i)
+        result += 100 * r + c
+    return result
 
-# Directions to move (from input)
-for dirchar in parts[1]:
-    if dirchar == "\n":
-        continue
-    d = dirs[chardirs[dirchar]]  # Get the direction tuple
-    if check_move(d, robot_pos[0], robot_pos[1], {}):
-        commit_move(d, robot_pos[0], robot_pos[1], set())  # Commit the move
-        robot_pos = (robot_pos[0] + d[0], robot_pos[1] + d[1])  # Update robot position
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-# Calculate GPS sum for boxes
-result = 0
-for i in range(m):
-    for j in range(n):
-        if grid[i][j] == "[":
-            # Calculate the GPS coordinate for the box
-            result += 100 * i + j
+    # Read the input file
+    grid, moves = parse(read_input(__file__))
+    print(grid)
 
-# Print the final result
-print("Final GPS sum:", result)
\ No newline at end of file
+    # Print the final result
+    print("Final GPS sum:", solve((grid, moves)))
@@ -1,8 +1,7 @@
-def read_program(file_path):
-    """Reads the program from the file."""
-    with open(file_path, 'r') as file:
-        lines = file.readlines()
-    
+def parse(text):
+    """Reads the registers and program from the puzzle input."""
+    lines = text.splitlines()
+
     registers = {}
     program = []
 
@@ -80,11 +79,16 @@ def execute_program(registers, program):
     return ",".join(map(str, output))
 
 
+def solve(parsed):
+    registers, program = parsed
+    return execute_program(dict(registers), program)
+
+
 if __name__ == "__main__":
-    file_path = "e:/Advent of Code/Day-17/input.txt"
+    from aoc.entry import read_input
 
-    # Read the registers and program from the file
-    registers, program = read_program(file_path)
+    # Read the registers and program from the input file
+    registers, program = parse(read_input(__file__))
 
     # Execute the program and print the output
     result = execute_program(registers, program)
@@ -1,63 +1,56 @@
-import heapq
+from aoc.grid import Grid
+from aoc.search import bfs
 
-def parse_input(file_path):
-    """Reads the input file and returns a list of tuples representing corrupted coordinates."""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    return [tuple(map(int, line.strip().split(','))) for line in lines]
+def parse(text):
+    """Parses the puzzle input and returns a list of tuples representing corrupted coordinates."""
+    return [tuple(map(int, line.strip().split(','))) for line in text.splitlines()]
 
 def simulate_memory_corruption(corrupted_coords, grid_size):
     """Simulates the corruption on the grid."""
-    grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = Grid.blank(grid_size, grid_size)
     for x, y in corrupted_coords:
-        grid[y][x] = 1  # Mark corrupted coordinates with 1
+        grid[grid.index(y, x)] = '#'  # Mark corrupted coordinates
     return grid
 
-def is_valid(x, y, grid):
-    """Checks if the coordinate (x, y) is valid and not corrupted."""
-    return 0 <= x < len(grid) and 0 <= y < len(grid) and grid[y][x] == 0
-
 def shortest_path(grid):
-    """Finds the shortest path from top-left to bottom-right using A* algorithm."""
-    start = (0, 0)
-    end = (len(grid) - 1, len(grid) - 1)
-    
-    if grid[start[1]][start[0]] == 1 or grid[end[1]][end[0]] == 1:
+    """Finds the shortest path from top-left to bottom-right with a breadth-first search."""
+    cells = grid.cells
+    corrupted = ord('#')
+    start = grid.index(0, 0)
+    end = grid.index(grid.height - 1, grid.width - 1)
+
+    if cells[start] == corrupted or cells[end] == corrupted:
         return -1  # No path if start or end is corrupted
 
-    # Priority queue: (cost, x, y)
-    pq = [(0, start[0], start[1])]
-    visited = set()
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
+    directions = grid.dirs  # Up, Right, Down, Left
 
-    while pq:
-        cost, x, y = heapq.heappop(pq)
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
+    def neighbors(i):
+        # The border stops us walking off the grid
+        for d in directions:
+            if cells[i + d] == ord('.'):
+                yield i + d, 1
 
-        # Check if we reached the end
-        if (x, y) == end:
-            return cost
+    # -1 when no path is found
+    return bfs(len(cells), [start], neighbors, {end})[end]
 
-        # Explore neighbors
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if is_valid(nx, ny, grid) and (nx, ny) not in visited:
-                heapq.heappush(pq, (cost + 1, nx, ny))
+def solve(corrupted_coords):
+    # Memory space spans the bytes' coordinates: 71x71 (0 to 70 inclusive) for the puzzle
+    grid_size = 1 + max(max(x, y) for x, y in corrupted_coords)
 
-    return -1  # No path found
+    # Simulate memory corruption with the first 1024 bytes, or the same share
+    # of the cells on a grid of another size
+    fallen = 1024 * grid_size * grid_size // 71 ** 2
+    grid = simulate_memory_corruption(corrupted_coords[:fallen], grid_size)
+
+    # Find the shortest path
+    return shortest_path(grid)
 
 def main():
-    file_path = "e:/Advent of Code/Day-18/input.txt"
-    grid_size = 71  # Memory space dimensions (0 to 70 inclusive)
-    corrupted_coords = parse_input(file_path)[:1024]  # First 1024 bytes
+    from aoc.entry import read_input
 
-    # Simulate memory corruption
-    grid = simulate_memory_corruption(corrupted_coords, grid_size)
+    corrupted_coords = parse(read_input(__file__))
 
-    # Find the shortest path
-    steps = shortest_path(grid)
+    steps = solve(corrupted_coords)
     print(f"The minimum number of steps to reach the exit is: {steps}")
 
 if __name__ == "__main__":
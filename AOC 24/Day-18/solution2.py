@@ -1,68 +1,59 @@
-import heapq
+from aoc.grid import Grid
+from aoc.search import bfs
 
-def parse_input(file_path):
-    """Reads the input file and returns a list of tuples representing corrupted coordinates."""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    return [tuple(map(int, line.strip().split(','))) for line in lines]
+def parse(text):
+    """Parses the puzzle input and returns a list of tuples representing corrupted coordinates."""
+    return [tuple(map(int, line.strip().split(','))) for line in text.splitlines()]
 
 def simulate_memory_corruption(corrupted_coords, grid_size):
     """Simulates the corruption on the grid."""
-    grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = Grid.blank(grid_size, grid_size)
     return grid
 
-def is_valid(x, y, grid):
-    """Checks if the coordinate (x, y) is valid and not corrupted."""
-    return 0 <= x < len(grid) and 0 <= y < len(grid) and grid[y][x] == 0
-
 def shortest_path(grid):
-    """Finds the shortest path from top-left to bottom-right using A* algorithm."""
-    start = (0, 0)
-    end = (len(grid) - 1, len(grid) - 1)
-    
-    if grid[start[1]][start[0]] == 1 or grid[end[1]][end[0]] == 1:
-        return -1  # No path if start or end is corrupted
-
-    # Priority queue: (cost, x, y)
-    pq = [(0, start[0], start[1])]
-    visited = set()
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
+    """Finds the shortest path from top-left to bottom-right with a breadth-first search."""
+    cells = grid.cells
+    corrupted = ord('#')
+    start = grid.index(0, 0)
+    end = grid.index(grid.height - 1, grid.width - 1)
 
-    while pq:
-        cost, x, y = heapq.heappop(pq)
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
+    if cells[start] == corrupted or cells[end] == corrupted:
+        return -1  # No path if start or end is corrupted
 
-        # Check if we reached the end
-        if (x, y) == end:
-            return cost
+    directions = grid.dirs  # Up, Right, Down, Left
 
-        # Explore neighbors
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if is_valid(nx, ny, grid) and (nx, ny) not in visited:
-                heapq.heappush(pq, (cost + 1, nx, ny))
+    def neighbors(i):
+        # The border stops us walking off the grid
+        for d in directions:
+            if cells[i + d] == ord('.'):
+                yield i + d, 1
 
-    return -1  # No path found
+    # -1 when no path is found
+    return bfs(len(cells), [start], neighbors, {end})[end]
 
 def find_blocking_byte(corrupted_coords, grid_size):
     """Finds the first byte that prevents the exit from being reachable."""
     grid = simulate_memory_corruption([], grid_size)
 
     for idx, (x, y) in enumerate(corrupted_coords):
-        grid[y][x] = 1  # Add corruption
+        grid[grid.index(y, x)] = '#'  # Add corruption
         if shortest_path(grid) == -1:
             return x, y  # Return the first blocking byte
 
-def main():
-    file_path = "e:/Advent of Code/Day-18/input.txt"
-    grid_size = 71  # Memory space dimensions (0 to 70 inclusive)
-    corrupted_coords = parse_input(file_path)
+def solve(corrupted_coords):
+    # Memory space spans the bytes' coordinates: 71x71 (0 to 70 inclusive) for the puzzle
+    grid_size = 1 + max(max(x, y) for x, y in corrupted_coords)
 
     # Find the first blocking byte
     blocking_byte = find_blocking_byte(corrupted_coords, grid_size)
-    print(f"The coordinates of the first byte that prevents the exit are: {blocking_byte[0]},{blocking_byte[1]}")
+    return f"{blocking_byte[0]},{blocking_byte[1]}"
+
+def main():
+    from aoc.entry import read_input
+
+    corrupted_coords = parse(read_input(__file__))
+
+    print(f"The coordinates of the first byte that prevents the exit are: {solve(corrupted_coords)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,7 @@
 from collections import defaultdict, deque
 
-def read_input(file_path):
-    with open(file_path, 'r') as file:
-        lines = file.read().strip().split('\n')
+def parse(text):
+    lines = text.strip().split('\n')
 
     # Separate towel patterns and desired designs
     towel_patterns = lines[0].split(', ')
@@ -31,8 +30,8 @@ def can_form_design(design, towel_patterns):
 
     return False
 
-def count_possible_designs(file_path):
-    towel_patterns, designs = read_input(file_path)
+def count_possible_designs(parsed):
+    towel_patterns, designs = parsed
     possible_count = 0
 
     for design in designs:
@@ -41,9 +40,12 @@ def count_possible_designs(file_path):
 
     return possible_count
 
-# Input file path
-file_path = "e:/Advent of Code/Day-19/input.txt"
+def solve(parsed):
+    return count_possible_designs(parsed)
 
-# Count and print the number of possible designs
-result = count_possible_designs(file_path)
-print(f"Number of possible designs: {result}")
\ No newline at end of file
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Count and print the result
+    result = solve(parse(read_input(__file__)))
+    print(f"Number of possible designs: {result}")
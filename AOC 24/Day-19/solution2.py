@@ -1,8 +1,7 @@
 from collections import defaultdict, deque
 
-def read_input(file_path):
-    with open(file_path, 'r') as file:
-        lines = file.read().strip().split('\n')
+def parse(text):
+    lines = text.strip().split('\n')
 
     # Separate towel patterns and desired designs
     towel_patterns = lines[0].split(', ')
@@ -31,8 +30,8 @@ def count_ways_to_form_design(design, towel_patterns):
 
     return dfs(design)
 
-def total_ways_to_form_designs(file_path):
-    towel_patterns, designs = read_input(file_path)
+def total_ways_to_form_designs(parsed):
+    towel_patterns, designs = parsed
     total_ways = 0
 
     for design in designs:
@@ -40,9 +39,12 @@ def total_ways_to_form_designs(file_path):
 
     return total_ways
 
-# Input file path
-file_path = "e:/Advent of Code/Day-19/input.txt"
+def solve(parsed):
+    return total_ways_to_form_designs(parsed)
 
-# Count and print the total number of ways to form all designs
-result = total_ways_to_form_designs(file_path)
-print(f"Total number of ways to form all designs: {result}")
\ No newline at end of file
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Count and print the result
+    result = solve(parse(read_input(__file__)))
+    print(f"Total number of ways to form all designs: {result}")
@@ -1,109 +1,83 @@
-from collections import deque
-from typing import List, Set, Tuple, Dict
-import heapq
-
-def read_input(filename: str) -> List[str]:
-    with open(filename, 'r') as f:
-        return [line.strip() for line in f.readlines()]
-
-def find_start_end(grid: List[str]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
-    start = end = None
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 'S':
-                start = (i, j)
-            elif grid[i][j] == 'E':
-                end = (i, j)
-    return start, end
-
-def get_neighbors(pos: Tuple[int, int], grid: List[str]) -> List[Tuple[int, int]]:
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-    neighbors = []
-    for dy, dx in directions:
-        new_y, new_x = pos[0] + dy, pos[1] + dx
-        if (0 <= new_y < len(grid) and
-            0 <= new_x < len(grid[0]) and
-            grid[new_y][new_x] != '#'):
-            neighbors.append((new_y, new_x))
-    return neighbors
-
-def shortest_path(grid: List[str], start: Tuple[int, int], end: Tuple[int, int]) -> Dict[Tuple[int, int], int]:
-    distances = {}
-    queue = [(0, start)]
-    distances[start] = 0
-
-    while queue:
-        dist, current = heapq.heappop(queue)
-
-        if dist > distances[current]:
-            continue
-
-        for next_pos in get_neighbors(current, grid):
-            new_dist = dist + 1
-
-            if next_pos not in distances or new_dist < distances[next_pos]:
-                distances[next_pos] = new_dist
-                heapq.heappush(queue, (new_dist, next_pos))
-
-    return distances
-
-def find_cheats(grid: List[str], normal_distances: Dict[Tuple[int, int], int],
-                start: Tuple[int, int], end: Tuple[int, int]) -> Dict[int, int]:
-    height, width = len(grid), len(grid[0])
+from array import array
+from typing import List, Tuple, Dict
+
+from aoc.grid import BORDER, Grid
+from aoc.search import bfs
+
+# A cheat may last this many moves through walls
+MAX_CHEAT_LENGTH = 2
+
+def parse(text: str) -> Grid:
+    return Grid.parse(text, pad=MAX_CHEAT_LENGTH)
+
+def shortest_path(grid: Grid, start: int) -> array:
+    """Steps from start to every track cell (-1 for walls and unreachable cells)."""
+    cells = grid.cells
+    wall = ord('#')
+    directions = grid.dirs
+
+    def neighbors(i):
+        for d in directions:
+            j = i + d
+            if cells[j] != wall and cells[j] != BORDER:
+                yield j, 1
+
+    return bfs(len(cells), [start], neighbors)
+
+def cheat_offsets(grid: Grid, max_length: int) -> List[Tuple[int, int]]:
+    """(index offset, cheat length) for every cell within max_length moves.
+
+    The grid is padded by at least max_length, so every offset from a track
+    cell lands on a cell or on the border, never wrapping onto another row.
+    """
+    offsets = []
+    for dy in range(-max_length, max_length + 1):
+        reach = max_length - abs(dy)
+        for dx in range(-reach, reach + 1):
+            if dy or dx:
+                offsets.append((dy * grid.stride + dx, abs(dy) + abs(dx)))
+    return offsets
+
+def find_cheats(grid: Grid, normal_distances: array, end: int) -> Dict[int, int]:
     savings = {}
+    offsets = cheat_offsets(grid, MAX_CHEAT_LENGTH)
+    normal_time = normal_distances[end]
 
-    # For each possible cheat start position
-    for y1 in range(height):
-        for x1 in range(width):
-            if grid[y1][x1] == '#':
-                continue
-            pos1 = (y1, x1)
-            if pos1 not in normal_distances:
+    # For each possible cheat start position on the normal path
+    for pos1, dist1 in enumerate(normal_distances):
+        if dist1 < 0:
+            continue
+        # For each cheat end position within reach that is on the normal path
+        for offset, cheat_length in offsets:
+            dist2 = normal_distances[pos1 + offset]
+            if dist2 < 0:
                 continue
 
-            # For each possible cheat end position
-            for y2 in range(height):
-                for x2 in range(width):
-                    if grid[y2][x2] == '#':
-                        continue
-                    pos2 = (y2, x2)
-
-                    # Calculate Manhattan distance between start and end of cheat
-                    manhattan_dist = abs(y2 - y1) + abs(x2 - x1)
-                    if manhattan_dist > 2:  # Cheat can only last 2 moves
-                        continue
-
-                    # If we can reach both positions in normal path
-                    if pos1 in normal_distances and pos2 in normal_distances:
-                        # Calculate time saved
-                        normal_time = normal_distances[end]
-                        cheat_time = (normal_distances[pos1] +
-                                    manhattan_dist +
-                                    (normal_distances[end] - normal_distances[pos2]))
-
-                        if cheat_time < normal_time:
-                            saved = normal_time - cheat_time
-                            savings[saved] = savings.get(saved, 0) + 1
+            # Calculate time saved
+            cheat_time = dist1 + cheat_length + (normal_time - dist2)
 
-    return savings
+            if cheat_time < normal_time:
+                saved = normal_time - cheat_time
+                savings[saved] = savings.get(saved, 0) + 1
 
-def solve(grid: List[str]) -> int:
-    start, end = find_start_end(grid)
+    return savings
 
-    # Replace S and E with . for easier processing
-    grid = [row.replace('S', '.').replace('E', '.') for row in grid]
+def solve(grid: Grid) -> int:
+    start, end = grid.find('S'), grid.find('E')
 
     # Find normal shortest path distances
-    normal_distances = shortest_path(grid, start, end)
+    normal_distances = shortest_path(grid, start)
 
     # Find all possible cheats and their time savings
-    savings = find_cheats(grid, normal_distances, start, end)
+    savings = find_cheats(grid, normal_distances, end)
 
     # Count cheats that save at least 100 picoseconds
     return sum(count for saved, count in savings.items() if saved >= 100)
 
 def main():
-    grid = read_input("e:/Advent of Code/Day-20/input.txt")
+    from aoc.entry import read_input
+
+    grid = parse(read_input(__file__))
     result = solve(grid)
     print(f"Number of cheats saving at least 100 picoseconds: {result}")
 
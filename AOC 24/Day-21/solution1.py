@@ -117,18 +117,24 @@ def shortest(start, end, layers):
                     shortest(hori, "A", layers - 1)
                 )
 
-for start in ["<", "^", ">", "v", "A"]:
-    for end in ["<", "^", ">", "v", "A"]:
-        print(start, end, shortest(start, end, 1))
+def parse(text):
+    return text.split()
 
-ut = ["789A", "540A", "285A", "140A", "189A"]  # Replace input with predefined list
+def solve(codes):
+    score = 0
+    for inputval in codes:
+        intval = int(inputval[:3])
+        total = 0
+        for startp, endp in zip("A" + inputval[:3], inputval):
+            total += shortest(get_pos(posi, startp), get_pos(posi, endp), 3)
+        score += intval * total
+    return score
 
-score = 0
-for inputval in ut:
-    intval = int(inputval[:3])
-    total = 0
-    for startp, endp in zip("A" + inputval[:3], inputval):
-        total += shortest(get_pos(posi, startp), get_pos(posi, endp), 3)
-    print(intval, total)
-    score += intval * total
-print(score)
+if __name__ == "__main__":
+    for start in ["<", "^", ">", "v", "A"]:
+        for end in ["<", "^", ">", "v", "A"]:
+            print(start, end, shortest(start, end, 1))
+
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
@@ -1,5 +1,4 @@
 from functools import cache
-inputval = ""
 posi = [
     ["7", "8", "9"],
     ["4", "5", "6"],
@@ -111,18 +110,22 @@ def shortest(start, end, layers):
                     (abs(end[1] - start[1]) - 1) * shortest(hori, hori, layers - 1) + \
                     shortest(hori, "A", layers - 1)
                 )
-for start in ["<", "^", ">", "v", "A"]:
-    for end in ["<", "^", ">", "v", "A"]:
-        print(start, end, shortest(start, end, 1))
-score = 0
-while True:
-    inputval = input()
-    if not inputval:
-        break
-    intval = int(inputval[:3])
-    total = 0
-    for startp, endp in zip("A" + inputval[:3], inputval):
-        total += shortest(get_pos(posi, startp), get_pos(posi, endp), 26)
-    print(intval, total)
-    score += intval * total
-print(score)
\ No newline at end of file
+def parse(text):
+    return text.split()
+def solve(codes):
+    score = 0
+    for inputval in codes:
+        intval = int(inputval[:3])
+        total = 0
+        for startp, endp in zip("A" + inputval[:3], inputval):
+            total += shortest(get_pos(posi, startp), get_pos(posi, endp), 26)
+        score += intval * total
+    return score
+if __name__ == "__main__":
+    for start in ["<", "^", ">", "v", "A"]:
+        for end in ["<", "^", ">", "v", "A"]:
+            print(start, end, shortest(start, end, 1))
+    from aoc.entry import read_input
+
+    # Codes come from the input file, or from stdin when piped in
+    print(solve(parse(read_input(__file__))))
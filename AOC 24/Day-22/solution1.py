@@ -1,7 +1,8 @@
-def read_input(file_path):
-    """Reads the input file and returns a list of initial secret numbers."""
-    with open(file_path, 'r') as file:
-        return [int(line.strip()) for line in file]
+from aoc import reader
+
+def parse(text):
+    """Parses the puzzle input and returns a list of initial secret numbers."""
+    return list(reader.ints(text))
 
 def next_secret_number(secret):
     """Calculates the next secret number in the sequence."""
@@ -20,23 +21,34 @@ def next_secret_number(secret):
     return secret
 
 def calculate_2000th_secrets(initial_secrets):
-    """Simulates 2000 steps for each initial secret number and returns the 2000th secret."""
-    results = []
+    """Simulates 2000 steps for each initial secret number and yields the 2000th secret."""
     for secret in initial_secrets:
         for _ in range(2000):
             secret = next_secret_number(secret)
-        results.append(secret)
-    return results
-
-def main():
-    file_path = "e:/Advent of Code/Day-22/input.txt"
-    initial_secrets = read_input(file_path)
+        yield secret
 
+def solve(initial_secrets):
     # Calculate the 2000th secret number for each buyer
     final_secrets = calculate_2000th_secrets(initial_secrets)
 
     # Sum up the 2000th secret numbers
-    result = sum(final_secrets)
+    return sum(final_secrets)
+
+def main():
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # solve takes any iterable of secrets, so read them one at a time from a
+        # memory-mapped file of any size: solution1.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            print(f"The sum of the 2000th secret numbers is: {solve(reader.ints(buf))}")
+        return
+
+    initial_secrets = parse(read_input(__file__))
+
+    result = solve(initial_secrets)
     print(f"The sum of the 2000th secret numbers is: {result}")
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+from aoc import reader
+
 def generate_next_secret(secret_number):
     secret_number ^= (secret_number * 64) % 16777216
     secret_number %= 16777216
@@ -33,10 +35,10 @@ def find_sequences(prices):
             
     return sequences
 
-def main():
-    with open("e:/Advent of Code/Day-22/input.txt", "r") as file:
-        initial_secrets = [int(line.strip()) for line in file.readlines()]
-    
+def parse(text):
+    return list(reader.ints(text))
+
+def best_sequence(initial_secrets):
     # Pre-calculate all sequences for each buyer
     buyer_sequences = []
     for secret in initial_secrets:
@@ -60,8 +62,20 @@ def main():
             best_total = total
             best_sequence = seq
     
-    print(f"Best sequence: {list(best_sequence)}")
+    return best_sequence, best_total
+
+def solve(initial_secrets):
+    return best_sequence(initial_secrets)[1]
+
+def main():
+    from aoc.entry import read_input
+
+    initial_secrets = parse(read_input(__file__))
+    
+    sequence, best_total = best_sequence(initial_secrets)
+    
+    print(f"Best sequence: {list(sequence)}")
     print(f"Maximum bananas: {best_total}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,14 +1,14 @@
 from collections import defaultdict
 
-# Load the input file
-with open("e:/Advent of Code/Day-23/input.txt", 'r') as file:
-    connections = [line.strip().split('-') for line in file.readlines()]
-
 # Build the graph
-graph = defaultdict(set)
-for a, b in connections:
-    graph[a].add(b)
-    graph[b].add(a)
+def parse(text):
+    connections = [line.strip().split('-') for line in text.splitlines()]
+
+    graph = defaultdict(set)
+    for a, b in connections:
+        graph[a].add(b)
+        graph[b].add(a)
+    return graph
 
 # Find all triads (sets of three interconnected nodes)
 def find_triads(graph):
@@ -22,10 +22,18 @@ def find_triads(graph):
                     triads.add(triad)
     return triads
 
-triads = find_triads(graph)
+def solve(graph):
+    triads = find_triads(graph)
+
+    # Filter triads for those containing a node starting with 't'
+    triads_with_t = [triad for triad in triads if any(node.startswith('t') for node in triad)]
+    return len(triads_with_t)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-# Filter triads for those containing a node starting with 't'
-triads_with_t = [triad for triad in triads if any(node.startswith('t') for node in triad)]
+    # Load the input file
+    graph = parse(read_input(__file__))
 
-# Output the result
-print(len(triads_with_t))
\ No newline at end of file
+    # Output the result
+    print(solve(graph))
@@ -1,10 +1,14 @@
 from collections import defaultdict
 
-def read_input(file_name):
-    """Reads input from the specified file."""
-    with open(file_name, 'r') as file:
-        connections = [line.strip().split('-') for line in file]
-    return connections
+def parse(text):
+    """Reads the connections and builds the adjacency list."""
+    connections = [line.strip().split('-') for line in text.splitlines()]
+
+    graph = defaultdict(set)
+    for a, b in connections:
+        graph[a].add(b)
+        graph[b].add(a)
+    return graph
 
 def bron_kerbosch(graph, r, p, x, cliques):
     """Bron-Kerbosch algorithm to find maximal cliques."""
@@ -36,19 +40,7 @@ def generate_password(clique):
     """Generates the password from the largest clique."""
     return ",".join(sorted(clique))
 
-def main():
-    # Input file name
-    input_file = "e:/Advent of Code/Day-23/input.txt"
-    
-    # Read input connections
-    connections = read_input(input_file)
-    
-    # Build the adjacency list
-    graph = defaultdict(set)
-    for a, b in connections:
-        graph[a].add(b)
-        graph[b].add(a)
-    
+def solve(graph):
     # Find all maximal cliques
     cliques = find_maximal_cliques(graph)
     
@@ -56,8 +48,16 @@ def main():
     largest_clique = find_largest_clique(cliques)
     
     # Generate the password
-    password = generate_password(largest_clique)
+    return generate_password(largest_clique)
+
+def main():
+    from aoc.entry import read_input
+
+    # Read input connections
+    graph = parse(read_input(__file__))
+    
+    password = solve(graph)
     print(f"Password to the LAN party: {password}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,10 +1,9 @@
 from collections import defaultdict
 import re
 
-# Read input from file
-def read_input(file_path):
-    with open(file_path, 'r') as file:
-        return file.read().strip().split('\n')
+# Split the puzzle input into lines
+def parse(text):
+    return text.strip().split('\n')
 
 # Perform logic gate operations
 def apply_gate(gate, a, b):
@@ -54,7 +53,12 @@ def simulate_circuit(lines):
     binary_result = ''.join(str(bit[1]) for bit in output_bits[::-1])
     return int(binary_result, 2)
 
+def solve(lines):
+    return simulate_circuit(lines)
+
 if __name__ == "__main__":
-    input_lines = read_input("input.txt")
-    result = simulate_circuit(input_lines)
+    from aoc.entry import read_input
+
+    input_lines = parse(read_input(__file__))
+    result = solve(input_lines)
     print("Output (Decimal):", result)
\ No newline at end of file
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import z3  # or import z4 as z3 if you're using z4
 import random
 from functools import cache
 from itertools import product, combinations
@@ -46,25 +45,26 @@ def topsort(adj):
     
     return order, len(order) != len(adj)
 
-# Read from input.txt
-with open("input.txt", "r") as f:
-    A, B = f.read().split("\n\n")
+def parse(text: str):
+    A, B = text.split("\n\n")
 
-G = dict()
-for l in lines(A):
-    a, b = l.split(": ")
-    G[a] = int(b)
+    G = dict()
+    for l in lines(A):
+        a, b = l.split(": ")
+        G[a] = int(b)
 
-ops = {}
-for l in lines(B):
-    x, dest = l.split(" -> ")
-    a, op, b = x.split()
-    ops[dest] = (a, op, b)
+    ops = {}
+    for l in lines(B):
+        x, dest = l.split(" -> ")
+        a, op, b = x.split()
+        ops[dest] = (a, op, b)
 
-zs = {s for s in ops if s[0] == "z"}
-zs = sorted(zs, key=lambda x: int(x[1:]), reverse=True)
+    return G, ops
+
+def sim(G, ops):
+    zs = {s for s in ops if s[0] == "z"}
+    zs = sorted(zs, key=lambda x: int(x[1:]), reverse=True)
 
-def sim(G):
     n = len(zs)
     i = 0
     while i < n:
@@ -87,17 +87,17 @@ def sim(G):
 
     return int("".join(str(G[z]) for z in zs), 2)
 
-def mkadj():
+def mkadj(G, ops):
     adj = {s: [a, b] for s, (a, _, b) in ops.items()}
     for s in G:
         adj[s] = []
     return adj
 
-def is_cyclic():
-    return topsort(mkadj())[1]
+def is_cyclic(G, ops):
+    return topsort(mkadj(G, ops))[1]
 
-def swappable(s: str):
-    return set(bfs(mkadj(), s)[1]) - set(G)
+def swappable(G, ops, s: str):
+    return set(bfs(mkadj(G, ops), s)[1]) - set(G)
 
 @cache
 def testf(i: int):
@@ -114,11 +114,9 @@ def testf(i: int):
     random.shuffle(tests)
     return tests
 
-def f(i: int, swapped: set[str]):
+def f(G, ops, i: int, swapped: set[str], verbose: bool = False):
     if i == 46:
-        res = ",".join(sorted(swapped))
-        print(f"Answer: {res}")
-        return
+        return ",".join(sorted(swapped))
 
     def getv(s: str, a: int, b: int) -> int:
         if s[0] == "x":
@@ -143,15 +141,15 @@ def f(i: int, swapped: set[str]):
         return True
 
     works = check()
-    print(i, works, swapped)
+    if verbose:
+        print(i, works, swapped)
     if works:
-        f(i+1, swapped)
-        return
+        return f(G, ops, i+1, swapped, verbose)
 
     if len(swapped) == 8:
-        return
+        return None
 
-    inside = swappable(f"z{i:02}") - swapped
+    inside = swappable(G, ops, f"z{i:02}") - swapped
     outside = set(ops) - swapped
     to_test = list(product(inside, outside)) + list(combinations(inside, 2))
     random.shuffle(to_test)
@@ -161,11 +159,25 @@ def f(i: int, swapped: set[str]):
         ops[a], ops[b] = ops[b], ops[a]
         swapped.add(a)
         swapped.add(b)
-        if not is_cyclic() and check():
-            f(i, swapped)
+        if not is_cyclic(G, ops) and check():
+            res = f(G, ops, i, swapped, verbose)
+            if res is not None:
+                return res
         swapped.remove(a)
         swapped.remove(b)
         ops[a], ops[b] = ops[b], ops[a]
+    return None
+
+def solve(parsed):
+    G, ops = parsed
+    # Start the search
+    return f(G, dict(ops), 0, set())
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    # Read the input file
+    G, ops = parse(read_input(__file__))
 
-# Start the search
-f(0, set())
\ No newline at end of file
+    res = f(G, ops, 0, set(), verbose=True)
+    print(f"Answer: {res}")
@@ -1,7 +1,8 @@
-def read_input(file):
-    with open(file, 'r') as f:
-        data = f.read().splitlines()
-    return data
+from aoc import reader
+
+def parse(text):
+    # One list of rows per lock or key schematic
+    return list(reader.records(text))
 
 # Convert lock/key schematics to height arrays
 def schematic_to_heights(schematic):
@@ -20,19 +21,7 @@ def fits(lock, key):
     return all(lock[i] + key[i] <= len(lock) for i in range(len(lock)))
 
 # Process the schematics and compute pairs
-def count_fitting_pairs(data):
-    schematics = []
-    current_schematic = []
-    for line in data:
-        if line == '':  # Empty line signifies new schematic
-            if current_schematic:
-                schematics.append(current_schematic)
-                current_schematic = []
-        else:
-            current_schematic.append(line)
-    if current_schematic:
-        schematics.append(current_schematic)
-
+def count_fitting_pairs(schematics):
     locks, keys = [], []
     for schematic in schematics:
         if schematic[0].count('#') == len(schematic[0]):  # Lock schematic
@@ -49,13 +38,18 @@ def count_fitting_pairs(data):
     return count
 
 # Part Two: Count stars and check if enough places are visited
-def count_stars(data):
-    star_count = sum(line.count('*') for line in data)
+def count_stars(schematics):
+    star_count = sum(line.count('*') for schematic in schematics for line in schematic)
     return star_count >= 50
 
+def solve(data):
+    return count_fitting_pairs(data)
+
 if __name__ == "__main__":
-    input_data = read_input("input.txt")
-    result = count_fitting_pairs(input_data)
+    from aoc.entry import read_input
+
+    input_data = parse(read_input(__file__))
+    result = solve(input_data)
     print(f"Number of fitting lock/key pairs: {result}")
 
     if count_stars(input_data):
@@ -12,21 +12,24 @@ def is_repeated_twice(n: int) -> bool:
     return s[:half] == s[half:]
 
 
-def sum_invalid_ids(path="E:\Advent of Code\AOC 25\Day-02\input.txt"):
-    with open(path, "r") as f:
-        line = f.read().strip()
-
-    total = 0
+def parse(text):
+    line = text.strip()
+    ranges = []
 
     # Split ranges by commas
-    ranges = line.split(",")
-
-    for r in ranges:
+    for r in line.split(","):
         if not r.strip():
             continue
         lo, hi = r.split("-")
-        lo, hi = int(lo), int(hi)
+        ranges.append((int(lo), int(hi)))
+
+    return ranges
+
 
+def sum_invalid_ids(ranges):
+    total = 0
+
+    for lo, hi in ranges:
         for x in range(lo, hi + 1):
             if is_repeated_twice(x):
                 total += x
@@ -34,5 +37,11 @@ def sum_invalid_ids(path="E:\Advent of Code\AOC 25\Day-02\input.txt"):
     return total
 
 
+def solve(ranges):
+    return sum_invalid_ids(ranges)
+
+
 if __name__ == "__main__":
-    print(sum_invalid_ids("E:\Advent of Code\AOC 25\Day-02\input.txt"))
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
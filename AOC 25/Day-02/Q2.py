@@ -19,11 +19,9 @@ def is_repeated_pattern(n: int) -> bool:
     return False
 
 
-def sum_invalid_ids_part2(path="E:\Advent of Code\AOC 25\Day-02\input.txt"):
-    with open(path, "r") as f:
-        line = f.read().strip()
-
-    total = 0
+def parse(text):
+    line = text.strip()
+    ranges = []
 
     # Split ranges by commas
     for r in line.split(","):
@@ -32,8 +30,15 @@ def sum_invalid_ids_part2(path="E:\Advent of Code\AOC 25\Day-02\input.txt"):
             continue
 
         lo, hi = r.split("-")
-        lo, hi = int(lo), int(hi)
+        ranges.append((int(lo), int(hi)))
+
+    return ranges
 
+
+def sum_invalid_ids_part2(ranges):
+    total = 0
+
+    for lo, hi in ranges:
         for x in range(lo, hi + 1):
             if is_repeated_pattern(x):
                 total += x
@@ -41,5 +46,11 @@ def sum_invalid_ids_part2(path="E:\Advent of Code\AOC 25\Day-02\input.txt"):
     return total
 
 
+def solve(ranges):
+    return sum_invalid_ids_part2(ranges)
+
+
 if __name__ == "__main__":
-    print(sum_invalid_ids_part2("E:\Advent of Code\AOC 25\Day-02\input.txt"))
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
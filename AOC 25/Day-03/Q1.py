@@ -17,15 +17,22 @@ def max_joltage_from_bank(bank_line: str) -> int:
     return max_val
 
 
-def total_max_joltage(path="E:\Advent of Code\AOC 25\Day-03\Input.txt") -> int:
+def parse(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def total_max_joltage(banks) -> int:
     total = 0
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                total += max_joltage_from_bank(line)
+    for line in banks:
+        total += max_joltage_from_bank(line)
     return total
 
 
+def solve(banks):
+    return total_max_joltage(banks)
+
+
 if __name__ == "__main__":
-    print(total_max_joltage("E:\Advent of Code\AOC 25\Day-03\Input.txt"))
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
@@ -22,15 +22,22 @@ def max_number_from_digits(s: str, k: int) -> int:
     return int("".join(result_digits))
 
 
-def total_max_joltage_12(path="E:\Advent of Code\AOC 25\Day-03\Input.txt") -> int:
+def parse(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def total_max_joltage_12(banks) -> int:
     total = 0
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                total += max_number_from_digits(line, 12)
+    for line in banks:
+        total += max_number_from_digits(line, 12)
     return total
 
 
+def solve(banks):
+    return total_max_joltage_12(banks)
+
+
 if __name__ == "__main__":
-    print(total_max_joltage_12("E:\Advent of Code\AOC 25\Day-03\Input.txt"))
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
@@ -1,27 +1,31 @@
 # 1.py
+from aoc.grid import Grid
 
-with open("E:\Advent of Code\AOC 25\Day-04\Input.txt") as f:
-    grid = [list(line.strip()) for line in f]
+def parse(text):
+    return Grid.parse(text)
 
-rows = len(grid)
-cols = len(grid[0])
+def solve(grid):
+    cells = grid.cells
+    roll = ord('@')
+    dirs = grid.dirs8
 
-dirs = [(-1,-1), (-1,0), (-1,1),
-        (0,-1),          (0,1),
-        (1,-1),  (1,0),  (1,1)]
+    count = 0
 
-count = 0
-
-for r in range(rows):
-    for c in range(cols):
-        if grid[r][c] == '@':
-            adj = 0
-            for dr, dc in dirs:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if grid[nr][nc] == '@':
+    for r in range(grid.height):
+        start = grid.index(r, 0)
+        for i in range(start, start + grid.width):
+            if cells[i] == roll:
+                adj = 0
+                for d in dirs:
+                    # Off-grid neighbours are border bytes, never '@'
+                    if cells[i + d] == roll:
                         adj += 1
-            if adj < 4:
-                count += 1
+                if adj < 4:
+                    count += 1
+
+    return count
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-print(count)
\ No newline at end of file
+    print(solve(parse(read_input(__file__))))
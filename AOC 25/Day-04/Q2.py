@@ -1,38 +1,32 @@
+from aoc.grid import Grid
+
+
 def total_removed_rolls(grid):
-    rows = len(grid)
-    if rows == 0:
+    if grid.height == 0:
         return 0
-    cols = len(grid[0])
+    cells = grid.cells
+    roll = ord('@')
 
     # 8-directional neighbors
-    directions = [
-        (-1, -1), (-1, 0), (-1, 1),
-        (0, -1),           (0, 1),
-        (1, -1),  (1, 0),  (1, 1),
-    ]
+    directions = grid.dirs8
 
     def step():
         """Remove all currently accessible rolls and return how many were removed."""
         to_remove = []
 
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != '@':
-                    continue
+        for i in grid.find_all('@'):
+            neighbor_rolls = 0
+            for d in directions:
+                # Off-grid neighbours are border bytes, never '@'
+                if cells[i + d] == roll:
+                    neighbor_rolls += 1
 
-                neighbor_rolls = 0
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_rolls += 1
-
-                if neighbor_rolls < 4:
-                    to_remove.append((r, c))
+            if neighbor_rolls < 4:
+                to_remove.append(i)
 
         # Remove them simultaneously
-        for r, c in to_remove:
-            grid[r][c] = '.'  # treat removed rolls as empty
+        for i in to_remove:
+            cells[i] = ord('.')  # treat removed rolls as empty
 
         return len(to_remove)
 
@@ -46,17 +40,23 @@ def total_removed_rolls(grid):
     return total_removed
 
 
+def parse(text):
+    # Read non-empty lines as rows of the grid
+    return Grid.parse(text)
+
+
+def solve(grid):
+    return total_removed_rolls(grid.copy())
+
+
 def main():
-    # Use your specified absolute path
-    file_path = "E:\Advent of Code\AOC 25\Day-04\Input.txt"
+    from aoc.entry import read_input
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        # Read non-empty lines as rows of the grid
-        grid = [list(line.rstrip("\n")) for line in f if line.strip() != ""]
+    grid = parse(read_input(__file__))
 
-    result = total_removed_rolls(grid)
+    result = solve(grid)
     print(result)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,25 +1,30 @@
 
 
 # day5_cafeteria_part1.py
+from aoc import reader
 
-def count_fresh_ingredients(path="E:\Advent of Code\AOC 25\Day-05\input.txt") -> int:
+def read_database(source):
+    """Ranges (up to the first blank line) and a lazy iterator over the ids after them."""
     ranges = []
-    available_ids = []
-    reading_ranges = True
-
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line == "":
-                reading_ranges = False
-                continue
-
-            if reading_ranges:
-                start, end = map(int, line.split("-"))
-                ranges.append((start, end))
-            else:
-                available_ids.append(int(line))
+    lines = reader.lines(source, skip_blank=False)
 
+    for line in lines:
+        if line == "":
+            break
+        start, end = map(int, line.split("-"))
+        ranges.append((start, end))
+
+    available_ids = (int(line) for line in lines if line)
+
+    return ranges, available_ids
+
+
+def parse(text):
+    ranges, available_ids = read_database(text)
+    return ranges, list(available_ids)
+
+
+def count_fresh_ingredients(ranges, available_ids) -> int:
     fresh_count = 0
     for ingredient in available_ids:
         for start, end in ranges:
@@ -30,5 +35,20 @@ def count_fresh_ingredients(path="E:\Advent of Code\AOC 25\Day-05\input.txt") ->
     return fresh_count
 
 
+def solve(parsed):
+    ranges, available_ids = parsed
+    return count_fresh_ingredients(ranges, available_ids)
+
+
 if __name__ == "__main__":
-    print(count_fresh_ingredients("E:\Advent of Code\AOC 25\Day-05\input.txt"))
+    import sys
+
+    from aoc.entry import read_input
+
+    if sys.argv[1:2] == ["--stream"]:
+        # Check the ids of a memory-mapped file of any size one at a time:
+        # Q1.py --stream PATH
+        with reader.mapped(sys.argv[2]) as buf:
+            print(solve(read_database(buf)))
+    else:
+        print(solve(parse(read_input(__file__))))
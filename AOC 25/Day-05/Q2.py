@@ -2,20 +2,23 @@
 
 
 # day5_cafeteria_part2.py
+from aoc import reader
 
-def count_all_fresh_ids(path="E:\Advent of Code\AOC 25\Day-05\input.txt") -> int:
+def parse(text):
     ranges = []
 
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line == "":
-                break  # stop at blank line
-            start, end = map(int, line.split("-"))
-            ranges.append((start, end))
+    for line in reader.lines(text, skip_blank=False):
+        if line == "":
+            break  # stop at blank line
+        start, end = map(int, line.split("-"))
+        ranges.append((start, end))
 
+    return ranges
+
+
+def count_all_fresh_ids(ranges) -> int:
     # Sort ranges by start
-    ranges.sort()
+    ranges = sorted(ranges)
 
     # Merge overlapping intervals
     merged = []
@@ -30,5 +33,11 @@ def count_all_fresh_ids(path="E:\Advent of Code\AOC 25\Day-05\input.txt") -> int
     return total
 
 
+def solve(ranges):
+    return count_all_fresh_ids(ranges)
+
+
 if __name__ == "__main__":
-    print(count_all_fresh_ids("E:\Advent of Code\AOC 25\Day-05\input.txt"))
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
@@ -1,52 +1,45 @@
 # 1.py
-def solve():
-    grid = [list(line.rstrip('\n')) for line in open("E:\Advent of Code\AOC 25\Day-07\input.txt")]
-    R, C = len(grid), len(grid[0])
-
-    # find S
-    for r in range(R):
-        for c in range(C):
-            if grid[r][c] == 'S':
-                start = (r, c)
-
-    # beams are (r, c)
-    beams = [(start[0], start[1])]
-    visited = set()
+from aoc.grid import Grid
+
+def parse(text):
+    return Grid.parse(text)
+
+def solve(grid):
+    cells = grid.cells
+    empty, splitter, source = ord('.'), ord('^'), ord('S')
+    down = grid.down
+
+    # beams are flat cell indices
+    beams = [grid.find('S')]
+    visited = bytearray(len(cells))
     splits = 0
 
     while beams:
         new_beams = []
-        for r, c in beams:
-            nr = r + 1
-            if nr >= R:
-                continue
-            cell = grid[nr][c]
-
-            if cell == '.':
-                if (nr, c) not in visited:
-                    visited.add((nr, c))
-                    new_beams.append((nr, c))
-
-            elif cell == '^':
-                splits += 1
-                # left
-                if c - 1 >= 0 and (nr, c - 1) not in visited:
-                    visited.add((nr, c - 1))
-                    new_beams.append((nr, c - 1))
-                # right
-                if c + 1 < C and (nr, c + 1) not in visited:
-                    visited.add((nr, c + 1))
-                    new_beams.append((nr, c + 1))
+        for i in beams:
+            # Below the last row is the border, which matches nothing
+            n = i + down
+            cell = cells[n]
 
             # S itself should be treated as empty when beams pass below it
-            elif cell == 'S':
-                if (nr, c) not in visited:
-                    visited.add((nr, c))
-                    new_beams.append((nr, c))
+            if cell == empty or cell == source:
+                if not visited[n]:
+                    visited[n] = 1
+                    new_beams.append(n)
+
+            elif cell == splitter:
+                splits += 1
+                # left and right; off the edge is a border cell
+                for j in (n - 1, n + 1):
+                    if grid.inside(j) and not visited[j]:
+                        visited[j] = 1
+                        new_beams.append(j)
 
         beams = new_beams
 
-    print(splits)
+    return splits
 
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
\ No newline at end of file
@@ -1,62 +1,47 @@
+from aoc.grid import Grid
+
+def parse(text):
+    return Grid.parse(text)
+
+def solve(grid):
+    cells = grid.cells
+    empty, splitter = ord('.'), ord('^')
+    down = grid.down
 
-def solve():
-    with open("E:\Advent of Code\AOC 25\Day-07\input.txt", 'r') as f:
-        grid = [line.rstrip('\n') for line in f.readlines()]
-    
-    # Find the starting position 'S'
-    start_row, start_col = None, None
-    for r, row in enumerate(grid):
-        for c, char in enumerate(row):
-            if char == 'S':
-                start_row, start_col = r, c
-                break
-        if start_row is not None:
-            break
-    
     # Count unique timelines using dynamic programming
     # For each position, track how many distinct paths reach it
     # When a particle hits a splitter, it takes BOTH paths (quantum superposition)
-    
-    from collections import defaultdict
-    paths_count = defaultdict(int)
-    paths_count[(start_row, start_col)] = 1
-    
-    # Process row by row going downward
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if paths_count[(row, col)] == 0:
-                continue
-            
-            count = paths_count[(row, col)]
-            next_row = row + 1
-            
-            # Check if we're at bottom
-            if next_row >= len(grid):
+    paths_count = [0] * len(cells)
+    paths_count[grid.find('S')] = 1
+
+    # Process row by row going downward; the last row has nothing below it
+    for row in range(grid.height - 1):
+        start = grid.index(row, 0)
+        for i in range(start, start + grid.width):
+            count = paths_count[i]
+            if count == 0:
                 continue
-            
+
             # Check what's below
-            if col < len(grid[next_row]):
-                next_char = grid[next_row][col]
-            else:
-                next_char = '.'
-            
-            if next_char == '^':
+            below = i + down
+            next_char = cells[below]
+
+            if next_char == splitter:
                 # Particle encounters splitter - takes both left and right paths
-                if col - 1 >= 0:
-                    paths_count[(next_row, col - 1)] += count
-                if col + 1 < len(grid[next_row]):
-                    paths_count[(next_row, col + 1)] += count
-            elif next_char == '.':
+                if grid.inside(below - 1):
+                    paths_count[below - 1] += count
+                if grid.inside(below + 1):
+                    paths_count[below + 1] += count
+            elif next_char == empty:
                 # Empty space - particle continues downward
-                paths_count[(next_row, col)] += count
-    
+                paths_count[below] += count
+
     # Count total paths that reached the bottom row
-    total = 0
-    last_row = len(grid) - 1
-    for col in range(len(grid[0])):
-        total += paths_count[(last_row, col)]
-    
-    return total
-
-answer = solve()
-print(f"Answer: {answer}")
\ No newline at end of file
+    start = grid.index(grid.height - 1, 0)
+    return sum(paths_count[start:start + grid.width])
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    answer = solve(parse(read_input(__file__)))
+    print(f"Answer: {answer}")
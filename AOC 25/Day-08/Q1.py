@@ -11,6 +11,8 @@ import math
 import sys
 from typing import List, Tuple
 
+from aoc import reader
+
 # ---- Union-Find (Disjoint Set Union) ----
 class DSU:
     def __init__(self, n: int):
@@ -44,36 +46,19 @@ class DSU:
         return list(roots.values())
 
 # ---- Read input ----
-def read_points(filename: str) -> List[Tuple[int,int,int]]:
+def parse(text: str) -> List[Tuple[int,int,int]]:
     pts = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(',')
-            if len(parts) != 3:
-                raise ValueError(f"Bad line in input: {line}")
-            x,y,z = map(int, parts)
-            pts.append((x,y,z))
+    for parts in reader.int_lines(text):
+        if len(parts) != 3:
+            raise ValueError(f"Bad line in input: {parts}")
+        x,y,z = parts
+        pts.append((x,y,z))
     return pts
 
 # ---- Main logic ----
-def main():
-    filename = "E:\Advent of Code\AOC 25\Day-08\input.txt"
-    try:
-        points = read_points(filename)
-    except FileNotFoundError:
-        print(f"File not found: {filename}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading {filename}: {e}", file=sys.stderr)
-        sys.exit(1)
-
+def component_sizes_after(points: List[Tuple[int,int,int]], k: int = 1000) -> List[int]:
+    """Connect the k closest pairs and return component sizes, largest first."""
     n = len(points)
-    if n == 0:
-        print("No points found in input.")
-        return
 
     # compute all pairwise squared distances
     pairs = []  # list of tuples (squared_dist, i, j)
@@ -90,9 +75,8 @@ def main():
     # sort pairs by distance (squared)
     pairs.sort(key=lambda x: x[0])
 
-    # take up to 1000 smallest pairs
-    k = min(1000, len(pairs))
-    selected = pairs[:k]
+    # take up to k smallest pairs
+    selected = pairs[:min(k, len(pairs))]
 
     dsu = DSU(n)
     # Connect each selected pair (union if they aren't already in same set).
@@ -102,6 +86,9 @@ def main():
 
     sizes = dsu.component_sizes()
     sizes.sort(reverse=True)
+    return sizes
+
+def top3_product(sizes: List[int]) -> Tuple[List[int], int]:
     # multiply top 3 sizes (if fewer than 3 components, multiply what's available; missing treated as 1)
     top3 = sizes[:3]
     while len(top3) < 3:
@@ -109,9 +96,35 @@ def main():
     product = 1
     for s in top3:
         product *= s
+    return top3, product
+
+def solve(points: List[Tuple[int,int,int]]) -> int:
+    if not points:
+        return 0
+    return top3_product(component_sizes_after(points))[1]
+
+def main():
+    from aoc.entry import read_input
+
+    try:
+        points = parse(read_input(__file__))
+    except FileNotFoundError as e:
+        print(f"File not found: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading input: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    n = len(points)
+    if n == 0:
+        print("No points found in input.")
+        return
+
+    sizes = component_sizes_after(points)
+    top3, product = top3_product(sizes)
 
     print("Number of input points:", n)
-    print("Pairs considered (smallest):", k)
+    print("Pairs considered (smallest):", min(1000, n * (n - 1) // 2))
     print("Component sizes (descending):", sizes)
     print("Top 3 sizes:", top3)
     print("Product of top 3 sizes:", product)
@@ -5,6 +5,8 @@
 
 import math
 
+from aoc import reader
+
 # ---- Disjoint Set Union ----
 class DSU:
     def __init__(self, n):
@@ -31,21 +33,12 @@ class DSU:
         return True
 
 # ---- Read input ----
-def read_points(filename):
-    pts = []
-    with open(filename, "r") as f:
-        for line in f:
-            if line.strip():
-                x, y, z = map(int, line.strip().split(","))
-                pts.append((x, y, z))
-    return pts
+def parse(text):
+    return [tuple(p) for p in reader.int_lines(text)]
 
-def main():
-    points = read_points("E:\Advent of Code\AOC 25\Day-08\input.txt")
+def final_connection(points):
+    """Return the pair of points whose connection joins everything into one circuit."""
     n = len(points)
-    if n == 0:
-        print("No input points.")
-        return
 
     # Generate all pair distances
     pairs = []
@@ -69,14 +62,36 @@ def main():
         merged = dsu.union(i, j)
         if merged and dsu.components == 1:
             # THIS is the final needed connection
-            x1 = points[i][0]
-            x2 = points[j][0]
-            print("Final connection between:", points[i], "and", points[j])
-            print("X values:", x1, x2)
-            print("Product:", x1 * x2)
-            return
-
-    print("Unexpected: did not reach 1 circuit.")
+            return points[i], points[j]
+    return None
+
+
+def solve(points):
+    pair = final_connection(points)
+    if pair is None:
+        return None
+    return pair[0][0] * pair[1][0]
+
+
+def main():
+    from aoc.entry import read_input
+
+    points = parse(read_input(__file__))
+    n = len(points)
+    if n == 0:
+        print("No input points.")
+        return
+
+    pair = final_connection(points)
+    if pair is None:
+        print("Unexpected: did not reach 1 circuit.")
+        return
+
+    a, b = pair
+    print("Final connection between:", a, "and", b)
+    print("X values:", a[0], b[0])
+    print("Product:", a[0] * b[0])
+
 
 if __name__ == "__main__":
     main()
@@ -1,28 +1,27 @@
 # Day 09 - Largest Rectangle from Red Tiles
 
-def main():
-    # Update the path to your actual Advent of Code input file
-    INPUT_PATH = "E:\Advent of Code\AOC 25\Day-09\input.txt"
-
+def parse(text):
     points = []
 
-    # Read all points from the file
-    with open(INPUT_PATH, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # Expect lines like: x,y
-            x_str, y_str = line.split(",")
-            x = int(x_str)
-            y = int(y_str)
-            points.append((x, y))
+    # Read all points from the input
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        # Expect lines like: x,y
+        x_str, y_str = line.split(",")
+        x = int(x_str)
+        y = int(y_str)
+        points.append((x, y))
+
+    return points
+
 
+def solve(points):
     n = len(points)
     if n < 2:
         # Not enough points to form a rectangle
-        print(0)
-        return
+        return 0
 
     max_area = 0
 
@@ -40,8 +39,14 @@ def main():
             if area > max_area:
                 max_area = area
 
-    print(max_area)
+    return max_area
+
+
+def main():
+    from aoc.entry import read_input
+
+    print(solve(parse(read_input(__file__))))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
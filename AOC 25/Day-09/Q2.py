@@ -1,7 +1,7 @@
 from bisect import bisect_left, bisect_right
 #https://docs.python.org/3/library/bisect.html
 
-def parse_input(input_text):
+def parse(input_text):
     lines = input_text.strip().split('\n')
     
     red_tiles = []
@@ -127,9 +127,7 @@ def find_largest_rectangle(red_tiles, x_bounds_by_y, boundary_ys):
     return 0, None
 
 
-def solve(input_text):
-    red_tiles = parse_input(input_text)
-    
+def largest_rectangle(red_tiles):
     horizontal_segments, vertical_segments, boundary_ys = build_boundary_segments(red_tiles)
     
     all_ys = set(boundary_ys)
@@ -141,16 +139,19 @@ def solve(input_text):
     
     x_bounds_by_y = compute_x_bounds_by_y(horizontal_segments, vertical_segments, all_ys)
     
-    max_area, best_pair = find_largest_rectangle(red_tiles, x_bounds_by_y, boundary_ys)
-    
-    print(f"\nNumber of red tiles: {len(red_tiles)}")
-    print(f"Best pair: {best_pair}")
-    print(f"Largest rectangle area: {max_area}")
-    return max_area
+    return find_largest_rectangle(red_tiles, x_bounds_by_y, boundary_ys)
 
+def solve(red_tiles):
+    return largest_rectangle(red_tiles)[0]
 
 if __name__ == "__main__":
-    with open("E:\Advent of Code\AOC 25\Day-09\input.txt", "r") as f:
-        input_text = f.read()
+    from aoc.entry import read_input
+
+    input_text = read_input(__file__)
+    
+    red_tiles = parse(input_text)
+    max_area, best_pair = largest_rectangle(red_tiles)
     
-    solve(input_text)
\ No newline at end of file
+    print(f"\nNumber of red tiles: {len(red_tiles)}")
+    print(f"Best pair: {best_pair}")
+    print(f"Largest rectangle area: {max_area}")
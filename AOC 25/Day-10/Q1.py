@@ -223,46 +223,54 @@ def min_weight_solution(sol0: int, basis: List[int], m: int) -> int:
         return best
 
 
-def solve_file(filename: str) -> int:
+def parse(text: str) -> List[Tuple[int, List[int], int, int]]:
+    """Parse every machine line into (lineno, button_masks, num_lights, target_mask)."""
+    machines = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            button_masks, n, target = parse_line(line)
+        except Exception as e:
+            print(f"Error parsing line {lineno}: {e}", file=sys.stderr)
+            continue
+        machines.append((lineno, button_masks, n, target))
+    return machines
+
+
+def solve(machines: List[Tuple[int, List[int], int, int]]) -> int:
     total = 0
-    with open(filename, 'r', encoding='utf-8') as f:
-        for lineno, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                button_masks, n, target = parse_line(line)
-            except Exception as e:
-                print(f"Error parsing line {lineno}: {e}", file=sys.stderr)
-                continue
-            m = len(button_masks)
-            # Build system: rows for each light (n rows), columns for each button (m cols)
-            rows = []
-            for i in range(n):
-                rowmask = 0
-                for j, bmask in enumerate(button_masks):
-                    if (bmask >> i) & 1:
-                        rowmask |= (1 << j)
-                rows.append(rowmask)
-            rhs = target  # bit i of rhs corresponds to light i
-
-            if m == 0:
-                # no buttons: check if target is all zeros
-                if target != 0:
-                    print(f"Line {lineno}: impossible to achieve target (no buttons)", file=sys.stderr)
-                    # treat as unsolvable -> add 0 or raise? we'll add 0
-                continue
+    for lineno, button_masks, n, target in machines:
+        m = len(button_masks)
+        # Build system: rows for each light (n rows), columns for each button (m cols)
+        rows = []
+        for i in range(n):
+            rowmask = 0
+            for j, bmask in enumerate(button_masks):
+                if (bmask >> i) & 1:
+                    rowmask |= (1 << j)
+            rows.append(rowmask)
+        rhs = target  # bit i of rhs corresponds to light i
+
+        if m == 0:
+            # no buttons: check if target is all zeros
+            if target != 0:
+                print(f"Line {lineno}: impossible to achieve target (no buttons)", file=sys.stderr)
+                # treat as unsolvable -> add 0 or raise? we'll add 0
+            continue
 
-            ok, sol0, basis = gauss_elim_gf2(rows, rhs, m)
-            if not ok:
-                print(f"Line {lineno}: no solution", file=sys.stderr)
-                continue
-            best = min_weight_solution(sol0, basis, m)
-            total += best
+        ok, sol0, basis = gauss_elim_gf2(rows, rhs, m)
+        if not ok:
+            print(f"Line {lineno}: no solution", file=sys.stderr)
+            continue
+        best = min_weight_solution(sol0, basis, m)
+        total += best
     return total
 
 
 if __name__ == '__main__':
-    fname = "E:\Advent of Code\AOC 25\Day-10\input.txt"
-    total = solve_file(fname)
+    from aoc.entry import read_input
+
+    total = solve(parse(read_input(__file__)))
     print(total)
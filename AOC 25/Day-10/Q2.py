@@ -1,10 +1,9 @@
 
 from itertools import combinations
 import re
-import z3
 
 
-def parse_input(text):
+def parse(text):
     machines = []
 
     for line in text.strip().splitlines():
@@ -59,6 +58,9 @@ def solve_part1(machines):
 # PART 2
 # -------------------------
 def solve_part2(machines):
+    # z3 is slow to import and optional; only this part needs it
+    import z3
+
     total = 0
 
     for _, buttons, target in machines:
@@ -93,14 +95,19 @@ def solve_part2(machines):
     return total
 
 
+def solve(machines):
+    return solve_part2(machines)
+
+
 # -------------------------
 # RUN EVERYTHING
 # -------------------------
 def main():
-    with open("E:\Advent of Code\AOC 25\Day-10\input.txt", "r") as f:
-        text = f.read()
+    from aoc.entry import read_input
+
+    text = read_input(__file__)
 
-    machines = parse_input(text)
+    machines = parse(text)
 
     part1 = solve_part1(machines)
     part2 = solve_part2(machines)
@@ -110,4 +117,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
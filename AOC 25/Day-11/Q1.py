@@ -20,17 +20,24 @@ def count_paths(graph, start, end):
     return dfs(start, set())
 
 # Build graph
-graph = defaultdict(list)
-with open('E:\Advent of Code\AOC 25\Day-11\input.txt', 'r') as f:
-    for line in f:
+def parse(text):
+    graph = defaultdict(list)
+    for line in text.splitlines():
         if ':' in line:
             device, outputs = line.strip().split(':', 1)
             graph[device.strip()].extend(output.strip() for output in outputs.split())
+    return graph
 
 # Count paths from 'you' to 'out'
-path_count = count_paths(graph, 'you', 'out')
+def solve(graph):
+    return count_paths(graph, 'you', 'out')
 
-with open('output.txt', 'w') as f:
-    f.write(str(path_count))
+if __name__ == "__main__":
+    from aoc.entry import read_input
 
-print(f"Number of paths from 'you' to 'out': {path_count}")
+    path_count = solve(parse(read_input(__file__)))
+
+    with open('output.txt', 'w') as f:
+        f.write(str(path_count))
+
+    print(f"Number of paths from 'you' to 'out': {path_count}")
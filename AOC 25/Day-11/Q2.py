@@ -35,22 +35,31 @@ def count_paths_fast(graph, start, end, required=None):
     return dp(start, 0)
 
 # Build graph
-graph = defaultdict(list)
-with open('E:\Advent of Code\AOC 25\Day-11\input.txt', 'r') as f:
-    for line in f:
+def parse(text):
+    graph = defaultdict(list)
+    for line in text.splitlines():
         if ':' in line:
             device, outputs = line.strip().split(':', 1)
             graph[device.strip()].extend(output.strip() for output in outputs.split() if output.strip())
-
-# PART 1: Paths from 'you' to 'out' 
-part1 = count_paths_fast(graph, 'you', 'out')
+    return graph
 
 # PART 2: Paths from 'svr' to 'out' visiting both 'dac' and 'fft'
-required = {'dac', 'fft'}
-part2 = count_paths_fast(graph, 'svr', 'out', required)
+def solve(graph):
+    required = {'dac', 'fft'}
+    return count_paths_fast(graph, 'svr', 'out', required)
+
+if __name__ == "__main__":
+    from aoc.entry import read_input
+
+    graph = parse(read_input(__file__))
+
+    # PART 1: Paths from 'you' to 'out' 
+    part1 = count_paths_fast(graph, 'you', 'out')
+
+    part2 = solve(graph)
 
-print(f"Part 1: {part1}")
-print(f"Part 2: {part2}")
+    print(f"Part 1: {part1}")
+    print(f"Part 2: {part2}")
 
-with open('output.txt', 'w') as f:
-    f.write(f"{part1}\n{part2}")
\ No newline at end of file
+    with open('output.txt', 'w') as f:
+        f.write(f"{part1}\n{part2}")
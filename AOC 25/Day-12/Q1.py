@@ -1,10 +1,12 @@
 
 import sys
 
+from aoc import instrument
+
 # ---------------------------------------
 # Input parsing functions
 # ---------------------------------------
-def parse_input(filename):
+def parse(text):
     shapes = {}
     regions = []
     
@@ -13,61 +15,55 @@ def parse_input(filename):
     
     parsing_shapes = True
     
-    try:
-        with open(filename, 'r') as f:
-            lines = [line.rstrip() for line in f]
-            
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            
-            # Detect switching to regions section (lines like "4x4: 0 0...")
-            if 'x' in line and ':' in line and not line.endswith(':'):
-                parsing_shapes = False
-            
-            if parsing_shapes:
-                if line.endswith(':'):
-                    # Save previous shape if exists
-                    if current_shape_id is not None and current_shape_lines:
-                        shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
-                        current_shape_lines = []
-                    
-                    # Start new shape
-                    current_shape_id = int(line[:-1])
-                    i += 1
-                    continue
+    lines = [line.rstrip() for line in text.splitlines()]
+        
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        
+        # Detect switching to regions section (lines like "4x4: 0 0...")
+        if 'x' in line and ':' in line and not line.endswith(':'):
+            parsing_shapes = False
+        
+        if parsing_shapes:
+            if line.endswith(':'):
+                # Save previous shape if exists
+                if current_shape_id is not None and current_shape_lines:
+                    shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
+                    current_shape_lines = []
                 
-                if line == '':
-                    # Save previous shape if we hit a blank line
-                    if current_shape_id is not None and current_shape_lines:
-                        shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
-                        current_shape_lines = []
-                        current_shape_id = None
-                else:
-                    if current_shape_id is not None:
-                        current_shape_lines.append(line)
-                        
+                # Start new shape
+                current_shape_id = int(line[:-1])
+                i += 1
+                continue
+            
+            if line == '':
+                # Save previous shape if we hit a blank line
+                if current_shape_id is not None and current_shape_lines:
+                    shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
+                    current_shape_lines = []
+                    current_shape_id = None
             else:
-                # Parsing Regions
-                if line.strip():
-                    parts = line.split(':')
-                    dims = parts[0].strip().split('x')
-                    w, h = int(dims[0]), int(dims[1])
+                if current_shape_id is not None:
+                    current_shape_lines.append(line)
                     
-                    counts = [int(x) for x in parts[1].strip().split()]
-                    regions.append({
-                        'w': w, 'h': h,
-                        'counts': counts
-                    })
-            i += 1
-            
-        # Capture last shape if file ended abruptly
-        if parsing_shapes and current_shape_id is not None and current_shape_lines:
-             shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
-             
-    except FileNotFoundError:
-        print(f"Error: {filename} not found.")
-        sys.exit(1)
+        else:
+            # Parsing Regions
+            if line.strip():
+                parts = line.split(':')
+                dims = parts[0].strip().split('x')
+                w, h = int(dims[0]), int(dims[1])
+                
+                counts = [int(x) for x in parts[1].strip().split()]
+                regions.append({
+                    'w': w, 'h': h,
+                    'counts': counts
+                })
+        i += 1
+        
+    # Capture last shape if file ended abruptly
+    if parsing_shapes and current_shape_id is not None and current_shape_lines:
+         shapes[current_shape_id] = parse_shape_grid(current_shape_lines)
         
     return shapes, regions
 
@@ -121,6 +117,7 @@ def solve_region(w, h, piece_list, all_variants):
         pieces_data.append({'id': pid, 'area': area})
         
     if total_piece_area > w * h:
+        instrument.add("regions rejected by area")
         return False
 
     pieces_data.sort(key=lambda x: x['area'], reverse=True)
@@ -141,7 +138,11 @@ def solve_region(w, h, piece_list, all_variants):
         for dr, dc in shape_coords:
             grid[r + dr][c + dc] = val
 
+    calls = 0
+
     def backtrack(idx):
+        nonlocal calls
+        calls += 1
         if idx == len(sorted_piece_ids):
             return True
 
@@ -160,41 +161,58 @@ def solve_region(w, h, piece_list, all_variants):
                         place(r, c, var, False)
         return False
 
-    return backtrack(0)
+    fits = backtrack(0)
+    instrument.observe("backtrack calls per region", calls)
+    return fits
 
 # ---------------------------------------
 # Main solve function
 # ---------------------------------------
-def solve():
-    print("Parsing input from input.txt...")
-    shapes, regions = parse_input('E:\Advent of Code\AOC 25\Day-12\input.txt')
-    
+def count_solvable(shapes, regions, verbose=False):
     all_variants = {sid: generate_variants(coords) for sid, coords in shapes.items()}
         
     solvable_count = 0
     
-    print(f"Processing {len(regions)} regions...")
+    if verbose:
+        print(f"Processing {len(regions)} regions...")
     
     for i, reg in enumerate(regions):
         piece_list = []
         for sid, count in enumerate(reg['counts']):
             piece_list.extend([sid] * count)
             
-        print(f"Region {i}: {reg['w']}x{reg['h']}, {len(piece_list)} pieces... ", end="")
-        sys.stdout.flush()
+        if verbose:
+            print(f"Region {i}: {reg['w']}x{reg['h']}, {len(piece_list)} pieces... ", end="")
+            sys.stdout.flush()
         
-        if solve_region(reg['w'], reg['h'], piece_list, all_variants):
-            print("Fits!")
+        fits = solve_region(reg['w'], reg['h'], piece_list, all_variants)
+        if fits:
             solvable_count += 1
-        else:
-            print("No fit.")
+        if verbose:
+            print("Fits!" if fits else "No fit.")
             
-    print("-" * 30)
-    print(f"Total solvable regions: {solvable_count}")
+    return solvable_count
+
+def solve(parsed):
+    shapes, regions = parsed
+    # backtrack() recurses once per placed piece
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2000))
+    return count_solvable(shapes, regions)
 
 # ---------------------------------------
 # Entry point
 # ---------------------------------------
 if __name__ == "__main__":
     sys.setrecursionlimit(2000)
-    solve()
\ No newline at end of file
+    from aoc.entry import read_input
+
+    print("Parsing input...")
+    try:
+        shapes, regions = parse(read_input(__file__))
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    solvable_count = count_solvable(shapes, regions, verbose=True)
+    print("-" * 30)
+    print(f"Total solvable regions: {solvable_count}")
@@ -0,0 +1,11 @@
+"""Shared tooling for running and measuring the daily Advent of Code solutions.
+
+Every part file (``solution1.py``/``solution2.py`` in ``AOC 24``,
+``Q1.py``/``Q2.py`` in ``AOC 25``) exposes the same two functions:
+
+* ``parse(text)`` turns the raw puzzle input into whatever the solver needs.
+* ``solve(parsed)`` returns the answer for that part.
+
+Importing a part file has no side effects, so the runner can load a whole
+year into one interpreter and time each phase separately.
+"""
@@ -0,0 +1,83 @@
+"""Aho-Corasick automaton: count many byte patterns in one pass.
+
+The pattern trie is compiled into a complete transition table when it is
+built (failure links folded in), so a scan does exactly one dict lookup per
+input byte however many patterns there are.  Bytes that occur in no pattern
+are left out of the table and send the scan back to the root, which makes
+any such byte a natural separator between independent lines.
+
+    counts = Automaton([b"XMAS", b"SAMX"]).count([b"XMASAMX"])  # [1, 1]
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+class Automaton:
+    """Matches every one of ``patterns`` at once, overlapping matches included."""
+
+    def __init__(self, patterns):
+        self.patterns = [bytes(p) for p in patterns]
+        if not all(self.patterns):
+            raise ValueError("patterns must not be empty")
+
+        # Trie: goto[state][byte] -> state, ends[state] -> patterns spelled by the path
+        goto: list[dict[int, int]] = [{}]
+        ends: list[list[int]] = [[]]
+        for k, pattern in enumerate(self.patterns):
+            state = 0
+            for byte in pattern:
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = goto[state][byte] = len(goto)
+                    goto.append({})
+                    ends.append([])
+                state = nxt
+            ends[state].append(k)
+
+        # Breadth-first, so a state's failure target is complete before the state is
+        alphabet = {byte for pattern in self.patterns for byte in pattern}
+        fail = [0] * len(goto)
+        delta: list[dict[int, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        out = [tuple(e) for e in ends]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] += out[fail[state]]
+            back = delta[fail[state]]
+            for byte in alphabet:
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = back.get(byte, 0)
+                    if nxt:
+                        delta[state][byte] = nxt
+                else:
+                    fail[nxt] = back.get(byte, 0)
+                    delta[state][byte] = nxt
+                    queue.append(nxt)
+
+        self._delta = delta
+        self._out = out
+
+    def count(self, sequences) -> list[int]:
+        """Occurrences of each pattern, by index, across ``sequences``.
+
+        Each sequence (any iterable of byte values, such as ``bytes`` or a
+        ``bytearray`` slice) is scanned from the root on its own.
+        """
+        delta = self._delta
+        visits = [0] * len(delta)
+        for data in sequences:
+            state = 0
+            for byte in data:
+                state = delta[state].get(byte, 0)
+                visits[state] += 1
+
+        counts = [0] * len(self.patterns)
+        for state, n in enumerate(visits):
+            if n:
+                for k in self._out[state]:
+                    counts[k] += n
+        return counts
@@ -0,0 +1,126 @@
+"""Complexity curves: time each part at growing input sizes and fit the exponent.
+
+A part is run on generated inputs of size n, 2n, 4n, ... and the slope of
+log(time) against log(input bytes) estimates its empirical complexity.  Bytes
+rather than the generator's own size are used so that grid days (where size
+is the side length) and line-oriented days are judged on the same scale: a
+linear solution has slope ~1 whatever the input shape.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass, field
+
+from aoc import generators, pool
+
+# Slope each part should achieve against input bytes where that is not
+# linear.  n log n reads as roughly 1.1 over the sizes used here, which the
+# default tolerance already allows for.
+EXPECTED = {
+    (24, 6, 2): 1.5,   # one patrol per candidate obstacle on the path
+    (24, 25, 1): 2.0,  # every lock against every key
+    (25, 8, 1): 2.0,   # distances between all pairs of boxes
+    (25, 8, 2): 2.0,
+    (25, 9, 1): 2.0,   # every pair of red tiles is a candidate rectangle
+    (25, 9, 2): 2.0,
+}
+
+# Runs shorter than this are mostly timer noise and are left out of the fit
+MIN_SECONDS = 1e-3
+
+
+@dataclass
+class Point:
+    size: int
+    bytes: int
+    parse: float
+    solve: float
+
+    @property
+    def total(self) -> float:
+        return self.parse + self.solve
+
+
+@dataclass
+class Curve:
+    label: str
+    expected: float
+    points: list[Point] = field(default_factory=list)
+    slope: float | None = None
+    flagged: bool = False
+    error: str | None = None
+
+
+def fit_slope(points) -> float | None:
+    """Least-squares slope of log(time) against log(bytes), or None if too few points."""
+    xs, ys = [], []
+    for p in points:
+        if p.total >= MIN_SECONDS:
+            xs.append(math.log(p.bytes))
+            ys.append(math.log(p.total))
+    if len(xs) < 2:
+        return None
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    if var == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+def sizes(start: int, steps: int, factor: int = 2) -> list[int]:
+    return [start * factor ** k for k in range(steps)]
+
+
+def bench_part(part, start=None, steps=4, factor=2, seed=0, timeout=60.0,
+               tolerance=0.3, on_result=None) -> Curve:
+    """Run ``part`` on inputs of geometrically growing size and fit its curve.
+
+    The sweep stops early at the first size that errors or runs past
+    ``timeout``; the points gathered so far are still fitted.  ``on_result``
+    is called with each successful result and the text it was run on.
+    """
+    key = (part.year, part.day, part.part)
+    curve = Curve(part.label, EXPECTED.get(key, 1.0))
+    if start is None:
+        start = max(1, generators.default_size(part.year, part.day) // 4)
+    for size in sizes(start, steps, factor):
+        text = generators.generate(part.year, part.day, size, seed)
+        result = pool.run_one(part, timeout, text)
+        if result.skipped is not None:
+            curve.error = result.skipped
+            return curve
+        if result.error is not None:
+            curve.error = f"at size {size}: {result.error}"
+            break
+        curve.points.append(Point(size, len(text), result.parse.wall, result.solve.wall))
+        if on_result is not None:
+            on_result(result, text)
+    curve.slope = fit_slope(curve.points)
+    curve.flagged = curve.slope is not None and curve.slope > curve.expected + tolerance
+    return curve
+
+
+def write_json(curves, path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(c) for c in curves], indent=1))
+
+
+HEADER = f"{'part':<9} {'bytes':^24}{'seconds':^26}  {'slope':>5} {'want':>5}"
+
+
+def format_curve(curve: Curve) -> str:
+    if not curve.points:
+        return f"{curve.label:<9} !! {curve.error}"
+    first, last = curve.points[0], curve.points[-1]
+    slope = "-" if curve.slope is None else f"{curve.slope:.2f}"
+    line = (
+        f"{curve.label:<9} {first.bytes:>10} .. {last.bytes:<10}"
+        f"{first.total:>11.4f} .. {last.total:<11.4f}  {slope:>5} {curve.expected:>5.1f}"
+    )
+    if curve.flagged:
+        line += "  WORSE THAN EXPECTED"
+    if curve.error is not None:
+        line += f"  (stopped {curve.error})"
+    return line
@@ -0,0 +1,73 @@
+"""Content-addressed answer cache.
+
+An answer is stored under the hash of ``(sha256(input), sha256(source),
+python version)``, so it is reused only while the input, the solution (with
+every ``aoc`` module it imports, directly or not) and the interpreter are
+unchanged.  Each entry is a small JSON file; hits refresh the file's mtime, and once the
+cache holds more than ``max_entries`` the least recently used are deleted.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+
+from aoc import runner, store
+
+CACHE_DIR = runner.ROOT / ".aoc" / "cache"
+
+MISS = object()
+
+
+class AnswerCache:
+    MISS = MISS
+
+    def __init__(self, path=CACHE_DIR, max_entries: int = 512):
+        self.path = path
+        self.max_entries = max_entries
+
+    def key(self, part, text: str) -> str:
+        parts = (store.sha256(text), store.source_hash(part), platform.python_version())
+        return store.sha256("\0".join(parts))
+
+    def lookup(self, part, text: str):
+        """Return the cached answer for ``part`` on ``text``, or :data:`MISS`."""
+        entry = self.path / f"{self.key(part, text)}.json"
+        try:
+            answer = json.loads(entry.read_text())["answer"]
+        except (OSError, ValueError, KeyError):
+            return MISS
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return answer
+
+    def save(self, part, text: str, answer) -> None:
+        try:
+            data = json.dumps({"label": part.label, "answer": answer})
+        except (TypeError, ValueError):
+            return  # not representable as JSON; just don't cache it
+        # Answers must survive the round trip unchanged, so tuples and the
+        # like are not cached rather than coming back as lists
+        back = json.loads(data)["answer"]
+        if back != answer or type(back) is not type(answer):
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry = self.path / f"{self.key(part, text)}.json"
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(data)
+        os.replace(tmp, entry)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = list(self.path.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
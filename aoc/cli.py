@@ -0,0 +1,278 @@
+"""Command line entry point: ``python -m aoc <command> ...``."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from aoc import instrument, pool, runner, store
+from aoc.cache import AnswerCache
+
+
+def year_arg(value: str) -> int:
+    year = int(value) % 100
+    if year not in runner.YEAR_DIRS:
+        raise argparse.ArgumentTypeError(
+            f"unknown year {value!r}; choose from {sorted(runner.YEAR_DIRS)}"
+        )
+    return year
+
+
+def days_arg(value: str):
+    """``all`` or a comma separated list of days and ranges such as ``1-5,9``."""
+    if value == "all":
+        return None
+    days = set()
+    for chunk in value.split(","):
+        lo, _, hi = chunk.partition("-")
+        try:
+            days.update(range(int(lo), int(hi or lo) + 1))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad day {chunk!r}") from None
+    return days
+
+
+def add_selection(parser) -> None:
+    parser.add_argument("--year", type=year_arg, required=True)
+    parser.add_argument("--day", type=days_arg, default=None, help="all, N, or a list like 1-5,9")
+    parser.add_argument("--part", type=int, choices=(1, 2), default=None)
+
+
+def add_execution(parser) -> None:
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes; 0 uses every core (default 1, in-process)")
+    parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS",
+                        help="give up on any single part after this long")
+    parser.add_argument("--no-record", dest="record", action="store_false",
+                        help="do not append timings to the baseline store")
+    parser.add_argument("--stats", action="store_true",
+                        help="print the counters and timers each part records (disables the cache)")
+    parser.add_argument("--cprofile", type=Path, default=None, metavar="DIR",
+                        help="write cProfile stats for each part's solve phase to DIR")
+
+
+def selected_parts(args):
+    return runner.find_parts(args.year, args.day, None if args.part is None else {args.part})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve parts in this process and time them")
+    add_selection(run)
+    add_execution(run)
+    run.add_argument("--no-cache", dest="cache", action="store_false",
+                     help="always solve, ignoring and not updating the answer cache")
+    run.add_argument("--cache-size", type=int, default=512, metavar="ENTRIES",
+                     help="answers kept before the least recently used are evicted")
+    run.add_argument("--profile-imports", action="store_true",
+                     help="report each part's cold-start import cost instead of solving")
+    run.add_argument("--memory", action="store_true",
+                     help="trace allocations and report peak bytes and the top allocation sites")
+    run.add_argument("--top", type=int, default=10, metavar="N",
+                     help="allocation sites listed per part with --memory (default 10)")
+    run.add_argument("--input", default=None, metavar="PATH",
+                     help="solve every selected part on this file instead of its own ('-' for stdin)")
+    run.set_defaults(func=cmd_run)
+
+    compare = commands.add_parser("compare", help="run parts and diff them against the stored baseline")
+    add_selection(compare)
+    add_execution(compare)
+    compare.set_defaults(cache=False, memory=False, top=10, input=None)
+    compare.add_argument("--threshold", type=float, default=10.0, metavar="PERCENT",
+                         help="fail when a part is this much slower than its baseline (default 10)")
+    compare.add_argument("--min-seconds", type=float, default=0.05,
+                         help="ignore slowdowns in parts faster than this; they are mostly noise")
+    compare.add_argument("--rss-threshold", type=float, default=None, metavar="PERCENT",
+                         help="also fail when peak RSS grows this much over its baseline")
+    compare.set_defaults(func=cmd_compare)
+
+    bench = commands.add_parser("bench", help="fit empirical complexity on generated inputs")
+    add_selection(bench)
+    bench.add_argument("--start", type=int, default=None,
+                       help="first generator size (default: a quarter of the puzzle's)")
+    bench.add_argument("--steps", type=int, default=4)
+    bench.add_argument("--factor", type=int, default=2)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--timeout", type=float, default=60.0, metavar="SECONDS",
+                       help="stop growing a part once one size takes this long")
+    bench.add_argument("--tolerance", type=float, default=0.3,
+                       help="slope allowed above the expected exponent")
+    bench.add_argument("--json", type=Path, default=runner.ROOT / ".aoc" / "bench.json")
+    bench.add_argument("--no-record", dest="record", action="store_false",
+                       help="do not append timings to the baseline store")
+    bench.set_defaults(func=cmd_bench)
+
+    gen = commands.add_parser("gen", help="write a synthetic input for one day")
+    gen.add_argument("--year", type=year_arg, required=True)
+    gen.add_argument("--day", type=int, required=True)
+    gen.add_argument("--size", type=int, default=None,
+                     help="grid side, line or node count; defaults to the puzzle's size")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("-o", "--output", default=None, help="file to write (default stdout)")
+    gen.set_defaults(func=cmd_gen)
+
+    return parser
+
+
+def read_input(path):
+    """The text of ``path``, stdin for ``-``, or None to let each part read its own."""
+    if path is None:
+        return None
+    if path == "-":
+        return sys.stdin.read()
+    with open(path) as f:
+        return f.read()
+
+
+def execute(args, parts, show=True):
+    """Run ``parts`` serially or on a pool as ``args`` asks and record the timings."""
+    history = pool.load_history()
+    # Counters, profiles and memory traces only come from parts that actually run
+    use_cache = args.cache and not (args.stats or args.memory) and args.cprofile is None
+    cache = AnswerCache(max_entries=args.cache_size) if use_cache else None
+    text = read_input(args.input)
+    if args.jobs == 1:
+        results = []
+        for part in parts:
+            profile = pool.profile_path(args.cprofile, part)
+            result = pool.run_one(part, args.timeout, text, cache=cache, stats=args.stats,
+                                  profile=profile, memory=args.memory, memory_top=args.top)
+            results.append(result)
+            if show:
+                print(runner.format_row(result), flush=True)
+    else:
+        start = time.perf_counter()
+        results = pool.run_parallel(
+            parts, args.jobs or None, args.timeout, history,
+            on_result=lambda r: print(f"  done {r.part.label}", file=sys.stderr, flush=True),
+            cache=cache, stats=args.stats, profile_dir=args.cprofile, memory=args.memory,
+            memory_top=args.top,
+            text=text,
+        )
+        if show:
+            for result in results:
+                print(runner.format_row(result))
+        print(f"elapsed {time.perf_counter() - start:.2f}s on {args.jobs or os.cpu_count()} workers")
+    if args.stats:
+        for result in results:
+            if result.stats:
+                print("\n".join(instrument.format_stats(result.part.label, result.stats)))
+    if args.memory:
+        from aoc import memory
+
+        for result in results:
+            if result.memory:
+                print("\n".join(memory.format_report(result.part.label, result.memory, runner.ROOT)))
+    pool.save_history(history, results)
+    # Instrumented, traced and profiled runs are slower than real ones; keep them out of the store
+    if args.record and not args.stats and args.cprofile is None and not args.memory:
+        store.append([store.row(r, text) for r in results if r.timed])
+    return results
+
+
+def cmd_run(args) -> int:
+    parts = selected_parts(args)
+    if not parts:
+        print("no matching parts", file=sys.stderr)
+        return 1
+    if args.profile_imports:
+        return profile_imports(parts)
+    print(runner.HEADER)
+    results = execute(args, parts)
+    print(runner.format_total(results))
+    return 0 if all(r.error is None for r in results) else 1
+
+
+def profile_imports(parts) -> int:
+    from aoc import imports
+
+    print(imports.HEADER)
+    profiles = []
+    for part in parts:
+        profiles.append(imports.profile(part))
+        print(imports.format_profile(profiles[-1]), flush=True)
+    return 0 if all(p.error is None for p in profiles) else 1
+
+
+def cmd_compare(args) -> int:
+    parts = selected_parts(args)
+    if not parts:
+        print("no matching parts", file=sys.stderr)
+        return 1
+    # Baselines come from earlier runs only, before this one is appended
+    rows = store.load()
+    base_wall = store.baselines(rows)
+    base_peak = store.baselines(rows, "peak_rss")
+    results = execute(args, parts, show=False)
+    failed = False
+    print(f"{'part':<9} {'baseline':>10} {'now':>10} {'change':>8}  {'rss':>7} {'change':>8}")
+    for result in results:
+        label = f"{result.part.label:<9}"
+        if not result.timed:
+            print(f"{label} !! {result.error or result.skipped}")
+            failed |= result.error is not None
+            continue
+        current = store.row(result)
+        base = base_wall.get(store.key(current))
+        if base is None:
+            print(f"{label} {'-':>10} {current['wall']:>10.4f}      new")
+            continue
+        change = store.slowdown(current, base)
+        line = f"{label} {base['wall']:>10.4f} {current['wall']:>10.4f} {change:>+7.1f}%"
+        flags = []
+        if change > args.threshold and max(base["wall"], current["wall"]) >= args.min_seconds:
+            flags.append("SLOWER")
+        base_rss = base_peak.get(store.key(current))
+        if base_rss is not None and current["peak_rss"] is not None:
+            rss_change = store.slowdown(current, base_rss, "peak_rss")
+            line += f"  {current['peak_rss'] / (1024 * 1024):>6.1f}M {rss_change:>+7.1f}%"
+            if args.rss_threshold is not None and rss_change > args.rss_threshold:
+                flags.append("MORE MEMORY")
+        if flags:
+            line += "  " + ", ".join(flags)
+            failed = True
+        print(line)
+    return 1 if failed else 0
+
+
+def cmd_bench(args) -> int:
+    from aoc import bench
+
+    parts = selected_parts(args)
+    print(bench.HEADER)
+    curves = []
+    rows = []
+    for part in parts:
+        curve = bench.bench_part(
+            part, args.start, args.steps, args.factor, args.seed, args.timeout, args.tolerance,
+            on_result=lambda result, text: rows.append(store.row(result, text)),
+        )
+        curves.append(curve)
+        print(bench.format_curve(curve), flush=True)
+    bench.write_json(curves, args.json)
+    if args.record:
+        store.append(rows)
+    print(f"wrote {args.json}")
+    return 1 if any(c.flagged for c in curves) else 0
+
+
+def cmd_gen(args) -> int:
+    from aoc import generators
+
+    text = generators.generate(args.year, args.day, args.size, args.seed)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
+    return 0
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    sys.exit(args.func(args))
@@ -0,0 +1,68 @@
+"""Where a part gets its input when it is run on its own.
+
+Every part file ends with a ``__main__`` block that reads its puzzle input
+through :func:`read_input`, so running one directly,
+
+    PYTHONPATH=. python "AOC 24/Day-06/solution2.py" [PATH]
+
+takes its input from, in order:
+
+1. ``PATH`` on the command line, or ``-`` for standard input;
+2. the file named by the ``AOC_INPUT`` environment variable;
+3. standard input, when something is piped into it;
+4. the part's own input file (``inputN.txt`` or ``input.txt`` beside it).
+
+From Python, :func:`answer` parses and solves a part on given text or a
+given file without touching the filesystem otherwise.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+
+from aoc import runner
+
+ENV_VAR = "AOC_INPUT"
+
+
+def _piped() -> bool:
+    """True when stdin is a pipe or a redirected file (not a terminal or /dev/null)."""
+    try:
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError, AttributeError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISREG(mode)
+
+
+def read_input(script, argv=None) -> str:
+    """The input text for the part file ``script`` (pass ``__file__``)."""
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else os.environ.get(ENV_VAR)
+    if path == "-" or (path is None and _piped()):
+        return sys.stdin.read()
+    if path is None:
+        path = runner.part_for(script).input_path()
+        if path is None:
+            raise FileNotFoundError(
+                f"no input file beside {script}; pass a path, set {ENV_VAR} or pipe the input in"
+            )
+    with open(path) as f:
+        return f.read()
+
+
+def answer(year: int, day: int, part: int, text: str | None = None, path=None):
+    """Solve one part in this process on ``text`` (or the file at ``path``).
+
+    With neither, the part's own input file is used.  Errors propagate.
+    """
+    found = runner.find_parts(year, {day}, {part})
+    if not found:
+        raise LookupError(f"no part {year}/{day:02d}/{part}")
+    if text is None:
+        source = path if path is not None else found[0].input_path()
+        with open(source) as f:
+            text = f.read()
+    module = runner.load(found[0])
+    return module.solve(module.parse(text))
@@ -0,0 +1,51 @@
+"""Seeded synthetic puzzle inputs, one generator per day.
+
+Each generator takes a :class:`random.Random` and a size and returns the text
+of an input file in that day's exact format.  ``size`` means whatever scales
+the puzzle naturally (grid side, number of lines, number of nodes, digit
+count); the default for every day matches the size of the real puzzle input.
+
+Generators keep the structural guarantees the solvers rely on, for example a
+single ``S``/``E`` in the mazes, a guard that eventually walks off the 2024
+Day 6 map, a closed polygon for 2025 Day 9 and a DAG for 2025 Day 11.
+"""
+
+from __future__ import annotations
+
+import random
+
+# (year, day) -> (generator, default size)
+GENERATORS = {}
+
+
+def generator(year: int, day: int, size: int):
+    """Register the decorated function as the generator for ``year``/``day``."""
+    def register(fn):
+        GENERATORS[year, day] = (fn, size)
+        return fn
+    return register
+
+
+def _lines(rows) -> str:
+    return "\n".join(rows) + "\n"
+
+
+def _grid(rows) -> str:
+    return _lines("".join(row) for row in rows)
+
+
+def default_size(year: int, day: int) -> int:
+    return GENERATORS[year, day][1]
+
+
+def generate(year: int, day: int, size: int | None = None, seed: int = 0) -> str:
+    """Return a synthetic input for ``year``/``day``; equal arguments give equal text."""
+    try:
+        fn, default = GENERATORS[year, day]
+    except KeyError:
+        raise ValueError(f"no generator for {year}/{day:02d}") from None
+    rng = random.Random(f"{year}/{day}/{seed}")
+    return fn(rng, default if size is None else size)
+
+
+from aoc.generators import y2024, y2025  # noqa: E402, F401  (registers the generators)
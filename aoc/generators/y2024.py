@@ -0,0 +1,515 @@
+"""Generators for the 2024 puzzles (``AOC 24``)."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import combinations
+
+from aoc.generators import _grid, _lines, generator
+
+DIRS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def _maze_tree(rng, side):
+    """Random spanning tree over the odd cells of a ``side`` x ``side`` grid.
+
+    Returned as an undirected adjacency dict from cell to neighbouring cells.
+    """
+    start = (side - 2, 1)
+    tree = {start: []}
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + 2 * dr, c + 2 * dc) for dr, dc in DIRS
+            if 0 < r + 2 * dr < side - 1 and 0 < c + 2 * dc < side - 1
+            and (r + 2 * dr, c + 2 * dc) not in tree
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nxt = rng.choice(options)
+        tree[nxt] = [(r, c)]
+        tree[r, c].append(nxt)
+        stack.append(nxt)
+    return tree
+
+
+def _carve(grid, a, b):
+    grid[a[0]][a[1]] = grid[b[0]][b[1]] = "."
+    grid[(a[0] + b[0]) // 2][(a[1] + b[1]) // 2] = "."
+
+
+def _farthest(tree, start):
+    prev = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for nxt in tree[node]:
+            if nxt not in prev:
+                prev[nxt] = node
+                queue.append(nxt)
+    return node, prev
+
+
+@generator(24, 1, size=1000)
+def day01(rng, n):
+    left = [rng.randrange(10000, 100000) for _ in range(n)]
+    # Half the right column repeats left values so the similarity score is non-trivial
+    right = [rng.choice(left) if rng.random() < 0.5 else rng.randrange(10000, 100000)
+             for _ in range(n)]
+    return _lines(f"{a}   {b}" for a, b in zip(left, right))
+
+
+@generator(24, 2, size=1000)
+def day02(rng, n):
+    reports = []
+    for _ in range(n):
+        length = rng.randint(5, 8)
+        sign = rng.choice((1, -1))
+        level = rng.randint(10, 90)
+        report = [level]
+        for _ in range(length - 1):
+            level += sign * rng.randint(1, 3)
+            report.append(level)
+        kind = rng.random()
+        if kind < 0.35:
+            # One bad level: fixable by the dampener
+            i = rng.randrange(length)
+            report[i] += rng.choice((-1, 1)) * rng.randint(4, 8)
+        elif kind < 0.7:
+            report = [rng.randint(1, 99) for _ in range(length)]
+        reports.append(" ".join(map(str, report)))
+    return _lines(reports)
+
+
+@generator(24, 3, size=6)
+def day03(rng, n):
+    def token():
+        roll = rng.random()
+        if roll < 0.25:
+            return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        if roll < 0.30:
+            return "do()"
+        if roll < 0.35:
+            return "don't()"
+        if roll < 0.45:
+            return rng.choice((
+                f"mul({rng.randint(1, 999)},{rng.randint(1, 999)}",
+                f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)}]",
+                f"mul ( {rng.randint(1, 999)},{rng.randint(1, 999)})",
+                f"mul({rng.randint(1000, 9999)},{rng.randint(1, 9)})",
+                "don't", "do(",
+            ))
+        if roll < 0.6:
+            return rng.choice(("who()", "what()", "how()", "where()", "when()", "why()", "from()", "select()"))
+        return "".join(rng.choice("!@#$%^&*()[]{}<>?;:'-+ ,/~") for _ in range(rng.randint(1, 4)))
+
+    lines = []
+    for _ in range(n):
+        line = []
+        length = 0
+        while length < 3000:
+            line.append(token())
+            length += len(line[-1])
+        lines.append("".join(line))
+    return _lines(lines)
+
+
+@generator(24, 4, size=140)
+def day04(rng, side):
+    return _grid([rng.choice("XMAS") for _ in range(side)] for _ in range(side))
+
+
+@generator(24, 5, size=200)
+def day05(rng, n):
+    pages = rng.sample(range(10, 100), 49)
+    # A rule between every pair keeps each update totally ordered, as in the puzzle
+    rules = [f"{a}|{b}" for a, b in combinations(pages, 2)]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(n):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return _lines(rules + [""] + updates)
+
+
+@generator(24, 6, size=130)
+def day06(rng, side):
+    best, best_seen = None, 0
+    # Random obstacles give short patrols, so keep the longest of a few tries
+    for _ in range(20):
+        grid = [["#" if rng.random() < 0.02 else "." for _ in range(side)] for _ in range(side)]
+        r, c = rng.randrange(side), rng.randrange(side)
+        grid[r][c] = "^"
+        seen = set()
+        d = 0
+        while 0 <= r < side and 0 <= c < side and (r, c, d) not in seen:
+            seen.add((r, c, d))
+            nr, nc = r + DIRS[d][0], c + DIRS[d][1]
+            if 0 <= nr < side and 0 <= nc < side and grid[nr][nc] == "#":
+                d = (d + 1) % 4
+            else:
+                r, c = nr, nc
+        # The patrol must leave the map, otherwise part 1 never terminates
+        if not (0 <= r < side and 0 <= c < side) and len(seen) > best_seen:
+            best, best_seen = grid, len(seen)
+    if best is None:
+        best = [["."] * side for _ in range(side)]
+        best[side // 2][side // 2] = "^"
+    return _grid(best)
+
+
+@generator(24, 7, size=850)
+def day07(rng, n):
+    lines = []
+    for _ in range(n):
+        numbers = [rng.choice((rng.randint(1, 9), rng.randint(1, 999))) for _ in range(rng.randint(3, 12))]
+        roll = rng.random()
+        ops = "+*|" if roll < 0.3 else "+*"
+        total = numbers[0]
+        for x in numbers[1:]:
+            op = rng.choice(ops)
+            total = total + x if op == "+" else total * x if op == "*" else int(f"{total}{x}")
+        if roll > 0.7:
+            total += rng.randint(1, 1000)
+        lines.append(f"{total}: {' '.join(map(str, numbers))}")
+    return _lines(lines)
+
+
+@generator(24, 8, size=50)
+def day08(rng, side):
+    grid = [["."] * side for _ in range(side)]
+    freqs = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    cells = rng.sample(range(side * side), side * side // 12)
+    # Roughly four antennas per frequency, as in the puzzle
+    freqs = freqs[:max(1, min(len(freqs), len(cells) // 4))]
+    for i, cell in enumerate(cells):
+        grid[cell // side][cell % side] = freqs[i % len(freqs)]
+    return _grid(grid)
+
+
+@generator(24, 9, size=19999)
+def day09(rng, n):
+    digits = [str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(n | 1)]
+    return "".join(digits) + "\n"
+
+
+@generator(24, 10, size=59)
+def day10(rng, side):
+    # Height falls off with distance from the nearest peak, giving long trails
+    dist = [[None] * side for _ in range(side)]
+    queue = deque()
+    for _ in range(max(1, side * side // 50)):
+        r, c = rng.randrange(side), rng.randrange(side)
+        dist[r][c] = 0
+        queue.append((r, c))
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in DIRS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < side and 0 <= nc < side and dist[nr][nc] is None:
+                dist[nr][nc] = dist[r][c] + 1
+                queue.append((nr, nc))
+    return _grid([str(9 - d) if d <= 9 else str(rng.randint(0, 9)) for d in row] for row in dist)
+
+
+@generator(24, 11, size=8)
+def day11(rng, n):
+    return " ".join(str(rng.choice((0, rng.randint(1, 999), rng.randint(1, 9999999)))) for _ in range(n)) + "\n"
+
+
+@generator(24, 12, size=140)
+def day12(rng, side):
+    grid = [[None] * side for _ in range(side)]
+    queue = deque()
+    for _ in range(max(1, side * side // 60)):
+        r, c = rng.randrange(side), rng.randrange(side)
+        if grid[r][c] is None:
+            grid[r][c] = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+            queue.append((r, c))
+    # Grow the seeds breadth first, in random order, into irregular regions
+    while queue:
+        r, c = queue.popleft()
+        dirs = list(DIRS)
+        rng.shuffle(dirs)
+        for dr, dc in dirs:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < side and 0 <= nc < side and grid[nr][nc] is None:
+                grid[nr][nc] = grid[r][c]
+                queue.append((nr, nc))
+    return _grid(grid)
+
+
+@generator(24, 13, size=320)
+def day13(rng, n):
+    blocks = []
+    for _ in range(n):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            if ax * by != ay * bx:
+                break
+        if rng.random() < 0.7:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n")
+    return "\n".join(blocks)
+
+
+@generator(24, 14, size=500)
+def day14(rng, n):
+    width, height = 101, 103
+    # Plant a tree at time t: the only moment every robot is on its own tile
+    t = rng.randrange(1, width * height)
+    tree = []
+    rows = 1
+    while (rows + 1) ** 2 <= n // 2 and rows < height // 2:
+        rows += 1
+    top, left = rng.randrange(height - rows), rng.randrange(width - 2 * rows)
+    for r in range(rows):
+        for c in range(rows - 1 - r, rows + r):
+            tree.append((left + c, top + r))
+    tree = tree[:n]
+    taken = set(tree)
+    final = list(tree)
+    while len(final) < n:
+        cell = (rng.randrange(width), rng.randrange(height))
+        if cell not in taken:
+            taken.add(cell)
+            final.append(cell)
+    rng.shuffle(final)
+    lines = []
+    for x, y in final:
+        vx = rng.choice([v for v in range(-99, 100) if v % width])
+        vy = rng.choice([v for v in range(-99, 100) if v % height])
+        lines.append(f"p={(x - vx * t) % width},{(y - vy * t) % height} v={vx},{vy}")
+    return _lines(lines)
+
+
+@generator(24, 15, size=50)
+def day15(rng, side):
+    grid = [["#"] * side]
+    for _ in range(side - 2):
+        row = ["#"]
+        for _ in range(side - 2):
+            roll = rng.random()
+            row.append("#" if roll < 0.05 else "O" if roll < 0.3 else ".")
+        grid.append(row + ["#"])
+    grid.append(["#"] * side)
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choice("<>^v") for _ in range(8 * side * side))
+    return _grid(grid) + "\n" + _lines(moves[i:i + 1000] for i in range(0, len(moves), 1000))
+
+
+@generator(24, 16, size=141)
+def day16(rng, side):
+    side |= 1
+    grid = [["#"] * side for _ in range(side)]
+    tree = _maze_tree(rng, side)
+    for a, neighbours in tree.items():
+        for b in neighbours:
+            _carve(grid, a, b)
+    # Knock out some walls so there are several best paths to count
+    for r in range(1, side - 1):
+        for c in range(1, side - 1):
+            if grid[r][c] == "#" and (r + c) % 2 and rng.random() < 0.1:
+                if (grid[r - 1][c] == grid[r + 1][c] == ".") or (grid[r][c - 1] == grid[r][c + 1] == "."):
+                    grid[r][c] = "."
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return _grid(grid)
+
+
+def _run_program(program, a):
+    b = c = ip = 0
+    out = []
+    while ip < len(program):
+        op, arg = program[ip], program[ip + 1]
+        combo = (0, 1, 2, 3, a, b, c)[arg] if arg < 7 else 0
+        if op == 0:
+            a >>= combo
+        elif op == 1:
+            b ^= arg
+        elif op == 2:
+            b = combo % 8
+        elif op == 3 and a:
+            ip = arg
+            continue
+        elif op == 4:
+            b ^= c
+        elif op == 5:
+            out.append(combo % 8)
+        elif op == 6:
+            b = a >> combo
+        elif op == 7:
+            c = a >> combo
+        ip += 2
+    return out
+
+
+def _has_quine(program):
+    candidates = [0]
+    for i in reversed(range(len(program))):
+        candidates = [a * 8 + d for a in candidates for d in range(8)
+                      if _run_program(program, a * 8 + d) == program[i:]]
+    return any(candidates)
+
+
+@generator(24, 17, size=9)
+def day17(rng, n):
+    # Same shape as the puzzle: one output and one 3-bit shift of A per loop.
+    # Constants are redrawn until some A makes the program print itself (part 2).
+    while True:
+        body = [(1, rng.randrange(8)), (7, 5), (1, rng.randrange(8)), (4, rng.randrange(8))]
+        body.insert(rng.randrange(1, len(body) + 1), (0, 3))
+        program = [2, 4] + [x for step in body for x in step] + [5, 5, 3, 0]
+        if _has_quine(program):
+            break
+    a = rng.randrange(8 ** (n - 1), 8 ** n)
+    return (f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+            f"Program: {','.join(map(str, program))}\n")
+
+
+@generator(24, 18, size=71)
+def day18(rng, side):
+    # Every cell but the corners eventually falls, so the exit is always cut off.
+    # The cells of one random staircase between the corners only fall after the
+    # bytes part 1 drops (1024 on the puzzle's 71x71 grid, the same share of
+    # any other), so part 1 always has a path
+    path = set()
+    x = y = 0
+    while (x, y) != (side - 1, side - 1):
+        if y == side - 1 or (x < side - 1 and rng.random() < 0.5):
+            x += 1
+        else:
+            y += 1
+        path.add((x, y))
+    path.discard((side - 1, side - 1))
+    cells = [(x, y) for x in range(side) for y in range(side)
+             if (x, y) not in path and (x, y) not in ((0, 0), (side - 1, side - 1))]
+    rng.shuffle(cells)
+    fallen = 1024 * side * side // 71 ** 2
+    rest = cells[fallen:] + sorted(path)
+    rng.shuffle(rest)
+    return _lines(f"{x},{y}" for x, y in cells[:fallen] + rest)
+
+
+@generator(24, 19, size=400)
+def day19(rng, n):
+    # No towel ends in one colour, so any design ending in it cannot be made
+    last = rng.choice("wubrg")
+    towels = {"".join(rng.choice("wubrg") for _ in range(rng.randint(1, 8))) for _ in range(450)}
+    towels = sorted(t for t in towels if not t.endswith(last))
+    designs = []
+    for _ in range(n):
+        if rng.random() < 0.6:
+            design = ""
+            while len(design) < rng.randint(20, 60):
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choice("wubrg") for _ in range(rng.randint(20, 60))) + last
+        designs.append(design)
+    return ", ".join(towels) + "\n\n" + _lines(designs)
+
+
+@generator(24, 20, size=141)
+def day20(rng, side):
+    side |= 1
+    tree = _maze_tree(rng, side)
+    # Keep only the longest path through the maze so the track has no branches
+    end, _ = _farthest(tree, next(iter(tree)))
+    start, prev = _farthest(tree, end)
+    grid = [["#"] * side for _ in range(side)]
+    node = start
+    while prev[node] is not None:
+        _carve(grid, node, prev[node])
+        node = prev[node]
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+    return _grid(grid)
+
+
+@generator(24, 21, size=5)
+def day21(rng, n):
+    return _lines(f"{rng.randrange(1, 1000):03d}A" for _ in range(n))
+
+
+@generator(24, 22, size=1766)
+def day22(rng, n):
+    return _lines(str(rng.randrange(1, 1 << 24)) for _ in range(n))
+
+
+@generator(24, 23, size=520)
+def day23(rng, n):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    names = rng.sample([a + b for a in letters for b in letters], min(n, 26 * 26))
+    edges = set()
+    # One planted 13-clique is the LAN party; everything else is sparse noise
+    for a, b in combinations(rng.sample(names, min(13, len(names))), 2):
+        edges.add((a, b))
+    while len(edges) < 6 * len(names):
+        a, b = rng.sample(names, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    edges = [f"{a}-{b}" for a, b in edges]
+    rng.shuffle(edges)
+    return _lines(edges)
+
+
+@generator(24, 24, size=45)
+def day24(rng, bits):
+    letters = "abcdefghijklmnopqrstuvw"
+    names = iter(rng.sample([a + b + c for a in letters for b in letters for c in letters], 5 * bits))
+    gates = {}  # output wire -> (a, op, b)
+
+    def gate(a, op, b, out=None):
+        out = out or next(names)
+        gates[out] = (a, op, b) if rng.random() < 0.5 else (b, op, a)
+        return out
+
+    # Ripple-carry adder; keep each stage's wires so swaps stay within one stage
+    stages = []
+    gate("x00", "XOR", "y00", "z00")
+    carry = gate("x00", "AND", "y00")
+    for i in range(1, bits):
+        x, y = f"x{i:02d}", f"y{i:02d}"
+        s = gate(x, "XOR", y)
+        a = gate(x, "AND", y)
+        z = gate(s, "XOR", carry, f"z{i:02d}")
+        b = gate(s, "AND", carry)
+        carry = gate(a, "OR", b, f"z{bits:02d}" if i == bits - 1 else None)
+        stages.append({"s": s, "a": a, "z": z, "b": b, "c": carry})
+
+    # Four swapped output pairs in distinct, non-adjacent stages
+    chosen = []
+    for i in rng.sample(range(1, bits - 2), bits - 3):
+        if all(abs(i - j) > 1 for j in chosen):
+            chosen.append(i)
+        if len(chosen) == 4:
+            break
+    for i in chosen:
+        st = stages[i - 1]
+        u, v = rng.choice((("z", "c"), ("s", "a"), ("z", "b"), ("z", "a")))
+        gates[st[u]], gates[st[v]] = gates[st[v]], gates[st[u]]
+
+    inputs = [f"{w}{i:02d}: {rng.randint(0, 1)}" for w in "xy" for i in range(bits)]
+    wiring = [f"{a} {op} {b} -> {out}" for out, (a, op, b) in gates.items()]
+    rng.shuffle(wiring)
+    return _lines(inputs) + "\n" + _lines(wiring)
+
+
+@generator(24, 25, size=500)
+def day25(rng, n):
+    blocks = []
+    for _ in range(n):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        if rng.random() < 0.5:
+            rows = ["#####"] + ["".join("#" if h > r else "." for h in heights) for r in range(5)] + ["....."]
+        else:
+            rows = ["....."] + ["".join("#" if h >= 5 - r else "." for h in heights) for r in range(5)] + ["#####"]
+        blocks.append(_lines(rows))
+    return "\n".join(blocks)
@@ -0,0 +1,188 @@
+"""Generators for the 2025 puzzles (``AOC 25``)."""
+
+from __future__ import annotations
+
+from aoc.generators import _grid, _lines, generator
+
+
+@generator(25, 1, size=4544)
+def day01(rng, n):
+    return _lines(f"{rng.choice('LR')}{rng.randint(1, 99) if rng.random() < 0.9 else rng.randint(100, 999)}"
+                  for _ in range(n))
+
+
+@generator(25, 2, size=35)
+def day02(rng, n):
+    ranges = []
+    for _ in range(n):
+        digits = rng.randint(2, 10)
+        lo = rng.randrange(10 ** (digits - 1), 10 ** digits)
+        ranges.append(f"{lo}-{lo + rng.randrange(10 ** min(digits - 1, 5) * 2)}")
+    return ",".join(ranges) + "\n"
+
+
+@generator(25, 3, size=200)
+def day03(rng, n):
+    return _lines("".join(rng.choice("123456789") for _ in range(100)) for _ in range(n))
+
+
+@generator(25, 4, size=135)
+def day04(rng, side):
+    return _grid(["@" if rng.random() < 0.6 else "." for _ in range(side)] for _ in range(side))
+
+
+@generator(25, 5, size=1000)
+def day05(rng, n):
+    ranges = []
+    for _ in range(max(1, n // 6)):
+        lo = rng.randrange(10 ** 14, 6 * 10 ** 14)
+        ranges.append(f"{lo}-{lo + rng.randrange(10 ** rng.randint(0, 13))}")
+    ids = []
+    for _ in range(n):
+        if rng.random() < 0.5:
+            lo, hi = map(int, rng.choice(ranges).split("-"))
+            ids.append(str(rng.randint(lo, hi)))
+        else:
+            ids.append(str(rng.randrange(10 ** 14, 6 * 10 ** 14)))
+    return _lines(ranges + [""] + ids)
+
+
+@generator(25, 6, size=1000)
+def day06(rng, n):
+    rows = [[] for _ in range(5)]
+    for _ in range(n):
+        width = rng.randint(1, 4)
+        numbers = [str(rng.randrange(1, 10 ** rng.randint(1, width))) for _ in range(4)]
+        # At least one number spans the whole block so no column inside it is blank
+        numbers[rng.randrange(4)] = str(rng.randrange(10 ** (width - 1), 10 ** width))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        rows[4].append(rng.choice("+*").ljust(width))
+    return _lines(" ".join(row) for row in rows)
+
+
+@generator(25, 7, size=141)
+def day07(rng, side):
+    center = side // 2
+    grid = [["."] * side for _ in range(side + 1)]
+    grid[0][center] = "S"
+    # Splitters fan out one column per level, like the puzzle's triangle
+    for level in range(1, side // 2):
+        row = 2 * level
+        for c in range(center - level + 1, center + level, 2):
+            if 0 <= c < side and rng.random() < 0.85:
+                grid[row][c] = "^"
+    return _grid(grid)
+
+
+@generator(25, 8, size=1000)
+def day08(rng, n):
+    return _lines(f"{rng.randrange(100000)},{rng.randrange(100000)},{rng.randrange(100000)}" for _ in range(n))
+
+
+@generator(25, 9, size=496)
+def day09(rng, n):
+    # A y-monotone orthogonal polygon: one band per step down, each band's
+    # [left, right] overlapping the next, walked down the right side and back
+    # up the left side. Every horizontal line meets it in a single interval.
+    bands = max(1, n // 4)
+    ys = sorted(rng.sample(range(1000, 99000), bands + 1))
+    spans = [(rng.randrange(30000, 45000), rng.randrange(55000, 70000))]
+    while len(spans) < bands:
+        left, right = spans[-1]
+        nl = min(max(1000, left + rng.randint(-3000, 3000)), 48000)
+        nr = max(min(99000, right + rng.randint(-3000, 3000)), 52000)
+        if nl != left and nr != right:
+            spans.append((nl, nr))
+    points = []
+    for i, (_, right) in enumerate(spans):
+        points += [(right, ys[i]), (right, ys[i + 1])]
+    for i in reversed(range(bands)):
+        left = spans[i][0]
+        points += [(left, ys[i + 1]), (left, ys[i])]
+    return _lines(f"{x},{y}" for x, y in points)
+
+
+@generator(25, 10, size=173)
+def day10(rng, n):
+    lines = []
+    for _ in range(n):
+        lights = rng.randint(4, 10)
+        buttons = []
+        for _ in range(rng.randint(lights - 2, lights + 3)):
+            buttons.append(sorted(rng.sample(range(lights), rng.randint(1, lights - 1))))
+        # Make sure every light is wired to something
+        for i in range(lights):
+            if not any(i in b for b in buttons):
+                buttons.append([i])
+        # Targets come from real presses, so both parts are always solvable
+        presses = [rng.randint(0, 20) for _ in buttons]
+        joltage = [sum(p for p, b in zip(presses, buttons) if i in b) for i in range(lights)]
+        on = [False] * lights
+        for b in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for i in b:
+                on[i] = not on[i]
+        diagram = "".join("#" if x else "." for x in on)
+        wiring = " ".join(f"({','.join(map(str, b))})" for b in buttons)
+        lines.append(f"[{diagram}] {wiring} {{{','.join(map(str, joltage))}}}")
+    return _lines(lines)
+
+
+@generator(25, 11, size=584)
+def day11(rng, n):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    special = ("svr", "fft", "dac", "you", "out")
+    names = []
+    taken = set(special)
+    while len(names) < max(n, 6) - len(special):
+        name = "".join(rng.choice(letters) for _ in range(3))
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+    # Nodes are laid out in topological order and edges only point forward,
+    # which keeps the graph acyclic. svr < fft < dac < you < out.
+    order = ["svr"] + names + ["out"]
+    for name, frac in (("fft", 0.3), ("dac", 0.6), ("you", 0.8)):
+        order.insert(max(1, int(len(order) * frac)), name)
+    index = {name: i for i, name in enumerate(order)}
+    edges = {name: set() for name in order[:-1]}
+    last = len(order) - 1
+    for i, name in enumerate(order[:-1]):
+        for _ in range(rng.choice((1, 1, 2, 2, 3))):
+            edges[name].add(order[min(last, i + rng.randint(1, 20))])
+    # A spine through the special nodes guarantees every required path exists
+    spine = sorted({0, last, *rng.sample(range(1, last), min(last - 1, 20))} | {index[s] for s in special})
+    for a, b in zip(spine, spine[1:]):
+        edges[order[a]].add(order[b])
+    lines = [f"{name}: {' '.join(sorted(targets, key=index.get))}" for name, targets in edges.items()]
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@generator(25, 12, size=1000)
+def day12(rng, n):
+    shapes = []
+    while len(shapes) < 6:
+        cells = set(rng.sample(range(9), 7))
+        rows = {c // 3 for c in cells}
+        cols = {c % 3 for c in cells}
+        if len(rows) == len(cols) == 3 and cells not in shapes:
+            shapes.append(cells)
+    blocks = []
+    for i, cells in enumerate(shapes):
+        rows = ["".join("#" if r * 3 + c in cells else "." for c in range(3)) for r in range(3)]
+        blocks.append(_lines([f"{i}:"] + rows))
+    regions = []
+    for _ in range(n):
+        w, h = rng.randint(35, 50), rng.randint(35, 50)
+        # Either every present fits in its own 3x3 slot, or the area alone rules it out
+        if rng.random() < 0.5:
+            total = rng.randint(1, (w // 3) * (h // 3))
+        else:
+            total = w * h // 7 + rng.randint(1, 20)
+        counts = [0] * 6
+        for _ in range(total):
+            counts[rng.randrange(6)] += 1
+        regions.append(f"{w}x{h}: {' '.join(map(str, counts))}")
+    return "\n".join(blocks) + "\n" + _lines(regions)
@@ -0,0 +1,156 @@
+"""Flat, bytearray-backed character grid shared by the grid days.
+
+Cells live in one ``bytearray`` addressed by a single integer index, with
+``pad`` columns of :data:`BORDER` after every row, ``pad`` border rows above
+and below, and ``pad`` more border bytes in front of the top rows (the gap
+column of the row "before" the first).  Stepping up to ``pad`` cells off any
+edge, diagonals included, therefore lands on a border byte inside the buffer
+instead of wrapping or raising, so hot loops need no bounds checks: test
+``cells[i] == BORDER`` instead.  Moves are plain integer offsets
+(``i + grid.down``), so walking the grid allocates no ``(r, c)`` tuples.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+BORDER = ord("\n")
+
+
+class Grid:
+    """A ``height`` x ``width`` grid of single-byte cells.
+
+    ``dirs`` holds the offsets for up, right, down and left, in that
+    (clockwise) order, and ``dirs8`` adds the four diagonals.
+    """
+
+    def __init__(self, rows, pad: int = 1):
+        rows = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.pad = pad
+        self.stride = self.width + pad
+        self.offset = pad * self.stride + pad
+        border_rows = bytes([BORDER]) * (pad * self.stride)
+        gap = bytes([BORDER]) * pad
+        self.cells = bytearray(gap + border_rows + b"".join(row + gap for row in rows) + border_rows)
+
+        s = self.stride
+        self.up, self.right, self.down, self.left = -s, 1, s, -1
+        self.dirs = (-s, 1, s, -1)
+        self.dirs8 = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    @classmethod
+    def parse(cls, text: str, pad: int = 1) -> Grid:
+        """Build a grid from puzzle text, ignoring blank lines and trailing whitespace."""
+        return cls([line.rstrip() for line in text.splitlines() if line.strip()], pad)
+
+    @classmethod
+    def blank(cls, width: int, height: int, fill: str = ".", pad: int = 1) -> Grid:
+        return cls([fill * width] * height, pad)
+
+    def copy(self) -> Grid:
+        other = object.__new__(Grid)
+        other.__dict__.update(self.__dict__)
+        other.cells = bytearray(self.cells)
+        return other
+
+    def index(self, r: int, c: int) -> int:
+        return self.offset + r * self.stride + c
+
+    def pos(self, i: int) -> tuple[int, int]:
+        return divmod(i - self.offset, self.stride)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value) -> None:
+        self.cells[i] = ord(value) if isinstance(value, str) else value
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def inside(self, i: int) -> bool:
+        return 0 <= i < len(self.cells) and self.cells[i] != BORDER
+
+    def indices(self) -> range:
+        """Every index from the first cell to the last, borders included.
+
+        Border columns show up in between rows; filter with ``cells[i] != BORDER``
+        or iterate :meth:`rows` where that matters.
+        """
+        return range(self.offset, self.offset + self.height * self.stride - self.pad)
+
+    def row(self, r: int) -> memoryview:
+        """Zero-copy view of row ``r`` (writes go straight to the grid)."""
+        start = self.offset + r * self.stride
+        return memoryview(self.cells)[start:start + self.width]
+
+    def rows(self):
+        for r in range(self.height):
+            yield self.row(r)
+
+    def find(self, ch: str, start: int = 0) -> int:
+        """Index of the first ``ch`` at or after ``start``, or -1."""
+        return self.cells.find(ord(ch), start)
+
+    def find_all(self, ch: str) -> list[int]:
+        found = []
+        b = ord(ch)
+        i = self.cells.find(b)
+        while i != -1:
+            found.append(i)
+            i = self.cells.find(b, i + 1)
+        return found
+
+    def count(self, ch: str) -> int:
+        return self.cells.count(ord(ch))
+
+    def stops(self, blocked: str) -> list[array]:
+        """Where a walker going straight stops, per direction in ``dirs`` order.
+
+        ``stops(blocked)[d][i]`` is the last cell before the next ``blocked``
+        cell from ``i`` in direction ``d``, or the border cell the walker steps
+        onto if nothing blocks it.  Either way the run from ``i`` covers the
+        cells from ``i`` up to that index, so a straight move is one lookup.
+        Entries for blocked and border cells are the cell itself.
+        """
+        cells = self.cells
+        wall = ord(blocked)
+        n = len(cells)
+        table = []
+        for step in self.dirs:
+            stop = array("i", range(n))
+            # Fill each cell after the one it looks at
+            for i in (range(n - 1, -1, -1) if step > 0 else range(n)):
+                ch = cells[i]
+                if ch == BORDER or ch == wall:
+                    continue
+                j = i + step
+                ahead = cells[j]
+                if ahead == BORDER:
+                    stop[i] = j
+                elif ahead != wall:
+                    stop[i] = stop[j]
+            table.append(stop)
+        return table
+
+    def stop(self, i: int, d: int, blocked: str) -> int:
+        """``stops(blocked)[d][i]`` for one open cell ``i``, without the table.
+
+        The row or column ahead is searched with ``bytes.find``, so a single
+        walk that makes a few hundred moves need not pay for a table over
+        every cell; build :meth:`stops` when the same moves are repeated.
+        """
+        step = self.dirs[d]
+        cells = self.cells
+        if step in (1, -1):
+            line = cells[i:i + step * self.stride:step]  # Ends on the row's border gap
+        else:
+            line = cells[i::step]
+        edge = line.find(BORDER)
+        wall = line.find(ord(blocked), 0, edge)
+        return i + step * (edge if wall == -1 else wall - 1)
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(row).decode() for row in self.rows())
@@ -0,0 +1,95 @@
+"""Cold-start import cost of each part, as ``python -X importtime`` sees it.
+
+Each part is loaded in a fresh interpreter so earlier parts cannot warm the
+module cache for it.  The child imports the runner first and then writes a
+marker to stderr; every ``import time:`` line after the marker was caused by
+loading the part file, so the runner's own imports are not charged to it.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc import runner
+
+MARKER = "-- aoc: loading part --"
+
+_CHILD = f"""
+import sys, time
+from pathlib import Path
+from aoc import runner
+part = runner.Part(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]), Path(sys.argv[4]))
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+runner.load(part)
+print(time.perf_counter() - start)
+"""
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+@dataclass
+class Import:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportProfile:
+    label: str
+    load: float | None = None
+    # Modules imported directly by the part file, most expensive first
+    top: list[Import] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def imports_us(self) -> int:
+        return sum(i.cumulative_us for i in self.top)
+
+
+def parse_importtime(stderr: str) -> list[Import]:
+    """Top-level imports recorded after :data:`MARKER`, most expensive first."""
+    _, found, after = stderr.partition(MARKER)
+    if not found:
+        return []
+    top = []
+    for m in _LINE.finditer(after):
+        # Nested imports are indented under the module that pulled them in
+        if not m.group(3):
+            top.append(Import(m.group(4), int(m.group(1)), int(m.group(2))))
+    top.sort(key=lambda i: i.cumulative_us, reverse=True)
+    return top
+
+
+def profile(part, timeout: float = 60.0) -> ImportProfile:
+    result = ImportProfile(part.label)
+    cmd = [
+        sys.executable, "-X", "importtime", "-c", _CHILD,
+        str(part.year), str(part.day), str(part.part), str(part.path),
+    ]
+    try:
+        proc = subprocess.run(cmd, cwd=runner.ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        result.error = f"import took over {timeout:g}s"
+        return result
+    result.top = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        lines = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        result.error = lines[-1] if lines else f"exit status {proc.returncode}"
+        return result
+    result.load = float(proc.stdout.strip().splitlines()[-1])
+    return result
+
+
+HEADER = f"{'part':<9} {'load':>9} {'imports':>9}  heaviest imports (cumulative)"
+
+
+def format_profile(p: ImportProfile, show: int = 3) -> str:
+    heavy = ", ".join(f"{i.module} {i.cumulative_us / 1000:.1f}ms" for i in p.top[:show])
+    if p.error is not None:
+        return f"{p.label:<9} !! {p.error}" + (f"  ({heavy})" if heavy else "")
+    return f"{p.label:<9} {p.load * 1000:>7.1f}ms {p.imports_us / 1000:>7.1f}ms  {heavy}"
@@ -0,0 +1,123 @@
+"""Opt-in counters, timers and profiling for the solutions.
+
+Solutions call these through the module (``instrument.add(...)``, not
+``from aoc.instrument import add``) because :func:`enable` swaps the real
+implementations in and out.  While disabled, which is the default, ``add``
+and ``observe`` are bound to an empty function and ``timer`` hands back one
+shared null context, so the calls cost a lookup and nothing more.  In a hot
+loop, count in a local and report it once when the loop is done.
+
+* ``add(name, n=1)``: bump a named counter.
+* ``observe(name, value)``: record one sample of a distribution (count,
+  total and maximum are kept), e.g. states visited per candidate.
+* ``with timer(name):``: accumulate wall time over a block.
+* ``with profiled(path):``: run a block under ``cProfile`` and dump the
+  stats to ``path`` for ``python -m pstats`` or snakeviz.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import time
+from contextlib import contextmanager, nullcontext
+
+enabled = False
+
+_counters: dict[str, int] = {}
+_samples: dict[str, list] = {}   # name -> [count, total, max]
+_timers: dict[str, list] = {}    # name -> [calls, seconds]
+
+_NULL = nullcontext()
+
+
+def _noop(*args) -> None:
+    pass
+
+
+def _add(name: str, n: int = 1) -> None:
+    _counters[name] = _counters.get(name, 0) + n
+
+
+def _observe(name: str, value) -> None:
+    s = _samples.get(name)
+    if s is None:
+        _samples[name] = [1, value, value]
+    else:
+        s[0] += 1
+        s[1] += value
+        if value > s[2]:
+            s[2] = value
+
+
+add = _noop
+observe = _noop
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        t = _timers.setdefault(self.name, [0, 0.0])
+        t[0] += 1
+        t[1] += time.perf_counter() - self.start
+        return False
+
+
+def timer(name: str):
+    return _Timer(name) if enabled else _NULL
+
+
+def enable(on: bool = True) -> None:
+    global enabled, add, observe
+    enabled = on
+    add = _add if on else _noop
+    observe = _observe if on else _noop
+
+
+def reset() -> None:
+    _counters.clear()
+    _samples.clear()
+    _timers.clear()
+
+
+def snapshot() -> dict:
+    """Everything recorded since the last :func:`reset`, as plain data."""
+    return {
+        "counters": dict(_counters),
+        "samples": {k: {"count": c, "total": t, "max": m} for k, (c, t, m) in _samples.items()},
+        "timers": {k: {"calls": c, "seconds": s} for k, (c, s) in _timers.items()},
+    }
+
+
+@contextmanager
+def profiled(path):
+    """Profile the block with ``cProfile`` and write the stats to ``path``."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(str(path))
+
+
+def format_stats(label: str, stats: dict) -> list[str]:
+    """Indented summary lines for one part's :func:`snapshot`."""
+    lines = []
+    for name, value in sorted(stats["counters"].items()):
+        lines.append(f"  {name:<32} {value:>14,}")
+    for name, s in sorted(stats["samples"].items()):
+        mean = s["total"] / s["count"]
+        lines.append(f"  {name:<32} {s['count']:>14,} samples, mean {mean:,.1f}, max {s['max']:,}")
+    for name, t in sorted(stats["timers"].items()):
+        lines.append(f"  {name:<32} {t['seconds']:>13.4f}s over {t['calls']:,} calls")
+    if lines:
+        lines.insert(0, f"{label}")
+    return lines
@@ -0,0 +1,116 @@
+"""Python-level memory profile of one part, using ``tracemalloc``.
+
+Peak traced bytes come straight from ``tracemalloc`` (with the peak reset
+between parse and solve).  The allocation sites are harder: by the time a
+phase returns, the structures that made up its peak have usually been
+freed.  A background thread therefore polls the traced total and takes a
+fresh snapshot whenever it has grown by :data:`GROWTH` over the last one,
+so the sites reported are those live near the high-water mark, at the cost
+of a handful of snapshots per run.
+"""
+
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+# Take a new snapshot once the traced total is this much above the last one
+GROWTH = 1.25
+
+# Nothing below this is worth a snapshot; the first one is taken past it
+MIN_BYTES = 1 << 20
+
+# Seconds between polls of the traced total
+INTERVAL = 0.02
+
+# Frames kept per allocation; 1 is enough to attribute a site to a line
+FRAMES = 1
+
+_IGNORE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+class _Sampler(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stop = threading.Event()
+        self.size = MIN_BYTES / GROWTH
+        self.snapshot = None
+
+    def sample(self, force: bool = False) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if force or current > self.size * GROWTH:
+            self.snapshot = None  # let the old one go before building the next
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def run(self) -> None:
+        while not self.stop.wait(INTERVAL):
+            self.sample()
+
+
+class Tracker:
+    """Collects per-phase peaks while tracing; see :func:`tracking`."""
+
+    def __init__(self):
+        self.peaks: dict[str, int] = {}
+        self._sampler = _Sampler()
+
+    @contextmanager
+    def phase(self, name: str):
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self.peaks[name] = tracemalloc.get_traced_memory()[1]
+            # Small parts never cross MIN_BYTES; show what they hold at the end instead
+            self._sampler.sample(force=self._sampler.snapshot is None)
+
+    def report(self, top: int = 10) -> dict:
+        """Peaks per phase and the ``top`` allocation sites near the overall peak."""
+        sites = []
+        snapshot = self._sampler.snapshot
+        if snapshot is not None:
+            for stat in snapshot.filter_traces(_IGNORE).statistics("lineno")[:top]:
+                frame = stat.traceback[0]
+                sites.append({
+                    "site": f"{frame.filename}:{frame.lineno}",
+                    "bytes": stat.size,
+                    "count": stat.count,
+                })
+        return {"peaks": dict(self.peaks), "top": sites}
+
+
+@contextmanager
+def tracking():
+    """Trace allocations for the duration of the block and yield a :class:`Tracker`."""
+    tracker = Tracker()
+    tracemalloc.start(FRAMES)
+    tracker._sampler.start()
+    try:
+        yield tracker
+    finally:
+        tracker._sampler.stop.set()
+        tracker._sampler.join()
+        tracemalloc.stop()
+
+
+def _mib(n: int) -> str:
+    return f"{n / (1024 * 1024):.1f}M"
+
+
+def format_report(label: str, report: dict, root=None) -> list[str]:
+    peaks = ", ".join(f"{name} {_mib(size)}" for name, size in report["peaks"].items())
+    lines = [f"{label}  traced peak: {peaks}"]
+    for s in report["top"]:
+        site = s["site"]
+        if root is not None and site.startswith(str(root)):
+            site = site[len(str(root)) + 1:]
+        lines.append(f"  {_mib(s['bytes']):>8} {s['count']:>10,} blocks  {site}")
+    return lines
@@ -0,0 +1,33 @@
+"""Optional third-party libraries, imported on first use.
+
+A few days have a NumPy fast path for inputs far larger than the puzzle's.
+NumPy is not a requirement of the repository, so those days ask for it here
+and fall back to pure Python when it is missing; nothing is imported until a
+fast path actually wants it, which keeps it out of every part's load time.
+
+Set ``AOC_PURE=1`` to ignore installed libraries and always take the pure
+Python path (useful to check that both paths agree).
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from functools import cache
+
+PURE_VAR = "AOC_PURE"
+
+
+@cache
+def load(name: str):
+    """The module ``name``, or None when it is not installed or disabled."""
+    if os.environ.get(PURE_VAR):
+        return None
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def numpy():
+    return load("numpy")
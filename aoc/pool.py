@@ -0,0 +1,119 @@
+"""Fan parts out over a process pool, slowest first, with a per-part time limit."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+from aoc import runner
+
+HISTORY_PATH = runner.ROOT / ".aoc" / "history.json"
+
+
+class PartTimeout(BaseException):
+    """Raised when a part runs past its time limit.
+
+    Derives from ``BaseException`` so the ``except Exception`` blocks inside
+    some solutions cannot swallow it.
+    """
+
+
+@contextmanager
+def time_limit(seconds: float | None):
+    """Raise :class:`PartTimeout` in the calling thread after ``seconds``.
+
+    Uses ``SIGALRM``, so the limit only applies on platforms that have it and
+    only from the main thread; elsewhere the block simply runs to completion.
+    """
+    if not seconds or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise PartTimeout(f"exceeded {seconds:g}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def load_history() -> dict[str, float]:
+    """Last known wall time per part label, empty if nothing was recorded yet."""
+    try:
+        return json.loads(HISTORY_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(history: dict[str, float], results) -> None:
+    """Fold ``results`` into ``history`` and write it back to disk."""
+    for r in results:
+        if r.timed:
+            history[r.part.label] = r.parse.wall + r.solve.wall
+        elif r.error and r.error.startswith(PartTimeout.__name__):
+            # Keep timed-out parts at the front of the queue next time
+            history[r.part.label] = float("inf")
+    HISTORY_PATH.parent.mkdir(exist_ok=True)
+    HISTORY_PATH.write_text(json.dumps(history, indent=1, sort_keys=True))
+
+
+def longest_first(parts, history: dict[str, float]):
+    """Order parts by recorded runtime, unknown parts first since they may be slow."""
+    return sorted(parts, key=lambda p: -history.get(p.label, float("inf")))
+
+
+def run_one(part, timeout: float | None = None, text: str | None = None, cache=None,
+            stats: bool = False, profile=None, memory: bool = False, memory_top: int = 10):
+    """Run a single part under ``timeout``, reporting an overrun as an error."""
+    try:
+        with time_limit(timeout):
+            return runner.run_part(part, text, cache, stats, profile, memory, memory_top)
+    except PartTimeout as e:
+        return runner.Result(part, error=f"{PartTimeout.__name__}: {e}")
+
+
+def profile_path(directory, part):
+    """Where ``part``'s cProfile stats go under ``directory`` (None when not profiling)."""
+    if directory is None:
+        return None
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{part.label.replace('/', '-')}.prof"
+
+
+def run_parallel(parts, jobs: int | None = None, timeout: float | None = None,
+                 history: dict[str, float] | None = None, on_result=None, cache=None,
+                 stats: bool = False, profile_dir=None, memory: bool = False, memory_top: int = 10,
+                 text: str | None = None):
+    """Run ``parts`` across ``jobs`` worker processes and return results in input order.
+
+    Work is submitted longest-first according to ``history`` so the slowest
+    parts start immediately and the short ones fill in around them.
+    """
+    order = longest_first(parts, history or {})
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = {
+            pool.submit(
+                run_one, part, timeout, text, cache, stats, profile_path(profile_dir, part), memory,
+                memory_top,
+            ): part
+            for part in order
+        }
+        for future in as_completed(futures):
+            part = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                result = runner.Result(part, error=f"worker died: {e}")
+            results[part] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[part] for part in parts]
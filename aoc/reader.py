@@ -0,0 +1,94 @@
+"""Lazy readers for puzzle input, over text or a memory-mapped file.
+
+Every reader takes a *source*: the ``str`` the runner hands to ``parse``, or
+``bytes``/an ``mmap`` from :func:`mapped`.  Nothing is split up front; lines,
+numbers and blank-line separated records are produced one at a time, so a
+day that consumes them as a stream holds one line at a time instead of the
+whole input plus a list of every line.  On a mapped file the integer readers
+parse straight from the buffer without decoding to ``str`` first.
+
+    with reader.mapped(path) as buf:
+        total = sum(reader.ints(buf))
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from contextlib import contextmanager
+
+_INT = re.compile(r"-?\d+")
+_INT_BYTES = re.compile(rb"-?\d+")
+
+
+@contextmanager
+def mapped(path):
+    """Map ``path`` read-only; an empty file gives ``b""`` (mmap rejects those)."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+        try:
+            yield buf
+        finally:
+            buf.close()
+
+
+def _raw_lines(source):
+    """Each line of ``source`` without its newline, in the source's own type."""
+    nl = "\n" if isinstance(source, str) else b"\n"
+    start, end = 0, len(source)
+    while start < end:
+        stop = source.find(nl, start)
+        if stop == -1:
+            stop = end
+        yield source[start:stop]
+        start = stop + 1
+
+
+def lines(source, skip_blank: bool = True):
+    """Stripped lines as ``str``; blank lines are dropped unless ``skip_blank`` is off."""
+    decode = not isinstance(source, str)
+    for line in _raw_lines(source):
+        if decode:
+            line = line.decode()
+        line = line.strip()
+        if line or not skip_blank:
+            yield line
+
+
+def ints(source):
+    """Every integer in ``source``, in order; a ``-`` directly before digits is a sign."""
+    pattern = _INT if isinstance(source, str) else _INT_BYTES
+    for m in pattern.finditer(source):
+        yield int(m.group())
+
+
+def int_lines(source):
+    """The integers on each non-blank line, one list per line."""
+    pattern = _INT if isinstance(source, str) else _INT_BYTES
+    for line in _raw_lines(source):
+        found = pattern.findall(line)
+        if found:
+            yield [int(x) for x in found]
+
+
+def records(source):
+    """Groups of non-blank lines separated by one or more blank lines."""
+    record = []
+    for line in lines(source, skip_blank=False):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def int_records(source):
+    """The integers in each blank-line separated record, one list per record."""
+    for record in records(source):
+        yield [int(x) for line in record for x in _INT.findall(line)]
@@ -0,0 +1,289 @@
+"""Load part modules into the current interpreter and time them phase by phase."""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import instrument
+from aoc.memory import tracking
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Folder holding each year's days, keyed by two-digit year
+YEAR_DIRS = {24: "AOC 24", 25: "AOC 25"}
+
+# File names a part may live in; 2024 uses solutionN.py, 2025 mostly QN.py
+PART_FILES = {
+    1: ("solution1.py", "Q1.py"),
+    2: ("solution2.py", "Q2.py"),
+}
+
+
+@dataclass(frozen=True)
+class Part:
+    """One part of one day: where its code lives and which input it reads."""
+
+    year: int
+    day: int
+    part: int
+    path: Path
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}/{self.day:02d}/{self.part}"
+
+    def input_path(self) -> Path | None:
+        """Return the puzzle input, preferring ``inputN.txt`` over ``input.txt``."""
+        names = {p.name.lower(): p for p in self.path.parent.iterdir()}
+        for name in (f"input{self.part}.txt", "input.txt"):
+            if name in names:
+                return names[name]
+        return None
+
+
+@dataclass
+class Phase:
+    """Cost of one phase: wall and CPU seconds, peak RSS in bytes and the
+    number of memory blocks the phase left allocated."""
+
+    wall: float
+    cpu: float
+    peak_rss: int | None
+    blocks: int = 0
+
+
+@dataclass
+class Result:
+    part: Part
+    answer: object = None
+    parse: Phase | None = None
+    solve: Phase | None = None
+    error: str | None = None
+    skipped: str | None = None
+    cached: bool = False
+    # instrument.snapshot() for the run, when stats were requested
+    stats: dict | None = None
+    # memory.Tracker.report() for the run, when memory tracing was requested
+    memory: dict | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.skipped is None
+
+    @property
+    def timed(self) -> bool:
+        """True when the part actually ran, so its phases hold real timings."""
+        return self.ok and not self.cached
+
+
+def find_parts(year: int, days=None, parts=None) -> list[Part]:
+    """Return every part file for ``year``, optionally filtered by day and part."""
+    base = ROOT / YEAR_DIRS[year]
+    found = []
+    for day_dir in sorted(base.iterdir()):
+        m = re.fullmatch(r"Day-(\d+)", day_dir.name)
+        if not m or not day_dir.is_dir():
+            continue
+        day = int(m.group(1))
+        if days is not None and day not in days:
+            continue
+        for part, names in PART_FILES.items():
+            if parts is not None and part not in parts:
+                continue
+            for name in names:
+                if (day_dir / name).exists():
+                    found.append(Part(year, day, part, day_dir / name))
+                    break
+    return found
+
+
+def part_for(path) -> Part:
+    """The :class:`Part` a part file belongs to, from its year and day folders."""
+    path = Path(path).resolve()
+    m = re.fullmatch(r"Day-(\d+)", path.parent.name)
+    years = {name: year for year, name in YEAR_DIRS.items()}
+    parts = [p for p, names in PART_FILES.items() if path.name in names]
+    if not m or path.parent.parent.name not in years or not parts:
+        raise ValueError(f"{path} is not a part file")
+    return Part(years[path.parent.parent.name], int(m.group(1)), parts[0], path)
+
+
+def load(part: Part):
+    """Import a part file under a unique module name and return the module."""
+    name = f"aoc{part.year}_day{part.day:02d}_part{part.part}"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, part.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def _reset_peak_rss() -> None:
+    # Writing 5 to clear_refs resets VmHWM so each phase reports its own peak
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss() -> int | None:
+    """Peak resident set size in bytes, or None where it cannot be read."""
+    try:
+        with open("/proc/self/status") as f:
+            m = re.search(r"VmHWM:\s+(\d+) kB", f.read())
+        if m:
+            return int(m.group(1)) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure(fn, *args):
+    """Call ``fn(*args)`` and return its value together with a :class:`Phase`."""
+    _reset_peak_rss()
+    blocks = sys.getallocatedblocks()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    value = fn(*args)
+    phase = Phase(
+        wall=time.perf_counter() - wall,
+        cpu=time.process_time() - cpu,
+        peak_rss=peak_rss(),
+        blocks=sys.getallocatedblocks() - blocks,
+    )
+    return value, phase
+
+
+def _traced(tracker, name):
+    return tracker.phase(name) if tracker is not None else nullcontext()
+
+
+def run_part(part: Part, text: str | None = None, cache=None, stats: bool = False,
+             profile=None, memory: bool = False, memory_top: int = 10) -> Result:
+    """Parse and solve one part, timing each phase; errors are captured, not raised.
+
+    With a ``cache`` (see :mod:`aoc.cache`) a stored answer is returned
+    without importing the part at all, and fresh answers are saved to it.
+    ``stats`` turns on :mod:`aoc.instrument` for the run and keeps what it
+    recorded on the result; ``profile`` is a path to write ``cProfile``
+    stats for the solve phase to.  ``memory`` traces allocations with
+    :mod:`aoc.memory`, which slows the part down considerably, and keeps the
+    ``memory_top`` largest allocation sites.
+    """
+    result = Result(part)
+    try:
+        if text is None:
+            path = part.input_path()
+            text = None if path is None else path.read_text()
+        if cache is not None and text is not None:
+            answer = cache.lookup(part, text)
+            if answer is not cache.MISS:
+                result.answer, result.cached = answer, True
+                return result
+        module = load(part)
+        if not hasattr(module, "parse") or not hasattr(module, "solve"):
+            result.skipped = "no parse/solve"
+            return result
+        if text is None:
+            result.error = "no input file"
+            return result
+        if stats:
+            instrument.reset()
+            instrument.enable()
+        try:
+            with tracking() if memory else nullcontext() as tracker:
+                with _traced(tracker, "parse"):
+                    parsed, result.parse = measure(module.parse, text)
+                with _traced(tracker, "solve"), \
+                        instrument.profiled(profile) if profile else nullcontext():
+                    result.answer, result.solve = measure(module.solve, parsed)
+                if tracker is not None:
+                    result.memory = tracker.report(memory_top)
+        finally:
+            if stats:
+                instrument.enable(False)
+                result.stats = instrument.snapshot()
+        if cache is not None:
+            cache.save(part, text, result.answer)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run(parts, on_result=None) -> list[Result]:
+    """Run ``parts`` one after another, calling ``on_result`` as each finishes."""
+    results = []
+    for part in parts:
+        result = run_part(part)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def _seconds(value: float) -> str:
+    if value < 1:
+        return f"{value * 1000:.1f}ms"
+    return f"{value:.2f}s"
+
+
+def _bytes(value: int | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value / (1024 * 1024):.1f}M"
+
+
+HEADER = (
+    f"{'part':<9} {'answer':>20}  "
+    f"{'parse wall':>10} {'cpu':>9} {'rss':>7}  "
+    f"{'solve wall':>10} {'cpu':>9} {'rss':>7}"
+)
+
+
+def format_row(result: Result) -> str:
+    if result.skipped is not None:
+        return f"{result.part.label:<9} -- skipped: {result.skipped}"
+    if result.error is not None:
+        return f"{result.part.label:<9} !! {result.error}"
+    answer = str(result.answer)
+    if len(answer) > 20:
+        answer = answer[:17] + "..."
+    if result.cached:
+        return f"{result.part.label:<9} {answer:>20}  (cached)"
+    p, s = result.parse, result.solve
+    return (
+        f"{result.part.label:<9} {answer:>20}  "
+        f"{_seconds(p.wall):>10} {_seconds(p.cpu):>9} {_bytes(p.peak_rss):>7}  "
+        f"{_seconds(s.wall):>10} {_seconds(s.cpu):>9} {_bytes(s.peak_rss):>7}"
+    )
+
+
+def format_total(results: list[Result]) -> str:
+    ok = [r for r in results if r.ok]
+    ran = [r for r in results if r.skipped is None]
+    timed = [r for r in ok if r.timed]
+    wall = sum(r.parse.wall + r.solve.wall for r in timed)
+    cpu = sum(r.parse.cpu + r.solve.cpu for r in timed)
+    line = f"{len(ok)}/{len(ran)} parts solved in {_seconds(wall)} wall, {_seconds(cpu)} cpu"
+    if len(timed) < len(ok):
+        line += f" ({len(ok) - len(timed)} from cache)"
+    return line
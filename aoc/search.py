@@ -0,0 +1,191 @@
+"""Shortest paths over integer states.
+
+A state is a single non-negative int below ``size``: a flat grid index, or
+``index * 4 + facing`` when direction matters (see :func:`pack`).  Distances
+live in an ``array('i')`` with :data:`UNREACHED` for states never reached, so
+a search over a large maze costs four bytes per state rather than a dict
+entry per visited tuple.
+
+:func:`shortest_paths` picks the algorithm from the edge weights the caller
+declares it can produce:
+
+* one positive weight: breadth-first search;
+* weights 0 and 1 only: 0-1 BFS on a deque;
+* small non-negative integers: Dial's algorithm (a ring of buckets);
+* anything else, or no declaration: Dijkstra on a binary heap.
+
+``edges(state)`` yields ``(next_state, weight)`` pairs and must only yield
+weights from the declared set.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+
+from aoc import instrument
+
+UNREACHED = -1
+
+# Largest edge weight handed to Dial's algorithm; above it the bucket ring
+# costs more to sweep than a heap costs to maintain
+DIAL_LIMIT = 1 << 12
+
+
+def pack(index: int, facing: int) -> int:
+    return index * 4 + facing
+
+
+def unpack(state: int) -> tuple[int, int]:
+    return divmod(state, 4)
+
+
+def _distances(size: int, sources) -> tuple[array, list[int]]:
+    dist = array("i", [UNREACHED]) * size
+    start = []
+    for s in sources:
+        if dist[s] == UNREACHED:
+            dist[s] = 0
+            start.append(s)
+    return dist, start
+
+
+def _record(name: str, pushes: int, done: bytearray) -> None:
+    if instrument.enabled:
+        instrument.add(f"{name} searches")
+        instrument.add(f"{name} pushes", pushes)
+        instrument.add(f"{name} settled", done.count(1))
+
+
+def bfs(size: int, sources, edges, targets=(), weight: int = 1) -> array:
+    """Breadth-first search for graphs whose edges all weigh ``weight``."""
+    dist, frontier = _distances(size, sources)
+    cost = 0
+    while frontier:
+        if targets and any(s in targets for s in frontier):
+            break
+        cost += weight
+        nxt = []
+        for s in frontier:
+            for t, _ in edges(s):
+                if dist[t] == UNREACHED:
+                    dist[t] = cost
+                    nxt.append(t)
+        frontier = nxt
+    if instrument.enabled:
+        instrument.add("bfs searches")
+        instrument.add("bfs reached", size - dist.count(UNREACHED))
+    return dist
+
+
+def zero_one_bfs(size: int, sources, edges, targets=()) -> array:
+    """Shortest paths when every edge weighs 0 or 1."""
+    dist, start = _distances(size, sources)
+    done = bytearray(size)
+    queue = deque(start)
+    pushes = len(start)
+    while queue:
+        s = queue.popleft()
+        if done[s]:
+            continue
+        done[s] = 1
+        if s in targets:
+            break
+        d = dist[s]
+        for t, w in edges(s):
+            nd = d + w
+            if dist[t] == UNREACHED or nd < dist[t]:
+                dist[t] = nd
+                pushes += 1
+                if w:
+                    queue.append(t)
+                else:
+                    queue.appendleft(t)
+    _record("zero_one_bfs", pushes, done)
+    return dist
+
+
+def dial(size: int, sources, edges, max_weight: int, targets=()) -> array:
+    """Dijkstra with a ring of ``max_weight + 1`` buckets instead of a heap."""
+    dist, start = _distances(size, sources)
+    done = bytearray(size)
+    ring = max_weight + 1
+    buckets = [[] for _ in range(ring)]
+    buckets[0].extend(start)
+    pending = pushes = len(start)
+    cost = 0
+    while pending:
+        bucket = buckets[cost % ring]
+        while bucket:
+            s = bucket.pop()
+            pending -= 1
+            if done[s] or dist[s] != cost:
+                continue
+            done[s] = 1
+            if s in targets:
+                _record("dial", pushes, done)
+                return dist
+            for t, w in edges(s):
+                nd = cost + w
+                if dist[t] == UNREACHED or nd < dist[t]:
+                    dist[t] = nd
+                    buckets[nd % ring].append(t)
+                    pending += 1
+                    pushes += 1
+        cost += 1
+    _record("dial", pushes, done)
+    return dist
+
+
+def dijkstra(size: int, sources, edges, targets=()) -> array:
+    """Binary-heap Dijkstra for arbitrary non-negative weights."""
+    dist, start = _distances(size, sources)
+    done = bytearray(size)
+    heap = [(0, s) for s in start]
+    pushes = len(heap)
+    while heap:
+        d, s = heappop(heap)
+        if done[s]:
+            continue
+        done[s] = 1
+        if s in targets:
+            break
+        for t, w in edges(s):
+            nd = d + w
+            if dist[t] == UNREACHED or nd < dist[t]:
+                dist[t] = nd
+                heappush(heap, (nd, t))
+                pushes += 1
+    _record("dijkstra", pushes, done)
+    return dist
+
+
+def choose(weights=None):
+    """The search function suited to edges drawn from ``weights``.
+
+    Returns ``(function, extra keyword arguments)``.
+    """
+    if not weights:
+        return dijkstra, {}
+    weights = set(weights)
+    if min(weights) < 0:
+        raise ValueError(f"negative edge weight in {sorted(weights)}")
+    if len(weights) == 1 and min(weights) > 0:
+        return bfs, {"weight": weights.pop()}
+    if weights <= {0, 1}:
+        return zero_one_bfs, {}
+    if all(isinstance(w, int) for w in weights) and max(weights) <= DIAL_LIMIT:
+        return dial, {"max_weight": max(weights)}
+    return dijkstra, {}
+
+
+def shortest_paths(size: int, sources, edges, weights=None, targets=()) -> array:
+    """Distances from ``sources`` to every state below ``size``.
+
+    With ``targets`` the search stops as soon as the nearest of them is
+    settled; its distance is final, but states further away may be
+    missing or not yet minimal.
+    """
+    search, extra = choose(weights)
+    return search(size, sources, edges, targets=targets, **extra)
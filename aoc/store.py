@@ -0,0 +1,139 @@
+"""Local timing database: one JSON line per measured run of a part.
+
+Rows are keyed by year/day/part plus the SHA-256 of the input text and of the
+part's source file, so a rewrite of a solution shows up as a new source hash
+against the same input.  The store is append-only; the baseline for a part is
+the median of the latest runs of the most recently recorded source on the same
+input, so one lucky or noisy run does not move it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import re
+import statistics
+import time
+
+from aoc import runner
+
+STORE_PATH = runner.ROOT / ".aoc" / "baseline.jsonl"
+
+
+def sha256(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _aoc_imports(source: str) -> set[str]:
+    """Names of the ``aoc`` modules a source file imports directly."""
+    names = set(re.findall(r"^\s*(?:from|import)\s+aoc\.(\w+)", source, re.M))
+    for group in re.findall(r"^\s*from\s+aoc\s+import\s+\(?([\w ,]+)", source, re.M):
+        names.update(n.split(" as ")[0].strip() for n in group.split(","))
+    return names
+
+
+def source_hash(part) -> str:
+    """Hash of the part file together with every ``aoc`` module it reaches.
+
+    Imports are followed transitively, so a change to a module that a shared
+    module imports (``aoc.instrument`` under ``aoc.search``, say) counts too.
+    """
+    source = part.path.read_bytes()
+    digest = hashlib.sha256(source)
+    sources = {}
+    pending = _aoc_imports(source.decode(errors="replace"))
+    while pending:
+        name = pending.pop()
+        module = runner.ROOT / "aoc" / f"{name}.py"
+        if name in sources or not module.exists():
+            continue
+        sources[name] = module.read_bytes()
+        pending |= _aoc_imports(sources[name].decode(errors="replace"))
+    for name in sorted(sources):
+        digest.update(sources[name])
+    return digest.hexdigest()
+
+
+def row(result, text: str | None = None) -> dict:
+    """Flatten a successful :class:`runner.Result` into a store row.
+
+    ``text`` is the input the part was run on; by default the part's own
+    input file is hashed.
+    """
+    part = result.part
+    if text is None:
+        text = part.input_path().read_text()
+    p, s = result.parse, result.solve
+    rss = [x for x in (p.peak_rss, s.peak_rss) if x is not None]
+    return {
+        "when": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "year": part.year,
+        "day": part.day,
+        "part": part.part,
+        "input": sha256(text),
+        "source": source_hash(part),
+        "python": platform.python_version(),
+        "wall": p.wall + s.wall,
+        "cpu": p.cpu + s.cpu,
+        "parse_wall": p.wall,
+        "solve_wall": s.wall,
+        "peak_rss": max(rss) if rss else None,
+        "blocks": p.blocks + s.blocks,
+    }
+
+
+def append(rows, path=STORE_PATH) -> None:
+    if not rows:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for r in rows:
+            f.write(json.dumps(r) + "\n")
+
+
+def load(path=STORE_PATH) -> list[dict]:
+    """Every stored row; unreadable lines (say, from an interrupted write) are skipped."""
+    rows = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return rows
+
+
+def key(r: dict) -> tuple:
+    return r["year"], r["day"], r["part"], r["input"]
+
+
+def baselines(rows, field: str = "wall", recent: int = 5) -> dict[tuple, dict]:
+    """Baseline row for each (year, day, part, input hash).
+
+    Only runs of the source hash recorded last for that key count, and of
+    those the ``recent`` latest; the result is the latest such row with
+    ``field`` replaced by their median.  Rows without a value for ``field``
+    are ignored, as are ``--memory`` rows written by older versions (marked by
+    a ``traced_peak``), whose timings include tracing overhead.
+    """
+    runs: dict[tuple, list[dict]] = {}
+    for r in rows:
+        if r.get(field) is not None and r.get("traced_peak") is None:
+            runs.setdefault(key(r), []).append(r)
+    base = {}
+    for k, rs in runs.items():
+        latest = rs[-1]
+        same = [r[field] for r in rs if r.get("source") == latest.get("source")]
+        base[k] = {**latest, field: statistics.median(same[-recent:])}
+    return base
+
+
+def slowdown(current: dict, base: dict, field: str = "wall") -> float:
+    """Percentage by which ``current`` exceeds ``base`` in ``field`` (negative when lower)."""
+    return (current[field] - base[field]) / base[field] * 100 if base[field] else 0.0